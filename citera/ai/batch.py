@@ -0,0 +1,192 @@
+"""Pack several project contexts into one metadata request."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ..core.validation import metadata_schema, validate_ai_payload
+from .client import GeminiClient, LLMClient
+from .heuristics import HeuristicClient, HybridClient
+from .prompts import BATCH_USER_PROMPT_TEMPLATE, SYSTEM_PROMPT, build_batch_prompts
+from .routing import RoutedClient
+
+# Prompt tokens per request, including the shared system prompt and instructions.
+DEFAULT_BATCH_TOKENS = 12000
+# Caps the answer size too: each entry costs roughly 150 completion tokens.
+MAX_BATCH_PROJECTS = 8
+RETRY_ROUNDS = 1
+DEFAULT_BATCH_WORKERS = 4
+
+
+@dataclass
+class BatchResult:
+    metadata: dict[str, dict] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+
+
+def estimate_tokens(value: object) -> int:
+    """Rough token count (~4 characters per token) of a prompt fragment."""
+    text = value if isinstance(value, str) else json.dumps(value, separators=(",", ":"))
+    return len(text) // 4 + 1
+
+
+def pack_contexts(
+    contexts: dict[str, dict],
+    budget: int = DEFAULT_BATCH_TOKENS,
+    max_projects: int = MAX_BATCH_PROJECTS,
+) -> list[list[str]]:
+    """Group keys first-fit, largest first, so each group's prompt fits `budget`.
+
+    A context too large for any group still gets a request of its own.
+    """
+    overhead = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(BATCH_USER_PROMPT_TEMPLATE)
+    room = max(1, budget - overhead)
+    sizes = {key: estimate_tokens(context) for key, context in contexts.items()}
+    batches: list[list[str]] = []
+    used: list[int] = []
+    for key in sorted(sizes, key=lambda item: (-sizes[item], item)):
+        for position, batch in enumerate(batches):
+            if len(batch) < max_projects and used[position] + sizes[key] <= room:
+                batch.append(key)
+                used[position] += sizes[key]
+                break
+        else:
+            batches.append([key])
+            used.append(sizes[key])
+    return batches
+
+
+def batch_schema(keys: list[str], closed: bool = True) -> dict:
+    """Schema for a `projects` array of metadata entries, one per key."""
+    entry = metadata_schema(closed=closed)
+    entry["properties"] = {"key": {"type": "string", "enum": list(keys)}, **entry["properties"]}
+    entry["required"] = ["key", *entry["required"]]
+    schema: dict = {
+        "type": "object",
+        "properties": {"projects": {"type": "array", "items": entry}},
+        "required": ["projects"],
+    }
+    if closed:
+        schema["additionalProperties"] = False
+    return schema
+
+
+def generate_batch(
+    client: LLMClient,
+    contexts: dict[str, dict],
+    budget: int = DEFAULT_BATCH_TOKENS,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+) -> BatchResult:
+    """Generate validated metadata for every context, packing them into few requests.
+
+    Each returned entry is validated on its own; entries that are missing or
+    invalid are packed again and re-requested, up to `RETRY_ROUNDS` times.
+    Hybrid clients answer confident projects from heuristics first, and a
+    routing chain hands each tier only what the previous tiers failed.
+    """
+    result = BatchResult()
+    _generate(client, dict(contexts), budget, max_workers, RETRY_ROUNDS, result)
+    return result
+
+
+def _generate(
+    client: LLMClient,
+    pending: dict[str, dict],
+    budget: int,
+    max_workers: int,
+    rounds: int,
+    result: BatchResult,
+) -> None:
+    if isinstance(client, HybridClient):
+        heuristics = client.heuristics or HeuristicClient()
+        for key in list(pending):
+            payload, confidence = heuristics.analyze(pending[key])
+            validated = validate_ai_payload(payload) if confidence >= client.threshold else None
+            if validated:
+                result.metadata[key] = validated
+                del pending[key]
+        _generate(client.fallback, pending, budget, max_workers, rounds, result)
+        return
+    if isinstance(client, RoutedClient):
+        for position, (_, tier_client) in enumerate(client.tiers):
+            if not pending:
+                break
+            # As with single requests, only the last tier retries its own failures.
+            last = position == len(client.tiers) - 1
+            result.failures.clear()
+            _generate(tier_client, pending, budget, max_workers, rounds if last else 0, result)
+            pending = {key: pending[key] for key in result.failures}
+        return
+    if not hasattr(client, "complete_json"):
+        # Offline clients have no per-request overhead worth packing.
+        for key, context in pending.items():
+            _store(result, key, _safe_generate(client, context))
+        return
+
+    for _ in range(rounds + 1):
+        if not pending:
+            return
+        batches = pack_contexts(pending, budget)
+        result.requests += len(batches)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            answers = list(
+                executor.map(lambda keys: _request_batch(client, keys, pending), batches)
+            )
+        failed: dict[str, dict] = {}
+        for keys, (entries, error) in zip(batches, answers):
+            for key in keys:
+                outcome = entries.get(key) if error is None else error
+                if not _store(result, key, outcome):
+                    failed[key] = pending[key]
+        pending = failed
+
+
+def _request_batch(
+    client: LLMClient, keys: list[str], contexts: dict[str, dict]
+) -> tuple[dict[str, object], str | None]:
+    """Send one packed request; returns entries by key, or an error for the whole batch."""
+    # Short positional keys keep the prompt small and are easy for models to copy.
+    aliases = {f"p{position + 1}": key for position, key in enumerate(keys)}
+    system_prompt, user_prompt = build_batch_prompts(
+        {alias: contexts[key] for alias, key in aliases.items()}
+    )
+    # Gemini's response schema does not accept additionalProperties.
+    schema = batch_schema(list(aliases), closed=not isinstance(client, GeminiClient))
+    try:
+        payload = client.complete_json(
+            system_prompt, user_prompt, schema, "project_metadata_batch"
+        )
+    except Exception as exc:
+        return {}, str(exc)
+    entries = payload.get("projects") if isinstance(payload, dict) else payload
+    found: dict[str, object] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if isinstance(entry, dict) and entry.get("key") in aliases:
+            found[aliases[entry["key"]]] = {k: v for k, v in entry.items() if k != "key"}
+    return found, None
+
+
+def _safe_generate(client: LLMClient, context: dict) -> object:
+    try:
+        return client.generate_metadata(context)
+    except Exception as exc:
+        return str(exc)
+
+
+def _store(result: BatchResult, key: str, outcome: object) -> bool:
+    """Record a validated entry, or why it failed; True when it validated."""
+    if isinstance(outcome, str):
+        result.failures[key] = outcome
+        return False
+    validated = validate_ai_payload(outcome) if isinstance(outcome, dict) else None
+    if validated is None:
+        result.failures[key] = (
+            "missing from the response" if outcome is None else "response failed validation"
+        )
+        return False
+    result.metadata[key] = validated
+    result.failures.pop(key, None)
+    return True
@@ -5,8 +5,21 @@ from __future__ import annotations
 import sys
 
 import json
+import time
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Callable, Protocol
+
+from ..core.validation import metadata_schema
+from .limiter import is_rate_limit_error, provider_limiter
+from .usage import record_throttle, record_usage
+
+
+class InvalidResponseError(RuntimeError):
+    """The provider answered, but not with usable metadata JSON."""
+
+
+class RequestTimeoutError(RuntimeError):
+    """The provider did not answer within the client's timeout."""
 
 
 class LLMClient(Protocol):
@@ -39,30 +52,61 @@ class OpenAIClient:
     api_key: str
     model: str = "gpt-4o-mini"
     max_retries: int = 1
+    timeout: float | None = None
+    retry_invalid: bool = True
+    structured_output: bool = True
+    # OpenAI-compatible endpoint (a local server or mock) instead of api.openai.com.
+    base_url: str | None = None
 
     def generate_metadata(self, context: dict) -> dict:
         from .prompts import build_prompts
 
         system_prompt, user_prompt = build_prompts(context)
+        return self.complete_json(system_prompt, user_prompt, metadata_schema(), "project_metadata")
+
+    def complete_json(self, system_prompt: str, user_prompt: str, schema: dict, name: str) -> dict:
+        """Request a JSON object; structured output makes the model follow `schema`."""
         try:
             from openai import OpenAI
         except ImportError as exc:
             raise RuntimeError("Missing openai package. Install with: pip install openai") from exc
 
+        options: dict = {}
+        if self.structured_output:
+            options["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": name, "strict": True, "schema": schema},
+            }
+
+        # Passing timeout=None would disable the SDK's default timeout.
+        sdk_options: dict = {} if self.timeout is None else {"timeout": self.timeout}
+        if self.timeout is not None or self.max_retries == 0:
+            # The SDK's own backoff on 429/5xx would overrun a tier's latency budget
+            # (or hide failures when retries are off); otherwise keep it.
+            sdk_options["max_retries"] = 0
+
         def _request() -> dict:
-            client = OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
+            client = OpenAI(api_key=self.api_key, base_url=self.base_url, **sdk_options)
+            response = _metered_call(
+                "openai",
+                self.model,
+                lambda: client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.2,
+                    **options,
+                ),
+                _openai_usage,
             )
-            content = response.choices[0].message.content or ""
-            return _parse_json_payload(content)
+            message = response.choices[0].message
+            if getattr(message, "refusal", None):
+                raise InvalidResponseError(f"Model refused the request: {message.refusal}")
+            return _parse_json_payload(message.content or "")
 
-        return _retry_request(_request, self.max_retries, "OpenAI")
+        return _retry_request(_request, self.max_retries, "OpenAI", self.retry_invalid)
 
 
 @dataclass
@@ -72,29 +116,100 @@ class GeminiClient:
     api_key: str
     model: str = "gemini-1.5-flash"
     max_retries: int = 1
+    timeout: float | None = None
+    retry_invalid: bool = True
+    structured_output: bool = True
 
     def generate_metadata(self, context: dict) -> dict:
         from .prompts import build_prompts
 
         system_prompt, user_prompt = build_prompts(context)
+        return self.complete_json(
+            system_prompt, user_prompt, metadata_schema(closed=False), "project_metadata"
+        )
+
+    def complete_json(self, system_prompt: str, user_prompt: str, schema: dict, name: str) -> dict:
+        """Request a JSON object; a response schema makes the model follow `schema`."""
         try:
             from google import genai
+            from google.genai import types
         except ImportError as exc:
             raise RuntimeError(
                 "Missing google-genai package. Install with: pip install google-genai"
             ) from exc
 
+        config = None
+        if self.structured_output:
+            config = types.GenerateContentConfig(
+                response_mime_type="application/json", response_schema=schema
+            )
+        http_options = None
+        if self.timeout:
+            # HttpOptions takes the timeout in milliseconds.
+            http_options = types.HttpOptions(timeout=int(self.timeout * 1000))
+
         def _request() -> dict:
-            client = genai.Client(api_key=self.api_key)
+            client = genai.Client(api_key=self.api_key, http_options=http_options)
             prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = client.models.generate_content(
-                model=self.model,
-                contents=prompt,
+            response = _metered_call(
+                "gemini",
+                self.model,
+                lambda: client.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=config,
+                ),
+                _gemini_usage,
             )
             content = _extract_gemini_text(response)
             return _parse_json_payload(content)
 
-        return _retry_request(_request, self.max_retries, "Gemini")
+        return _retry_request(_request, self.max_retries, "Gemini", self.retry_invalid)
+
+
+def _metered_call(
+    provider: str,
+    model: str,
+    call: Callable[[], object],
+    read_usage: Callable[[object], tuple[int, int]],
+) -> object:
+    """Run one request under the provider's adaptive limiter and record its token usage."""
+    try:
+        with provider_limiter(provider).slot():
+            started = time.monotonic()
+            response = call()
+            latency = time.monotonic() - started
+    except Exception as exc:
+        if is_rate_limit_error(exc):
+            _record(record_throttle, provider, model)
+        raise
+    prompt_tokens, completion_tokens = read_usage(response)
+    _record(record_usage, provider, model, prompt_tokens, completion_tokens, latency)
+    return response
+
+
+def _record(func, *args) -> None:
+    # Metering must never fail the request it describes.
+    try:
+        func(*args)
+    except OSError as exc:
+        print(f"Failed to record LLM usage: {exc}", file=sys.stderr)
+
+
+def _openai_usage(response: object) -> tuple[int, int]:
+    usage = getattr(response, "usage", None)
+    return (
+        int(getattr(usage, "prompt_tokens", 0) or 0),
+        int(getattr(usage, "completion_tokens", 0) or 0),
+    )
+
+
+def _gemini_usage(response: object) -> tuple[int, int]:
+    usage = getattr(response, "usage_metadata", None)
+    return (
+        int(getattr(usage, "prompt_token_count", 0) or 0),
+        int(getattr(usage, "candidates_token_count", 0) or 0),
+    )
 
 
 def _extract_gemini_text(response: object) -> str:
@@ -115,7 +230,7 @@ def _parse_json_payload(content: str) -> dict:
         snippet = content if len(content) <= 1000 else content[:1000] + "..."
         print("🌐 AI response (truncated):", file=sys.stderr)
         print(snippet, file=sys.stderr)
-        raise RuntimeError("AI response was not valid JSON.") from exc
+        raise InvalidResponseError("AI response was not valid JSON.") from exc
 
 
 def _strip_code_fence(content: str) -> str:
@@ -130,28 +245,90 @@ def _strip_code_fence(content: str) -> str:
     return "\n".join(lines).strip()
 
 
-def _retry_request(func, max_retries: int, label: str) -> dict:
+def _retry_request(func, max_retries: int, label: str, retry_invalid: bool = True) -> dict:
+    """Call `func`, retrying failures; the error type survives so callers can route on it."""
+    routable = (InvalidResponseError, RequestTimeoutError)
     last_error: Exception | None = None
     for _ in range(max_retries + 1):
         try:
             return func()
         except Exception as exc:  # pragma: no cover - network errors are environment-specific
             last_error = exc
-    raise RuntimeError(f"{label} request failed: {last_error}")
+            if _is_timeout(exc):
+                last_error = RequestTimeoutError(str(exc) or "request timed out")
+            if isinstance(last_error, routable) and not retry_invalid:
+                break
+    error_type = type(last_error) if isinstance(last_error, routable) else RuntimeError
+    raise error_type(f"{label} request failed: {last_error}") from last_error
+
+
+def _is_timeout(exc: Exception) -> bool:
+    # SDKs raise their own timeout types (openai.APITimeoutError, httpx.TimeoutException).
+    return isinstance(exc, TimeoutError) or any(
+        "Timeout" in cls.__name__ for cls in type(exc).__mro__
+    )
 
 
 def build_client(config: dict, context: dict) -> LLMClient:
     """Return a configured LLM client based on config."""
+    from .heuristics import DEFAULT_HYBRID_THRESHOLD, HeuristicClient, HybridClient
+    from .routing import build_routed_client
+
     provider = str(config.get("llm", "")).lower()
-    key = str(config.get("llm_key", "")).strip()
+    if provider == "heuristic":
+        return HeuristicClient()
+    chain = str(config.get("llm_chain") or "").strip()
+    if chain:
+        client = build_routed_client(chain, config)
+    else:
+        client = build_provider_client(provider, config)
+    if str(config.get("llm_mode", "")).lower() == "hybrid":
+        try:
+            threshold = float(config.get("llm_threshold") or DEFAULT_HYBRID_THRESHOLD)
+        except ValueError as exc:
+            raise RuntimeError("llm_threshold must be a number between 0 and 1.") from exc
+        return HybridClient(fallback=client, threshold=threshold)
+    return client
+
+
+def build_provider_client(
+    provider: str,
+    config: dict,
+    model: str | None = None,
+    timeout: float | None = None,
+    retry_invalid: bool = True,
+    base_url: str | None = None,
+) -> LLMClient:
+    """Client for one provider; `<provider>_key` overrides the shared llm_key."""
+    key = str(config.get(f"{provider}_key") or config.get("llm_key") or "").strip()
+    structured = str(config.get("llm_structured_output") or "true").lower() != "false"
     if provider == "openai":
+        base_url = base_url or str(config.get("openai_base_url") or "") or None
+        if not key and base_url:
+            # Local OpenAI-compatible servers usually ignore the key.
+            key = "local"
         if not key:
             raise RuntimeError("Missing llm_key for OpenAI.")
-        model = str(config.get("openai_model") or config.get("llm_model") or "gpt-4o-mini")
-        return OpenAIClient(api_key=key, model=model)
+        model = model or str(config.get("openai_model") or config.get("llm_model") or "gpt-4o-mini")
+        return OpenAIClient(
+            api_key=key,
+            model=model,
+            timeout=timeout,
+            retry_invalid=retry_invalid,
+            structured_output=structured,
+            base_url=base_url,
+        )
     if provider == "gemini":
         if not key:
             raise RuntimeError("Missing llm_key for Gemini.")
-        model = str(config.get("gemini_model") or config.get("llm_model") or "gemini-1.5-flash")
-        return GeminiClient(api_key=key, model=model)
+        model = model or str(
+            config.get("gemini_model") or config.get("llm_model") or "gemini-1.5-flash"
+        )
+        return GeminiClient(
+            api_key=key,
+            model=model,
+            timeout=timeout,
+            retry_invalid=retry_invalid,
+            structured_output=structured,
+        )
     return StubLLMClient()
@@ -0,0 +1,228 @@
+"""Replay stored project contexts through AI clients and measure speed and quality."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..config import default_config_path
+from ..core.validation import validate_ai_payload
+from .client import (
+    InvalidResponseError,
+    LLMClient,
+    StubLLMClient,
+    build_client,
+    build_provider_client,
+)
+from .heuristics import HeuristicClient, HybridClient
+from .limiter import AdaptiveLimiter, fixed_limiter, use_limiter
+from .routing import RoutedClient
+from .usage import UsageCapture, capture_usage
+
+CORPUS_DIR = "eval"
+DEFAULT_EVAL_WORKERS = 4
+PERCENTILES = (50, 90, 99)
+
+
+def corpus_dir() -> Path:
+    return default_config_path().parent / CORPUS_DIR
+
+
+def save_context(name: str, context: dict) -> Path:
+    """Store a context under `name`, replacing any earlier capture of it.
+
+    Names that sanitize to the same file name (`a b` and `a-b`) get a file
+    suffixed with a hash of the name instead of overwriting each other.
+    """
+    folder = corpus_dir()
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{_safe_name(name)}.json"
+    if _stored_name(path) not in (None, name):
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        path = folder / f"{_safe_name(name)}-{digest}.json"
+    record = {
+        "name": name,
+        "saved_at": datetime.now(timezone.utc).isoformat(),
+        "context": context,
+    }
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(record), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_corpus() -> dict[str, dict]:
+    """Stored contexts by name."""
+    folder = corpus_dir()
+    if not folder.exists():
+        return {}
+    corpus: dict[str, dict] = {}
+    for path in sorted(folder.glob("*.json")):
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(record, dict) and isinstance(record.get("context"), dict):
+            corpus[str(record.get("name") or path.stem)] = record["context"]
+    return corpus
+
+
+def clear_corpus() -> int:
+    folder = corpus_dir()
+    paths = list(folder.glob("*.json")) if folder.exists() else []
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return len(paths)
+
+
+def build_eval_client(spec: str, config: dict) -> LLMClient:
+    """Client for a target spec.
+
+    `stub`, `heuristic`, `config` (the configured client, chain included), or
+    `provider:model[@base_url]`, where base_url points the OpenAI client at a
+    compatible local or mock server. Retries are off so every failure counts.
+    """
+    if spec == "stub":
+        return StubLLMClient()
+    if spec == "heuristic":
+        return HeuristicClient()
+    if spec == "config":
+        return _without_retries(build_client(config, {}))
+    provider, _, rest = spec.partition(":")
+    model, _, base_url = rest.partition("@")
+    if provider not in ("openai", "gemini") or not model:
+        raise ValueError(f"Unknown eval target: {spec}")
+    if base_url and provider != "openai":
+        raise ValueError("A base URL is only supported for openai targets.")
+    client = build_provider_client(provider, config, model=model, base_url=base_url or None)
+    return _without_retries(client)
+
+
+def _without_retries(client: LLMClient) -> LLMClient:
+    if isinstance(client, HybridClient):
+        _without_retries(client.fallback)
+    elif isinstance(client, RoutedClient):
+        for _, tier_client in client.tiers:
+            _without_retries(tier_client)
+    elif hasattr(client, "max_retries"):
+        client.max_retries = 0
+    return client
+
+
+@dataclass
+class Sample:
+    name: str
+    # Time the provider took to answer (summed over a chain's tiers), excluding
+    # local queueing; wall time for offline clients.
+    latency: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # The provider replied; transport, auth, and timeout failures leave this False.
+    answered: bool = False
+    parsed: bool = False
+    valid: bool = False
+    error: str | None = None
+
+
+@dataclass
+class EvalReport:
+    target: str
+    samples: list[Sample] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.samples)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for sample in self.samples if not sample.answered)
+
+    def rate(self, attribute: str) -> float:
+        """Share of answered requests with `attribute` set (parsed or valid)."""
+        answered = [sample for sample in self.samples if sample.answered]
+        if not answered:
+            return 0.0
+        return sum(1 for sample in answered if getattr(sample, attribute)) / len(answered)
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Nearest-rank percentile of answered requests' latency, in seconds."""
+        latencies = sorted(sample.latency for sample in self.samples if sample.answered)
+        if not latencies:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * len(latencies)))
+        return latencies[rank - 1]
+
+    def mean_tokens(self) -> tuple[float, float]:
+        if not self.samples:
+            return 0.0, 0.0
+        return (
+            sum(sample.prompt_tokens for sample in self.samples) / len(self.samples),
+            sum(sample.completion_tokens for sample in self.samples) / len(self.samples),
+        )
+
+
+def run_eval(
+    target: str,
+    client: LLMClient,
+    corpus: dict[str, dict],
+    max_workers: int = DEFAULT_EVAL_WORKERS,
+) -> EvalReport:
+    """Send every stored context through `client` with exactly `max_workers` in flight.
+
+    The run bypasses the shared adaptive limiter, so `max_workers` is the real
+    concurrency, and keeps its requests out of the usage ledger.
+    """
+    report = EvalReport(target)
+    workers = max(1, max_workers)
+    limiter = fixed_limiter(workers)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        report.samples = list(
+            executor.map(lambda item: _run_one(client, limiter, *item), sorted(corpus.items()))
+        )
+    report.elapsed = time.monotonic() - started
+    return report
+
+
+def _run_one(client: LLMClient, limiter: AdaptiveLimiter, name: str, context: dict) -> Sample:
+    started = time.monotonic()
+    with capture_usage(record=False) as usage, use_limiter(limiter):
+        try:
+            payload = client.generate_metadata(context)
+        except InvalidResponseError as exc:
+            return _sample(name, started, usage, answered=True, error=str(exc))
+        except Exception as exc:
+            return _sample(name, started, usage, error=str(exc))
+    valid = isinstance(payload, dict) and validate_ai_payload(payload) is not None
+    return _sample(name, started, usage, answered=True, parsed=True, valid=valid)
+
+
+def _sample(name: str, started: float, usage: UsageCapture, **fields: object) -> Sample:
+    return Sample(
+        name=name,
+        latency=usage.latency if usage.requests else time.monotonic() - started,
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        **fields,
+    )
+
+
+def _stored_name(path: Path) -> str | None:
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return str(record.get("name") or path.stem) if isinstance(record, dict) else None
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", name).strip("-") or "context"
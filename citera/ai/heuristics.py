@@ -0,0 +1,230 @@
+"""Offline metadata heuristics derived from manifests and file names."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from .client import LLMClient
+
+DEFAULT_HYBRID_THRESHOLD = 0.75
+
+# Dependency -> (tech label, category hint). Category hints are CATEGORY_CHOICES values.
+DEPENDENCY_SIGNALS = {
+    "openai": ("OpenAI", "AI"),
+    "anthropic": ("Anthropic", "AI"),
+    "google-genai": ("Gemini", "AI"),
+    "langchain": ("LangChain", "AI"),
+    "transformers": ("Transformers", "AI"),
+    "torch": ("PyTorch", "AI"),
+    "tensorflow": ("TensorFlow", "AI"),
+    "scikit-learn": ("scikit-learn", "AI"),
+    "llama-index": ("LlamaIndex", "AI"),
+    "@tensorflow/tfjs": ("TensorFlow.js", "AI"),
+    "pygame": ("Pygame", "Games"),
+    "arcade": ("Arcade", "Games"),
+    "bevy": ("Bevy", "Games"),
+    "macroquad": ("Macroquad", "Games"),
+    "phaser": ("Phaser", "Games"),
+    "github.com/hajimehoshi/ebiten": ("Ebiten", "Games"),
+    "flask": ("Flask", "Web"),
+    "django": ("Django", "Web"),
+    "fastapi": ("FastAPI", "Web"),
+    "streamlit": ("Streamlit", "Web"),
+    "react": ("React", "Web"),
+    "vue": ("Vue", "Web"),
+    "svelte": ("Svelte", "Web"),
+    "next": ("Next.js", "Web"),
+    "express": ("Express", "Web"),
+    "actix-web": ("Actix Web", "Web"),
+    "axum": ("Axum", "Web"),
+    "github.com/gin-gonic/gin": ("Gin", "Web"),
+    "click": ("Click", "CLIs"),
+    "typer": ("Typer", "CLIs"),
+    "rich": ("Rich", "CLIs"),
+    "clap": ("clap", "CLIs"),
+    "commander": ("Commander", "CLIs"),
+    "yargs": ("yargs", "CLIs"),
+    "github.com/spf13/cobra": ("Cobra", "CLIs"),
+    "numpy": ("NumPy", None),
+    "pandas": ("pandas", None),
+    "requests": ("Requests", None),
+    "tokio": ("Tokio", None),
+    "serde": ("Serde", None),
+}
+
+MANIFEST_TECH = {
+    "pyproject.toml": "Python",
+    "requirements.txt": "Python",
+    "setup.py": "Python",
+    "setup.cfg": "Python",
+    "package.json": "Node.js",
+    "Cargo.toml": "Rust",
+    "go.mod": "Go",
+    "Dockerfile": "Docker",
+}
+
+ENTRY_POINT_CATEGORY = {
+    "cli.py": "CLIs",
+    "__main__.py": "CLIs",
+    "manage.py": "Web",
+    "app.py": "Web",
+    "index.html": "Web",
+    "server.js": "Web",
+    "game.py": "Games",
+    "project.godot": "Games",
+}
+
+
+@dataclass
+class HeuristicClient:
+    """Derive metadata locally from manifests, file names, and language stats."""
+
+    def generate_metadata(self, context: dict) -> dict:
+        payload, _ = self.analyze(context)
+        return payload
+
+    def analyze(self, context: dict) -> tuple[dict, float]:
+        """Return a metadata payload and a 0..1 confidence score."""
+        manifests = context.get("manifests") or {}
+        files = context.get("files") or []
+        languages = [lang for lang in context.get("languages", []) if lang != "unknown"]
+
+        dependencies: list[str] = []
+        entry_points: list[str] = []
+        for summary in manifests.values():
+            dependencies.extend(summary.get("dependencies", []))
+            entry_points.extend(summary.get("entry_points", []))
+
+        tech: list[str] = []
+        for filename in manifests:
+            _append_unique(tech, MANIFEST_TECH.get(filename))
+        for language in languages:
+            if language not in ("json", "html", "css"):
+                _append_unique(tech, _language_label(language))
+        votes: Counter[str] = Counter()
+        for dependency in dependencies:
+            signal = DEPENDENCY_SIGNALS.get(dependency)
+            if not signal:
+                continue
+            label, category = signal
+            _append_unique(tech, label)
+            if category:
+                votes[category] += 2
+        for path in files:
+            basename = path.rsplit("/", 1)[-1]
+            category = ENTRY_POINT_CATEGORY.get(basename)
+            if category and path.count("/") <= 1:
+                votes[category] += 1
+        if entry_points:
+            votes["CLIs"] += 2
+        elif _looks_like_library(manifests, files):
+            votes["Libraries"] += 2
+
+        category, category_confidence = _pick_category(votes)
+        name, name_confidence = _pick_name(manifests, languages)
+        description, description_confidence = _pick_description(manifests, name, category, tech)
+        tags = _pick_tags(category, tech, languages)
+
+        confidence = (
+            0.35 * category_confidence
+            + 0.25 * name_confidence
+            + 0.25 * description_confidence
+            + (0.15 if tech else 0.0)
+        )
+        payload = {
+            "name": name,
+            "description": description,
+            "tags": tags,
+            "tech": tech,
+            "category": category,
+        }
+        return payload, round(min(confidence, 1.0), 3)
+
+
+@dataclass
+class HybridClient:
+    """Use heuristics when confident, otherwise defer to an LLM client."""
+
+    fallback: LLMClient
+    threshold: float = DEFAULT_HYBRID_THRESHOLD
+    heuristics: HeuristicClient | None = None
+
+    def generate_metadata(self, context: dict) -> dict:
+        heuristics = self.heuristics or HeuristicClient()
+        payload, confidence = heuristics.analyze(context)
+        if confidence >= self.threshold:
+            return payload
+        return self.fallback.generate_metadata(context)
+
+
+def _append_unique(values: list[str], value: str | None) -> None:
+    if value and value not in values:
+        values.append(value)
+
+
+def _language_label(language: str) -> str:
+    special = {"javascript": "JavaScript", "typescript": "TypeScript", "csharp": "C#", "cpp": "C++"}
+    return special.get(language, language.title())
+
+
+def _looks_like_library(manifests: dict, files: list[str]) -> bool:
+    if manifests.get("Cargo.toml", {}).get("lib") or "src/lib.rs" in files:
+        return True
+    if manifests.get("package.json", {}).get("main"):
+        return True
+    python_manifest = any(name in manifests for name in ("pyproject.toml", "setup.py", "setup.cfg"))
+    has_package = any(path.endswith("/__init__.py") and path.count("/") <= 2 for path in files)
+    return python_manifest and has_package
+
+
+def _pick_category(votes: Counter) -> tuple[str, float]:
+    ranked = votes.most_common(2)
+    if not ranked:
+        return "Tools", 0.0
+    best, best_votes = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0
+    margin = (best_votes - runner_up) / best_votes
+    strength = min(best_votes / 4, 1.0)
+    return best, margin * strength
+
+
+def _pick_name(manifests: dict, languages: list[str]) -> tuple[str, float]:
+    for summary in manifests.values():
+        raw = summary.get("name")
+        if isinstance(raw, str) and raw.strip():
+            slug = re.sub(r"[^a-z0-9]+", "-", raw.split("/")[-1].lower()).strip("-")
+            if slug:
+                return slug, 1.0
+    base = languages[0] if languages else "project"
+    return f"{base}-prototype", 0.0
+
+
+def _pick_description(
+    manifests: dict, name: str, category: str, tech: list[str]
+) -> tuple[str, float]:
+    for summary in manifests.values():
+        raw = summary.get("description")
+        if isinstance(raw, str) and len(raw.strip()) >= 12:
+            return raw.strip(), 1.0
+    kind = {
+        "CLIs": "command-line tool",
+        "Libraries": "library",
+        "Web": "web application",
+        "AI": "AI project",
+        "Games": "game",
+    }.get(category, "project")
+    built_with = f" built with {', '.join(tech[:3])}" if tech else ""
+    return f"{name} is a {kind}{built_with}.", 0.3
+
+
+def _pick_tags(category: str, tech: list[str], languages: list[str]) -> list[str]:
+    tags: list[str] = []
+    _append_unique(tags, category.lower())
+    for item in tech + languages:
+        tag = re.sub(r"[^a-z0-9+#.-]+", "-", item.lower()).strip("-")
+        _append_unique(tags, tag)
+        if len(tags) >= 6:
+            break
+    return tags
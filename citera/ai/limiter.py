@@ -0,0 +1,120 @@
+"""Adaptive concurrency limit for provider requests (AIMD)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+DEFAULT_INITIAL_LIMIT = 2.0
+DEFAULT_MAX_LIMIT = 16.0
+# Requests slower than this are treated as a sign the provider is saturating.
+DEFAULT_TARGET_LATENCY = 20.0
+THROTTLE_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+
+
+@dataclass
+class AdaptiveLimiter:
+    """Cap in-flight requests, growing the cap additively and shrinking it on pressure.
+
+    Each success at acceptable latency adds 1/limit, so the cap grows by about
+    one per round of requests. A 429 halves it; a slow response trims it by
+    10%. Only one decrease applies per round: responses to requests started
+    before the last decrease were sent under the old cap and are ignored.
+    """
+
+    initial: float = DEFAULT_INITIAL_LIMIT
+    minimum: float = 1.0
+    maximum: float = DEFAULT_MAX_LIMIT
+    target_latency: float = DEFAULT_TARGET_LATENCY
+    limit: float = field(init=False)
+    in_flight: int = field(default=0, init=False)
+    _last_decrease: float = field(default=0.0, init=False, repr=False)
+    _condition: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.limit = max(self.minimum, min(self.initial, self.maximum))
+
+    def acquire(self) -> float:
+        """Wait for a free slot; returns the start time to pass to `release`."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started: float, throttled: bool = False, failed: bool = False) -> None:
+        latency = time.monotonic() - started
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self._decrease(started, THROTTLE_DECREASE)
+            elif failed:
+                pass
+            elif latency > self.target_latency:
+                self._decrease(started, LATENCY_DECREASE)
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        started = self.acquire()
+        try:
+            yield
+        except BaseException as exc:
+            throttled = is_rate_limit_error(exc)
+            self.release(started, throttled=throttled, failed=not throttled)
+            raise
+        self.release(started)
+
+    def _decrease(self, started: float, factor: float) -> None:
+        if started < self._last_decrease:
+            return
+        self.limit = max(self.minimum, self.limit * factor)
+        self._last_decrease = time.monotonic()
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether a provider SDK exception is a 429 / quota response."""
+    for attribute in ("status_code", "code", "status"):
+        if getattr(exc, attribute, None) in (429, "429", "RESOURCE_EXHAUSTED"):
+            return True
+    return "RESOURCE_EXHAUSTED" in str(exc)
+
+
+_LIMITERS: dict[str, AdaptiveLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+_OVERRIDE: ContextVar[AdaptiveLimiter | None] = ContextVar("citera_limiter", default=None)
+
+
+def provider_limiter(provider: str, maximum: float | None = None) -> AdaptiveLimiter:
+    """Process-wide limiter shared by every client of `provider`."""
+    override = _OVERRIDE.get()
+    if override is not None:
+        return override
+    with _LIMITERS_LOCK:
+        if provider not in _LIMITERS:
+            _LIMITERS[provider] = AdaptiveLimiter(maximum=maximum or DEFAULT_MAX_LIMIT)
+        return _LIMITERS[provider]
+
+
+def fixed_limiter(limit: int) -> AdaptiveLimiter:
+    """A limiter that always allows exactly `limit` requests in flight."""
+    return AdaptiveLimiter(initial=limit, minimum=limit, maximum=limit)
+
+
+@contextmanager
+def use_limiter(limiter: AdaptiveLimiter) -> Iterator[None]:
+    """Route this thread's requests through `limiter` instead of the shared ones."""
+    token = _OVERRIDE.set(limiter)
+    try:
+        yield
+    finally:
+        _OVERRIDE.reset(token)
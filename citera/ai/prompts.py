@@ -8,6 +8,8 @@ SYSTEM_PROMPT = (
     "You are an assistant that generates structured metadata for software projects. "
     "Your output must be valid JSON. Do not guess or hallucinate technologies. "
     "Use file names and code snippets to infer purpose and behavior. "
+    "Weigh the tech stack by language_stats (bytes and file counts per language). "
+    "The tree outline summarizes the whole repository; files is only a sample. "
     "Avoid generic descriptions and avoid mentioning project stage. "
     "Tags must be lowercase. Category must be one of: "
     "Games, CLIs, Libraries, AI, Web, Tools, Other."
@@ -25,7 +27,27 @@ USER_PROMPT_TEMPLATE = (
 )
 
 
+BATCH_USER_PROMPT_TEMPLATE = (
+    "Projects (JSON object of context by key):\n{contexts}\n\n"
+    "For each project, generate:\n"
+    "* project name (kebab-case)\n"
+    "* 1-paragraph description focused on functionality and purpose\n"
+    "* tags (3-6)\n"
+    "* tech stack\n"
+    "* category\n"
+    "Describe each project only from its own context. "
+    "Return JSON only, as an object with a `projects` array holding one entry per project "
+    "with keys: key (copied exactly), name, description, tags, tech, category."
+)
+
+
 def build_prompts(context: dict) -> tuple[str, str]:
     """Create system and user prompts from context."""
     serialized = json.dumps(context, indent=2)
     return SYSTEM_PROMPT, USER_PROMPT_TEMPLATE.format(context=serialized)
+
+
+def build_batch_prompts(contexts: dict[str, dict]) -> tuple[str, str]:
+    """Create prompts for several projects; the system prompt is sent once for all."""
+    serialized = json.dumps(contexts, separators=(",", ":"))
+    return SYSTEM_PROMPT, BATCH_USER_PROMPT_TEMPLATE.format(contexts=serialized)
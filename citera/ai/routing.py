@@ -0,0 +1,99 @@
+"""Tiered model routing: try a cheap fast model first and escalate on bad answers."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+
+from ..core.validation import validate_ai_payload
+from .client import (
+    InvalidResponseError,
+    LLMClient,
+    RequestTimeoutError,
+    build_provider_client,
+)
+
+CHAIN_PROVIDERS = ("openai", "gemini")
+
+
+@dataclass(frozen=True)
+class Tier:
+    provider: str
+    model: str
+    timeout: float | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+def parse_chain(value: str) -> list[Tier]:
+    """Parse `provider:model[@seconds],...`; raises ValueError on malformed tiers."""
+    tiers: list[Tier] = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        spec, _, budget = item.partition("@")
+        provider, _, model = spec.partition(":")
+        provider = provider.strip().lower()
+        if provider not in CHAIN_PROVIDERS or not model.strip():
+            raise ValueError(f"Expected provider:model[@seconds], got: {item}")
+        timeout = None
+        if budget:
+            try:
+                timeout = float(budget)
+            except ValueError:
+                timeout = -1.0
+            if timeout <= 0:
+                raise ValueError(f"Latency budget must be a positive number of seconds: {item}")
+        tiers.append(Tier(provider, model.strip(), timeout))
+    if not tiers:
+        raise ValueError("The chain needs at least one provider:model tier.")
+    return tiers
+
+
+@dataclass
+class RoutedClient:
+    """Ask each tier in order until one returns metadata that passes validation.
+
+    Only unusable answers escalate: unparseable JSON, a payload rejected by
+    `validate_ai_payload`, or no answer within the tier's latency budget.
+    Other errors (auth, quota, network) are raised from the tier that hit them.
+    """
+
+    tiers: list[tuple[Tier, LLMClient]]
+    answered_by: str | None = field(default=None, init=False)
+
+    def generate_metadata(self, context: dict) -> dict:
+        failures: list[str] = []
+        for position, (tier, client) in enumerate(self.tiers):
+            try:
+                payload = client.generate_metadata(context)
+            except (InvalidResponseError, RequestTimeoutError) as exc:
+                failures.append(f"{tier.label}: {exc}")
+            else:
+                validated = validate_ai_payload(payload) if isinstance(payload, dict) else None
+                if validated:
+                    self.answered_by = tier.label
+                    return validated
+                failures.append(f"{tier.label}: response failed validation")
+            if position + 1 < len(self.tiers):
+                print(f"{failures[-1]}; escalating.", file=sys.stderr)
+        raise InvalidResponseError("All model tiers failed: " + "; ".join(failures))
+
+
+def build_routed_client(chain: str, config: dict) -> RoutedClient:
+    try:
+        tiers = parse_chain(chain)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid llm_chain: {exc}") from exc
+    clients: list[tuple[Tier, LLMClient]] = []
+    for position, tier in enumerate(tiers):
+        # Earlier tiers escalate at once instead of retrying a bad answer themselves.
+        last = position == len(tiers) - 1
+        client = build_provider_client(
+            tier.provider, config, model=tier.model, timeout=tier.timeout, retry_invalid=last
+        )
+        clients.append((tier, client))
+    return RoutedClient(clients)
@@ -0,0 +1,173 @@
+"""Local ledger of LLM token usage and estimated cost per provider and model."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+from ..config import default_config_path
+from ..core.locks import file_lock
+
+USAGE_FILE = "llm_usage.json"
+USAGE_LOCK_FILE = "llm_usage.lock"
+USAGE_VERSION = 1
+
+# USD per million (prompt, completion) tokens, matched by longest model prefix.
+# List prices at the time of writing; the report labels totals as estimates.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+_LOCK = threading.Lock()
+
+
+@dataclass
+class UsageCapture:
+    """Requests made in one thread while the capture is active."""
+
+    # (prompt tokens, completion tokens, provider latency in seconds) per request.
+    requests: list[tuple[int, int, float]] = field(default_factory=list)
+    # False keeps the requests out of the ledger (e.g. evaluation runs).
+    record: bool = True
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(prompt for prompt, _, _ in self.requests)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(completion for _, completion, _ in self.requests)
+
+    @property
+    def latency(self) -> float:
+        return sum(latency for _, _, latency in self.requests)
+
+
+_CAPTURE: ContextVar[UsageCapture | None] = ContextVar("citera_usage_capture", default=None)
+
+
+def usage_path() -> Path:
+    return default_config_path().parent / USAGE_FILE
+
+
+def model_price(model: str) -> tuple[float, float] | None:
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float | None:
+    """Estimated USD cost of one request, or None for models without a known price."""
+    price = model_price(model)
+    if price is None:
+        return None
+    return (prompt_tokens * price[0] + completion_tokens * price[1]) / 1_000_000
+
+
+def load_usage() -> dict:
+    path = usage_path()
+    empty = {"version": USAGE_VERSION, "since": None, "providers": {}}
+    if not path.exists():
+        return empty
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != USAGE_VERSION:
+        return empty
+    data.setdefault("providers", {})
+    return data
+
+
+def record_usage(
+    provider: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    latency: float,
+) -> None:
+    """Add one successful request to the running totals."""
+    capture = _CAPTURE.get()
+    if capture is not None:
+        capture.requests.append((int(prompt_tokens), int(completion_tokens), float(latency)))
+        if not capture.record:
+            return
+    with _LOCK, _ledger_lock():
+        data = load_usage()
+        totals = _model_totals(data, provider, model)
+        totals["requests"] += 1
+        totals["prompt_tokens"] += int(prompt_tokens)
+        totals["completion_tokens"] += int(completion_tokens)
+        totals["latency"] += float(latency)
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        if cost is not None:
+            totals["cost"] += cost
+        _save_usage(data)
+
+
+def record_throttle(provider: str, model: str) -> None:
+    """Count a rate-limited (429) response."""
+    capture = _CAPTURE.get()
+    if capture is not None and not capture.record:
+        return
+    with _LOCK, _ledger_lock():
+        data = load_usage()
+        _model_totals(data, provider, model)["throttled"] += 1
+        _save_usage(data)
+
+
+@contextmanager
+def capture_usage(record: bool = True) -> Iterator[UsageCapture]:
+    """Also collect the requests made in this thread; `record=False` skips the ledger."""
+    capture = UsageCapture(record=record)
+    token = _CAPTURE.set(capture)
+    try:
+        yield capture
+    finally:
+        _CAPTURE.reset(token)
+
+
+def _ledger_lock():
+    # The thread lock orders requests within a process; the file lock across processes.
+    return file_lock(usage_path().with_name(USAGE_LOCK_FILE))
+
+
+def reset_usage() -> None:
+    usage_path().unlink(missing_ok=True)
+
+
+def _model_totals(data: dict, provider: str, model: str) -> dict:
+    if not data.get("since"):
+        data["since"] = datetime.now(timezone.utc).isoformat()
+    models = data["providers"].setdefault(provider, {})
+    totals = models.setdefault(model, {})
+    for key in ("requests", "prompt_tokens", "completion_tokens", "throttled"):
+        totals.setdefault(key, 0)
+    for key in ("latency", "cost"):
+        totals.setdefault(key, 0.0)
+    return totals
+
+
+def _save_usage(data: dict) -> None:
+    path = usage_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
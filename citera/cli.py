@@ -8,9 +8,20 @@ from typing import Iterable
 from . import __version__
 from .commands.archive import handle_archive
 from .commands.describe import handle_describe
+from .commands.du import handle_du
+from .commands.eval import handle_eval
+from .commands.list import handle_list
 from .commands.new import handle_new
+from .commands.obsidian import handle_obsidian
+from .commands.pool import handle_pool
 from .commands.promote import handle_promote
+from .commands.queue import handle_queue
+from .commands.search import handle_search
 from .commands.set import handle_set
+from .commands.similar import handle_similar
+from .commands.stats import handle_stats
+from .commands.status import handle_status
+from .commands.worker import handle_worker
 from .core.constants import stage_choices, stage_label
 
 
@@ -50,6 +61,20 @@ def build_parser() -> argparse.ArgumentParser:
         "--name",
         help="Override the generated project id.",
     )
+    new_parser.add_argument(
+        "--from",
+        dest="from_id",
+        help="Clone an existing project id (copy-on-write where supported).",
+    )
+    new_parser.add_argument(
+        "--no-env",
+        action="store_true",
+        help="Skip environment setup (templates and pre-built environment)."
+    )
+    new_parser.add_argument(
+        "--root",
+        help="Create the project under this named root (see: citera set roots).",
+    )
 
     promote_parser = subparsers.add_parser("promote", help="Promote a project stage.")
     promote_parser.add_argument(
@@ -66,6 +91,16 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable GitHub repo creation.",
     )
+    promote_parser.add_argument(
+        "--keep-artifacts",
+        action="store_true",
+        help="Skip the pre-commit scan for heavy and generated paths.",
+    )
+    promote_parser.add_argument(
+        "--queue-push",
+        action="store_true",
+        help="Push in the background via the persistent queue.",
+    )
     promote_parser.add_argument(
         "--git",
         action="store_true",
@@ -110,11 +145,226 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print metadata without writing.",
     )
+    describe_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Describe every project missing metadata (all projects with --force).",
+    )
+    describe_parser.add_argument(
+        "--stage",
+        choices=stage_choices(include_archive=True, include_roles=True),
+        help="With --all, only describe projects in this stage.",
+    )
+    describe_parser.add_argument(
+        "--batch-tokens",
+        type=int,
+        help="With --all, prompt token budget per packed AI request.",
+    )
     set_parser = subparsers.add_parser("set", help="Update config values.")
     set_parser.add_argument("key", help="Config key to set.")
     set_parser.add_argument("value", help="Config value.")
 
-    subparsers.add_parser("list", help="List projects by stage or tag.")
+    list_parser = subparsers.add_parser("list", help="List projects by stage or tag.")
+    list_parser.add_argument(
+        "--stage",
+        choices=stage_choices(include_archive=True, include_roles=True),
+        help="Only list projects in this stage.",
+    )
+    list_parser.add_argument(
+        "--tag",
+        help="Only list projects with this tag.",
+    )
+    list_parser.add_argument(
+        "--root",
+        help="Only list projects under this named root.",
+    )
+    similar_parser = subparsers.add_parser(
+        "similar", help="Find projects similar to a project id."
+    )
+    similar_parser.add_argument("id", help="Project id to compare against.")
+    similar_parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Number of matches to show.",
+    )
+    search_parser = subparsers.add_parser(
+        "search", help="Search project metadata, notes, and READMEs."
+    )
+    search_parser.add_argument(
+        "query",
+        nargs="+",
+        help='Search terms; wrap phrases in quotes, e.g. \'"web sockets"\'.',
+    )
+    search_parser.add_argument(
+        "--stage",
+        choices=stage_choices(include_archive=True, include_roles=True),
+        help="Only match projects in this stage.",
+    )
+    search_parser.add_argument(
+        "--category",
+        help="Only match projects in this category.",
+    )
+    search_parser.add_argument(
+        "--source",
+        action="store_true",
+        help="Also index identifiers from source files.",
+    )
+    search_parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild the search index from scratch.",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of results.",
+    )
+    du_parser = subparsers.add_parser("du", help="Show disk usage by stage and project.")
+    du_parser.add_argument(
+        "--stage",
+        choices=stage_choices(include_archive=True, include_roles=True),
+        help="Only measure projects in this stage.",
+    )
+    du_parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of largest projects to show.",
+    )
+    du_parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Ignore cached directory subtotals.",
+    )
+    status_parser = subparsers.add_parser(
+        "status", help="Check git health across all projects."
+    )
+    status_parser.add_argument(
+        "--problems",
+        action="store_true",
+        help="Only show repositories that need attention.",
+    )
+    status_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum concurrent git processes.",
+    )
+    pool_parser = subparsers.add_parser(
+        "pool", help="Manage pre-built environments for `citera new`."
+    )
+    pool_parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["status", "fill", "clear"],
+        default="status",
+        help="Show, fill, or clear the pool.",
+    )
+    pool_parser.add_argument(
+        "--lang",
+        help="Only act on this language's environments (python, js).",
+    )
+    pool_parser.add_argument(
+        "--size",
+        type=int,
+        help="Number of ready environments to keep (defaults to pool_size).",
+    )
+    obsidian_parser = subparsers.add_parser(
+        "obsidian", help="Export projects into an Obsidian vault."
+    )
+    obsidian_parser.add_argument(
+        "action",
+        choices=["sync"],
+        help="Sync project notes and index pages into the vault.",
+    )
+    obsidian_parser.add_argument(
+        "--vault",
+        help="Vault directory (defaults to the obsidian_vault config key).",
+    )
+    obsidian_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List notes that would change without writing.",
+    )
+    worker_parser = subparsers.add_parser(
+        "worker", help="Drain the background push queue."
+    )
+    worker_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum concurrent pushes.",
+    )
+    worker_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep polling for new jobs instead of exiting when the queue is empty.",
+    )
+    queue_parser = subparsers.add_parser("queue", help="Show pending and failed queue jobs.")
+    queue_parser.add_argument(
+        "--retry",
+        action="store_true",
+        help="Move failed jobs back to pending.",
+    )
+    queue_parser.add_argument(
+        "--clear-failed",
+        action="store_true",
+        help="Delete failed jobs.",
+    )
+    stats_parser = subparsers.add_parser("stats", help="Show usage statistics.")
+    stats_parser.add_argument(
+        "topic",
+        choices=["llm"],
+        help="Statistics to show (llm: token usage and estimated cost).",
+    )
+    stats_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Clear the recorded statistics.",
+    )
+    eval_parser = subparsers.add_parser("eval", help="Compare models on saved project contexts.")
+    eval_parser.add_argument(
+        "action",
+        choices=["save", "run", "list", "clear"],
+        help="save: add project contexts to the corpus; run: replay the corpus through models.",
+    )
+    eval_parser.add_argument(
+        "--path",
+        help="With save, the project directory to capture (defaults to cwd).",
+    )
+    eval_parser.add_argument(
+        "--id",
+        help="With save, the project id to capture.",
+    )
+    eval_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="With save, capture every indexed project.",
+    )
+    eval_parser.add_argument(
+        "--model",
+        action="append",
+        metavar="TARGET",
+        help=(
+            "With run, a target to evaluate (repeatable): config, stub, heuristic, "
+            "or provider:model[@base_url]. Defaults to config."
+        ),
+    )
+    eval_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="With run, requests in flight per target (default 4).",
+    )
+    eval_parser.add_argument(
+        "--limit",
+        type=int,
+        help="With run, only replay the first N contexts.",
+    )
+    eval_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="With run, print each failed request's error.",
+    )
     archive_parser = subparsers.add_parser("archive", help="Archive a project.")
     archive_parser.add_argument(
         "--path",
@@ -163,6 +413,28 @@ def _handle_command(args: argparse.Namespace) -> int:
         return handle_set(args)
     if args.command == "archive":
         return handle_archive(args)
+    if args.command == "list":
+        return handle_list(args)
+    if args.command == "similar":
+        return handle_similar(args)
+    if args.command == "search":
+        return handle_search(args)
+    if args.command == "du":
+        return handle_du(args)
+    if args.command == "status":
+        return handle_status(args)
+    if args.command == "pool":
+        return handle_pool(args)
+    if args.command == "obsidian":
+        return handle_obsidian(args)
+    if args.command == "worker":
+        return handle_worker(args)
+    if args.command == "queue":
+        return handle_queue(args)
+    if args.command == "stats":
+        return handle_stats(args)
+    if args.command == "eval":
+        return handle_eval(args)
     if args.command is None:
         return 0
     print(
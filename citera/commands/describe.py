@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..ai.batch import DEFAULT_BATCH_TOKENS, generate_batch
 from ..ai.client import build_client
+from ..core.constants import stage_role_from_label
 from ..core.context import collect_project_context
+from ..core.index import update_index_entry
+from ..core.languages import serialize_language_stats
+from ..core.locks import LockTimeout
 from ..core.metadata import parse_project_metadata, write_updated_metadata
-from ..core.paths import resolve_project_path
+from ..core.paths import base_projects_path, resolve_project_path
+from ..core.roots import refresh_indexes, root_for_path
 from ..core.validation import validate_ai_payload
 from ..config import load_config
+from ..project import Inventory
+
+CONTEXT_WORKERS = 8
 
 
 def _merge_metadata(existing: dict, incoming: dict, force: bool) -> dict:
@@ -16,7 +28,7 @@ def _merge_metadata(existing: dict, incoming: dict, force: bool) -> dict:
         current = existing.get(key, default)
         if force:
             return incoming.get(key, current)
-        if current in (None, "", []):
+        if current in (None, "", [], {}):
             return incoming.get(key, current)
         return current
 
@@ -50,6 +62,16 @@ def _truthy(value: object) -> bool:
 
 def handle_describe(args: object) -> int:
     """Generate AI metadata for an existing project."""
+    try:
+        if getattr(args, "all", False):
+            return _describe_all(args)
+        return _describe_one(args)
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+
+def _describe_one(args: object) -> int:
     try:
         project_path = resolve_project_path(getattr(args, "path", None), None)
     except RuntimeError as exc:
@@ -77,6 +99,7 @@ def handle_describe(args: object) -> int:
         return 1
 
     merged = _merge_metadata(existing, validated, getattr(args, "force", False))
+    merged["languages"] = serialize_language_stats(context["language_stats"])
 
     if getattr(args, "dry_run", False):
         print("✓ AI metadata generated.")
@@ -86,10 +109,77 @@ def handle_describe(args: object) -> int:
         print("✓ project.yaml unchanged (dry-run).")
         return 0
 
-    write_updated_metadata(project_yaml, merged)
+    _write_metadata(project_path, merged)
     print("✓ AI metadata generated.")
     print(f"✓ name: {merged['name']}")
     print(f"✓ tags: {merged['tags']}")
     print(f"✓ category: {merged['category']}")
     print("✓ project.yaml updated.")
     return 0
+
+
+def _write_metadata(project_path: Path, merged: dict) -> None:
+    write_updated_metadata(project_path / "project.yaml", merged)
+    root = root_for_path(project_path)
+    update_index_entry(root.path if root else base_projects_path(), project_path)
+
+
+def _describe_all(args: object) -> int:
+    """Describe every matching project, packing several into each AI request."""
+    stage_role = None
+    if getattr(args, "stage", None):
+        stage_role = stage_role_from_label(str(args.stage))
+        if not stage_role:
+            print(f"Unsupported stage: {args.stage}", file=sys.stderr)
+            return 2
+    force = getattr(args, "force", False)
+    indexes = refresh_indexes()
+    root_paths = {root.name: root.path for root, _ in indexes}
+    inventory = Inventory.from_indexes((root.name, index) for root, index in indexes)
+    # Keyed by root and index key: ids are not unique across stages and roots.
+    targets: dict[str, Path] = {}
+    names: dict[str, str] = {}
+    for row in inventory.select(stage=stage_role):
+        project = inventory[row]
+        # Without --force, only projects still missing metadata are sent.
+        if not force and project.name and project.category and project.tags:
+            continue
+        target = f"{project.root}:{project.key}"
+        targets[target] = root_paths[project.root] / project.key
+        names[target] = project.id
+    if not targets:
+        print("No projects need describing.")
+        return 0
+    ids = list(names.values())
+    for target, project_id in names.items():
+        if ids.count(project_id) > 1:
+            names[target] = f"{project_id} ({target})"
+
+    with ThreadPoolExecutor(max_workers=CONTEXT_WORKERS) as executor:
+        contexts = dict(zip(targets, executor.map(collect_project_context, targets.values())))
+    config = load_config()
+    try:
+        client = build_client(config, {})
+    except Exception as exc:
+        print(f"AI request failed: {exc}", file=sys.stderr)
+        return 1
+    budget = int(getattr(args, "batch_tokens", None) or DEFAULT_BATCH_TOKENS)
+    result = generate_batch(client, contexts, budget=budget)
+
+    dry_run = getattr(args, "dry_run", False)
+    for target, project_path in targets.items():
+        if target in result.failures:
+            print(f"✗ {names[target]}: {result.failures[target]}")
+            continue
+        existing = parse_project_metadata(project_path / "project.yaml")
+        merged = _merge_metadata(existing, result.metadata[target], force)
+        merged["languages"] = serialize_language_stats(contexts[target]["language_stats"])
+        if not dry_run:
+            _write_metadata(project_path, merged)
+        print(f"✓ {names[target]}: {merged['name']} ({merged['category']})")
+    suffix = " (dry-run, nothing written)" if dry_run else ""
+    print(
+        f"\n{len(result.metadata)} described, {len(result.failures)} failed "
+        f"in {result.requests} AI requests{suffix}."
+    )
+    return 1 if result.failures else 0
@@ -0,0 +1,96 @@
+"""Handler for `citera du`."""
+
+from __future__ import annotations
+
+import sys
+
+from ..core.constants import root_stage_dirs, stage_role_from_label
+from ..core.diskusage import load_du_cache, save_du_cache, scan_projects
+from ..core.locks import LockTimeout
+from ..core.roots import refresh_indexes
+from ..core.tree import format_bytes
+
+HEAVY_REPORT_BYTES = 50 * 1024 * 1024
+
+
+def handle_du(args: object) -> int:
+    """Report disk usage grouped by stage, category, and project."""
+    role = None
+    if getattr(args, "stage", None):
+        role = stage_role_from_label(str(args.stage))
+        if not role:
+            print(f"Unsupported stage: {args.stage}", file=sys.stderr)
+            return 2
+    top = getattr(args, "top", None)
+    top = 20 if top is None else int(top)
+    if top < 1:
+        print("--top must be a positive integer.", file=sys.stderr)
+        return 2
+
+    try:
+        indexes = refresh_indexes()
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    by_stage: dict[str, list[int]] = {}
+    by_category: dict[str, list[int]] = {}
+    rows: list[tuple[int, str, str, dict[str, int]]] = []
+    for root, index in indexes:
+        base_path = root.path
+        stage_folder = root_stage_dirs(base_path)[role] if role else None
+        keys = [
+            key
+            for key in sorted(index["projects"])
+            if stage_folder is None or key.split("/", 1)[0] == stage_folder
+        ]
+        # Each root caches its own sizes, next to its index.
+        cache = {} if getattr(args, "rescan", False) else load_du_cache(base_path)
+        results, fresh = scan_projects([base_path / key for key in keys], cache)
+        if stage_folder is None:
+            save_du_cache(base_path, fresh)
+        else:
+            cache.update(fresh)
+            save_du_cache(base_path, cache)
+
+        prefix = f"{root.name}:" if len(indexes) > 1 else ""
+        for key in keys:
+            total, heavy = results[base_path / key]
+            parts = key.split("/")
+            stage_bucket = by_stage.setdefault(prefix + parts[0], [0, 0])
+            stage_bucket[0] += total
+            stage_bucket[1] += 1
+            if len(parts) == 3:
+                category_bucket = by_category.setdefault(f"{prefix}{parts[0]}/{parts[1]}", [0, 0])
+                category_bucket[0] += total
+                category_bucket[1] += 1
+            metadata = index["projects"][key].get("metadata", {})
+            rows.append((total, str(metadata.get("id") or parts[-1]), prefix + key, heavy))
+
+    if not rows:
+        print("No projects found.")
+        return 0
+    grand_total = sum(row[0] for row in rows)
+    print(f"Total: {format_bytes(grand_total)} in {len(rows)} projects")
+    _print_groups("By stage", by_stage)
+    if by_category:
+        _print_groups("By category", by_category)
+
+    print(f"\nLargest projects (top {min(top, len(rows))}):")
+    for total, project_id, key, heavy in sorted(rows, key=lambda row: -row[0])[:top]:
+        line = f"  {format_bytes(total):>10}  {project_id}  ({key})"
+        flagged = [
+            f"{path} {format_bytes(size)}"
+            for path, size in sorted(heavy.items(), key=lambda item: -item[1])
+            if size >= HEAVY_REPORT_BYTES
+        ]
+        if flagged:
+            line += f"  ⚠ {', '.join(flagged)}"
+        print(line)
+    return 0
+
+
+def _print_groups(title: str, groups: dict[str, list[int]]) -> None:
+    print(f"\n{title}:")
+    width = max(len(name) for name in groups)
+    for name, (total, count) in sorted(groups.items(), key=lambda item: -item[1][0]):
+        print(f"  {name:<{width}}  {format_bytes(total):>10}  ({count} projects)")
@@ -0,0 +1,156 @@
+"""Handler for `citera eval`."""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..ai.evaluation import (
+    DEFAULT_EVAL_WORKERS,
+    PERCENTILES,
+    EvalReport,
+    build_eval_client,
+    clear_corpus,
+    corpus_dir,
+    load_corpus,
+    run_eval,
+    save_context,
+)
+from ..config import load_config
+from ..core.context import collect_project_context
+from ..core.locks import LockTimeout
+from ..core.paths import resolve_project_path
+from ..core.roots import refresh_indexes, root_for_path
+from ..project import Inventory
+
+CONTEXT_WORKERS = 8
+
+
+def handle_eval(args: object) -> int:
+    """Save project contexts to the eval corpus or replay them through models."""
+    action = getattr(args, "action", None)
+    if action == "save":
+        return _save(args)
+    if action == "run":
+        return _run(args)
+    if action == "list":
+        corpus = load_corpus()
+        if not corpus:
+            print(f"Eval corpus is empty ({corpus_dir()}).")
+            return 0
+        for name in sorted(corpus):
+            print(name)
+        print(f"\n{len(corpus)} context(s) in {corpus_dir()}")
+        return 0
+    if action == "clear":
+        print(f"✓ Removed {clear_corpus()} context(s) from the eval corpus.")
+        return 0
+    print(f"Unknown eval action: {action}", file=sys.stderr)
+    return 2
+
+
+def _save(args: object) -> int:
+    targets: dict[str, Path] = {}
+    if getattr(args, "all", False):
+        try:
+            indexes = refresh_indexes()
+        except LockTimeout as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        root_paths = {root.name: root.path for root, _ in indexes}
+        inventory = Inventory.from_indexes((root.name, index) for root, index in indexes)
+        # Keyed by root and index key: ids are not unique across stages and roots.
+        for project in inventory:
+            targets[f"{project.root}:{project.key}"] = root_paths[project.root] / project.key
+    else:
+        try:
+            project_path = resolve_project_path(
+                getattr(args, "path", None), getattr(args, "id", None)
+            )
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        root = root_for_path(project_path)
+        if root is None:
+            targets[project_path.name] = project_path
+        else:
+            key = project_path.resolve().relative_to(root.path.resolve()).as_posix()
+            targets[f"{root.name}:{key}"] = project_path
+    if not targets:
+        print("No projects to save.")
+        return 0
+
+    with ThreadPoolExecutor(max_workers=CONTEXT_WORKERS) as executor:
+        contexts = executor.map(collect_project_context, targets.values())
+        for name, context in zip(targets, contexts):
+            save_context(name, context)
+    print(f"✓ Saved {len(targets)} context(s) to {corpus_dir()}")
+    return 0
+
+
+def _run(args: object) -> int:
+    corpus = load_corpus()
+    if not corpus:
+        print("Eval corpus is empty; add contexts with `citera eval save`.", file=sys.stderr)
+        return 1
+    limit = getattr(args, "limit", None)
+    if limit:
+        corpus = dict(sorted(corpus.items())[:limit])
+    jobs = int(getattr(args, "jobs", None) or DEFAULT_EVAL_WORKERS)
+    config = load_config()
+    reports: list[EvalReport] = []
+    for target in getattr(args, "model", None) or ["config"]:
+        try:
+            client = build_eval_client(target, config)
+        except (RuntimeError, ValueError) as exc:
+            print(f"{target}: {exc}", file=sys.stderr)
+            return 1
+        print(f"Running {len(corpus)} context(s) through {target} ({jobs} in flight)...")
+        reports.append(run_eval(target, client, corpus, max_workers=jobs))
+    _print_reports(reports)
+    if getattr(args, "verbose", False):
+        for report in reports:
+            for sample in report.samples:
+                if sample.error:
+                    print(f"{report.target} {sample.name}: {sample.error}", file=sys.stderr)
+    return 0
+
+
+def _print_reports(reports: list[EvalReport]) -> None:
+    headers = (
+        "model",
+        "n",
+        *(f"p{percentile} s" for percentile in PERCENTILES),
+        "prompt",
+        "completion",
+        "parse %",
+        "valid %",
+        "errors",
+        "wall s",
+    )
+    table = [headers]
+    for report in reports:
+        prompt, completion = report.mean_tokens()
+        table.append(
+            (
+                report.target,
+                str(report.count),
+                *(f"{report.latency_percentile(p):.2f}" for p in PERCENTILES),
+                f"{prompt:.0f}",
+                f"{completion:.0f}",
+                f"{report.rate('parsed') * 100:.0f}",
+                f"{report.rate('valid') * 100:.0f}",
+                str(report.errors),
+                f"{report.elapsed:.1f}",
+            )
+        )
+    widths = [max(len(row[column]) for row in table) for column in range(len(headers))]
+    print()
+    for row in table:
+        cells = [
+            f"{value:<{width}}" if column == 0 else f"{value:>{width}}"
+            for column, (value, width) in enumerate(zip(row, widths))
+        ]
+        print("  ".join(cells))
+    print("\nTokens are means per context; parse and valid rates exclude requests that errored.")
@@ -0,0 +1,61 @@
+"""Handler for `citera list`."""
+
+from __future__ import annotations
+
+import sys
+
+from ..core.constants import stage_role_from_label
+from ..core.languages import format_language_stats
+from ..core.locks import LockTimeout
+from ..core.roots import get_root, project_roots, refresh_indexes, root_mounted
+from ..project import Inventory
+
+
+def handle_list(args: object) -> int:
+    """List indexed projects, optionally filtered by stage or tag."""
+    stage_filter = getattr(args, "stage", None)
+    stage_role = None
+    if stage_filter:
+        stage_role = stage_role_from_label(str(stage_filter))
+        if not stage_role:
+            print(f"Unsupported stage: {stage_filter}", file=sys.stderr)
+            return 2
+    tag_filter = str(getattr(args, "tag", None) or "").strip().lower()
+
+    roots = project_roots()
+    root_filter = getattr(args, "root", None)
+    if root_filter:
+        root = get_root(str(root_filter))
+        if root is None:
+            print(f"Unknown root: {root_filter}", file=sys.stderr)
+            return 2
+        if not root_mounted(root):
+            print(f"Root {root.name} is not mounted: {root.path}", file=sys.stderr)
+            return 1
+        roots = [root]
+    show_root = len(project_roots()) > 1
+
+    try:
+        indexes = refresh_indexes(roots)
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    inventory = Inventory.from_indexes((root.name, index) for root, index in indexes)
+    rows: list[tuple[str, ...]] = []
+    for row in inventory.select(stage=stage_role, tag=tag_filter or None):
+        languages = format_language_stats(inventory.language_stats(row))
+        rows.append(
+            (inventory.ids[row], inventory.stage_display(row), inventory.category(row) or "-")
+            # Languages stay last so the padded columns line up.
+            + ((inventory.root(row),) if show_root else ())
+            + (languages or "-",)
+        )
+
+    if not rows:
+        print("No projects found.")
+        return 0
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]) - 1)]
+    for row in rows:
+        padded = "  ".join(f"{value:<{width}}" for value, width in zip(row, widths))
+        print(f"{padded}  {row[-1]}")
+    return 0
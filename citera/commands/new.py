@@ -7,10 +7,36 @@ import subprocess
 import sys
 from pathlib import Path
 
-from ..core.constants import LANG_STARTERS, stage_dir, stage_label, stage_role_from_label
-from ..core.ids import generate_project_id
+from ..config import load_config
+from ..core.clone import clone_tree
+from ..core.constants import (
+    ENV_TEMPLATE_FILES,
+    LANG_ENVIRONMENTS,
+    LANG_STARTERS,
+    stage_label,
+    stage_role_from_label,
+)
+from ..core.envpool import (
+    claim_environment,
+    environment_spec,
+    filling,
+    pool_packages,
+    pool_size,
+    relocate_venv,
+    spawn_refill,
+)
+from ..core.ids import (
+    allocate_project_id,
+    invalid_project_id,
+    release_project_id,
+    reserve_project_id,
+)
+from ..core.index import update_index_entry
+from ..core.locks import LockTimeout, project_lock
 from ..core.metadata import write_project_metadata
 from ..core.paths import base_projects_path, ensure_base_structure
+from ..core.roots import find_project, get_root, project_roots, root_mounted
+from ..core.tree import format_bytes
 
 
 def _create_starter_file(project_path: Path, lang: str | None) -> None:
@@ -23,6 +49,51 @@ def _create_starter_file(project_path: Path, lang: str | None) -> None:
     (project_path / filename).write_text(content, encoding="utf-8")
 
 
+def _setup_environment(
+    base_path: Path, project_path: Path, lang: str, use_pool: bool = True
+) -> None:
+    """Claim a pre-built environment from the pool and write its template files."""
+    kind = LANG_ENVIRONMENTS[lang]
+    config = load_config()
+    packages = pool_packages(kind, config)
+    spec = environment_spec(kind, packages)
+    claimed = use_pool and claim_environment(base_path, kind, spec, project_path)
+    for filename, template in ENV_TEMPLATE_FILES[kind].items():
+        target = project_path / filename
+        if target.exists():
+            continue
+        if filename == "requirements.txt":
+            template = "".join(f"{package}\n" for package in packages)
+        target.write_text(template.format(name=project_path.name), encoding="utf-8")
+    if claimed:
+        print(f"✓ Environment ready ({kind}).", file=sys.stderr)
+    if not use_pool:
+        return
+    refilling = filling(base_path, kind)
+    if pool_size(config) and not refilling:
+        try:
+            spawn_refill(lang)
+            refilling = True
+        except OSError as exc:
+            print(f"Failed to start pool refill: {exc}", file=sys.stderr)
+    if not claimed:
+        note = "; filling the pool in the background" if refilling else ""
+        print(f"No pre-built {kind} environment available{note}.", file=sys.stderr)
+
+
+def _clone_source(source_path: Path, project_path: Path) -> None:
+    stats = clone_tree(source_path, project_path)
+    venv_path = project_path / ".venv"
+    if venv_path.is_dir():
+        relocate_venv(venv_path, source_path / ".venv")
+    print(
+        f"✓ Cloned {source_path.name}: {stats.reflinked} reflinked, "
+        f"{stats.hardlinked} hardlinked, {stats.copied} copied "
+        f"({format_bytes(stats.copied_bytes)} duplicated).",
+        file=sys.stderr,
+    )
+
+
 def _open_in_vscode(project_path: Path) -> None:
     code_path = shutil.which("code")
     if not code_path:
@@ -36,26 +107,86 @@ def _open_in_vscode(project_path: Path) -> None:
 
 def handle_new(args: object) -> int:
     """Create a new project folder and metadata."""
-    base_path = base_projects_path()
-    ensure_base_structure(base_path)
     stage_role = stage_role_from_label(str(args.type))
     if not stage_role or stage_role == "archive":
         print(f"Unsupported stage: {args.type}", file=sys.stderr)
         return 2
-    stage_dir_path = base_path / stage_dir(stage_role)
-
-    project_id = args.name or generate_project_id(stage_dir_path)
-    project_path = stage_dir_path / project_id
-    if project_path.exists():
-        print(
-            f"Refusing to overwrite existing folder: {project_path}",
-            file=sys.stderr,
-        )
-        return 1
+    root = project_roots()[0]
+    if getattr(args, "root", None):
+        root = get_root(str(args.root))
+        if root is None:
+            print(f"Unknown root: {args.root}", file=sys.stderr)
+            return 2
+        if not root_mounted(root):
+            print(f"Root {root.name} is not mounted: {root.path}", file=sys.stderr)
+            return 1
+    base_path = root.path
+    ensure_base_structure(base_path)
+    stage_dir_path = root.stage_path(stage_role)
+    # Ids are reserved on the primary root so allocations never race across roots.
+    primary_path = base_projects_path()
+
+    source_path = None
+    if getattr(args, "from_id", None):
+        try:
+            source_path = find_project(args.from_id)
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        if not source_path:
+            print(f"Project id not found: {args.from_id}", file=sys.stderr)
+            return 1
 
-    project_path.mkdir(parents=False)
-    write_project_metadata(project_path, project_id, stage_label(stage_role))
-    _create_starter_file(project_path, args.lang)
+    if args.name:
+        problem = invalid_project_id(args.name)
+        if problem:
+            print(problem, file=sys.stderr)
+            return 2
+    reserved = None
+    try:
+        if args.name:
+            project_id = args.name
+            if not reserve_project_id(primary_path, project_id):
+                print(f"Project id already in use: {project_id}", file=sys.stderr)
+                return 1
+        else:
+            project_id = allocate_project_id(primary_path)
+        reserved = project_id
+        project_path = stage_dir_path / project_id
+        # Held until the project is indexed, so a concurrent promote never sees it half-made.
+        with project_lock(project_id):
+            if project_path.exists():
+                print(
+                    f"Refusing to overwrite existing folder: {project_path}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            project_path.mkdir(parents=False)
+            if source_path:
+                try:
+                    _clone_source(source_path, project_path)
+                except OSError as exc:
+                    shutil.rmtree(project_path, ignore_errors=True)
+                    print(f"Failed to clone {args.from_id}: {exc}", file=sys.stderr)
+                    return 1
+            write_project_metadata(project_path, project_id, stage_label(stage_role))
+            if not source_path:
+                _create_starter_file(project_path, args.lang)
+                lang = (args.lang or "").lower()
+                if lang in LANG_ENVIRONMENTS and not getattr(args, "no_env", False):
+                    # The pool lives on the primary root; claiming is a same-volume rename.
+                    _setup_environment(
+                        primary_path, project_path, lang, use_pool=root.path == primary_path
+                    )
+            update_index_entry(base_path, project_path)
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    finally:
+        # Indexed or abandoned, the project no longer needs the reservation.
+        if reserved:
+            release_project_id(primary_path, reserved)
     print(project_path.resolve())
     _open_in_vscode(project_path)
     return 0
@@ -0,0 +1,44 @@
+"""Handler for `citera obsidian`."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from ..config import load_config
+from ..core.locks import LockTimeout
+from ..core.obsidian import render_vault, sync_vault
+from ..core.roots import refresh_indexes
+
+
+def handle_obsidian(args: object) -> int:
+    """Export the project inventory into an Obsidian vault."""
+    vault = getattr(args, "vault", None) or load_config().get("obsidian_vault")
+    if not vault:
+        print(
+            "No vault given. Use --vault or: citera set obsidian_vault <dir>",
+            file=sys.stderr,
+        )
+        return 2
+    vault_path = Path(vault).expanduser()
+    if not vault_path.is_dir():
+        print(f"Vault directory not found: {vault_path}", file=sys.stderr)
+        return 1
+
+    try:
+        indexes = [(root.path, index) for root, index in refresh_indexes()]
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    dry_run = bool(getattr(args, "dry_run", False))
+    result = sync_vault(vault_path, render_vault(indexes), dry_run=dry_run)
+    prefix = "Would update" if dry_run else "Updated"
+    for relative in result.written:
+        print(f"  {prefix}: {relative}")
+    for relative in result.removed:
+        print(f"  {'Would remove' if dry_run else 'Removed'}: {relative}")
+    print(
+        f"✓ Vault synced: {len(result.written)} written, {len(result.removed)} removed, "
+        f"{result.unchanged} unchanged."
+    )
+    return 0
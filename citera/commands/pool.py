@@ -0,0 +1,61 @@
+"""Handler for `citera pool`."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+
+from ..config import load_config
+from ..core.constants import LANG_ENVIRONMENTS
+from ..core.envpool import (
+    environment_spec,
+    fill_pool,
+    pool_packages,
+    pool_root,
+    pool_size,
+    ready_entries,
+)
+from ..core.paths import base_projects_path, ensure_base_structure
+
+
+def handle_pool(args: object) -> int:
+    """Show, fill, or clear the pre-built environment pool."""
+    base_path = base_projects_path()
+    ensure_base_structure(base_path)
+    config = load_config()
+    lang = getattr(args, "lang", None)
+    if lang:
+        lang = lang.lower()
+        if lang not in LANG_ENVIRONMENTS:
+            print(f"No environment template for language: {lang}", file=sys.stderr)
+            return 2
+        kinds = [LANG_ENVIRONMENTS[lang]]
+    else:
+        kinds = sorted(set(LANG_ENVIRONMENTS.values()))
+
+    action = getattr(args, "action", None) or "status"
+    if action == "clear":
+        for kind in kinds:
+            shutil.rmtree(pool_root(base_path, kind), ignore_errors=True)
+            print(f"✓ Cleared {kind} pool.")
+        return 0
+
+    if action == "fill":
+        size = args.size if getattr(args, "size", None) is not None else pool_size(config)
+        for kind in kinds:
+            packages = pool_packages(kind, config)
+            try:
+                built = fill_pool(base_path, kind, packages, size)
+            except (OSError, RuntimeError, subprocess.CalledProcessError) as exc:
+                print(f"Failed to build {kind} environment: {exc}", file=sys.stderr)
+                return 1
+            print(f"✓ {kind} pool: {built} built, {size} ready.")
+        return 0
+
+    for kind in kinds:
+        packages = pool_packages(kind, config)
+        ready = ready_entries(base_path, kind, environment_spec(kind, packages))
+        listed = ", ".join(packages) if packages else "(none)"
+        print(f"{kind}: {len(ready)}/{pool_size(config)} ready  packages: {listed}")
+    return 0
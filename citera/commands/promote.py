@@ -11,16 +11,37 @@ from pathlib import Path
 from ..ai.client import build_client
 from ..config import load_config
 from ..core.actions import create_obsidian_note, run_command, slugify_repo_name
+from ..core.artifacts import extend_gitignore, gitignore_additions, scan_artifacts
 from ..core.context import collect_project_context
-from ..core.constants import stage_dir, stage_label, stage_role_from_label
+from ..core.gitobjects import FAST_COMMIT_MIN_FILES, commit_worktree
+from ..core.github import GitHubClient, GitHubError, github_client, remote_url
+from ..core.ids import release_project_id, reserve_project_id
+from ..core.index import refresh_index, remove_index_entry, update_index_entry
+from ..core.languages import language_breakdown, serialize_language_stats
+from ..core.locks import LockTimeout, project_lock
+from ..core.constants import stage_label, stage_role_from_label
+from ..core.obsidian import render_vault, sync_vault
 from ..core.metadata import (
     normalize_category,
     parse_project_metadata,
     write_updated_metadata,
 )
+from ..core.pushqueue import enqueue_push, spawn_worker
 from ..core.paths import base_projects_path, ensure_base_structure, resolve_project_path
+from ..core.roots import (
+    archive_root,
+    move_project,
+    project_roots,
+    refresh_indexes,
+    root_for_path,
+    root_mounted,
+)
+from ..core.similar import similar_projects
+from ..core.tree import format_bytes
 from ..core.validation import validate_ai_payload
 
+SIMILAR_NOTE_THRESHOLD = 0.35
+
 
 def _validate_stage_transition(current: str, target: str, archive: bool) -> None:
     if archive:
@@ -117,6 +138,98 @@ def _git_has_changes(project_path: Path) -> bool:
     return bool(result.stdout.strip())
 
 
+def _similar_note(base_path: Path, destination: Path) -> str | None:
+    """Summarize existing projects that overlap with the promoted one."""
+    try:
+        index = refresh_index(base_path)
+        key = destination.relative_to(base_path).as_posix()
+        matches = similar_projects(base_path, index, key, top_k=3)
+    except (RuntimeError, ValueError, OSError):
+        return None
+    matches = [(match, score) for match, score in matches if score >= SIMILAR_NOTE_THRESHOLD]
+    if not matches:
+        return None
+    return ", ".join(
+        f"{index['projects'][match]['metadata'].get('id', match)} ({score:.2f})"
+        for match, score in matches
+    )
+
+
+def _fast_commit(destination: Path, message: str) -> bool:
+    """Commit with the parallel in-process builder when `fast_commit` allows it."""
+    mode = str(load_config().get("fast_commit") or "false").lower()
+    if mode not in ("true", "auto"):
+        return False
+    min_files = FAST_COMMIT_MIN_FILES if mode == "auto" else 0
+    return commit_worktree(destination, message, min_files=min_files) is not None
+
+
+def _exclude_artifacts(destination: Path) -> None:
+    """Extend .gitignore so heavy, generated, and binary paths stay out of the commit."""
+    report = scan_artifacts(destination)
+    additions = gitignore_additions(destination, report)
+    extend_gitignore(destination, additions)
+    if report.exclusions:
+        print(f"✓ Excluded from git ({format_bytes(report.excluded_bytes)}):")
+        for item in report.exclusions:
+            print(f"  {item.pattern}  {format_bytes(item.size)}  ({item.reason})")
+    elif additions:
+        print(f"✓ .gitignore updated ({len(additions)} patterns)")
+
+
+def _create_repo_via_api(
+    github: GitHubClient, destination: Path, repo_name: str, description: str | None
+) -> str | None:
+    """Create the repo with one REST call and add it as origin; None to fall back to gh."""
+    try:
+        repo = github.create_repo(repo_name, private=True, description=description)
+    except GitHubError as exc:
+        print(f"{exc}; falling back to gh.", file=sys.stderr)
+        return None
+    origin = remote_url(repo, load_config().get("github_protocol"))
+    has_origin = subprocess.run(
+        ["git", "remote", "get-url", "origin"],
+        cwd=destination,
+        capture_output=True,
+    ).returncode == 0
+    run_command(
+        ["git", "remote", "set-url" if has_origin else "add", "origin", origin],
+        cwd=destination,
+        dry_run=False,
+    )
+    return str(repo.get("html_url") or "")
+
+
+def _create_repo_via_gh(destination: Path, repo_name: str, dry_run: bool) -> str:
+    run_command(
+        [
+            "gh",
+            "repo",
+            "create",
+            repo_name,
+            "--private",
+            "--source",
+            ".",
+            "--remote",
+            "origin",
+            "--confirm",
+        ],
+        cwd=destination,
+        dry_run=dry_run,
+    )
+    try:
+        result = subprocess.run(
+            ["gh", "repo", "view", "--json", "url", "-q", ".url"],
+            cwd=destination,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError:
+        return ""
+    return result.stdout.strip()
+
+
 def _truthy(value: object) -> bool:
     if isinstance(value, bool):
         return value
@@ -133,6 +246,17 @@ def handle_promote(args: object) -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
+    # Project folders are named by id. Holding the lock for the whole promotion
+    # means a second promote of the same project finds it already moved.
+    try:
+        with project_lock(project_path.name):
+            return _promote(args, project_path)
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+
+def _promote(args: object, project_path: Path) -> int:
     project_yaml = project_path / "project.yaml"
     if not project_yaml.exists():
         print(f"Missing project.yaml in {project_path}", file=sys.stderr)
@@ -176,7 +300,15 @@ def handle_promote(args: object) -> int:
             print("Archive cancelled.")
             return 1
 
-    base_path = base_projects_path()
+    source_root = root_for_path(project_path) or project_roots()[0]
+    target_root = source_root
+    if target_stage == "archive":
+        # Archives go to the bulk root when one is configured.
+        target_root = archive_root() or source_root
+    if not root_mounted(target_root):
+        print(f"Root {target_root.name} is not mounted: {target_root.path}", file=sys.stderr)
+        return 1
+    base_path = target_root.path
     ensure_base_structure(base_path)
 
     ai_metadata: dict | None = None
@@ -208,7 +340,7 @@ def handle_promote(args: object) -> int:
             print("Missing category for promotion; run describe first.", file=sys.stderr)
             return 1
 
-    stage_dir_path = base_path / stage_dir(target_stage)
+    stage_dir_path = target_root.stage_path(target_stage)
 
     if category:
         destination = stage_dir_path / category / new_project_id
@@ -256,11 +388,15 @@ def handle_promote(args: object) -> int:
     if args.dry_run:
         print(f"Old path: {project_path}")
         print(f"New path: {destination}")
+        if target_root != source_root:
+            print(f"Root: {source_root.name} -> {target_root.name}")
         print(f"Metadata changes: stage={target_stage_label}, name={use_name}, category={use_category}")
         print(f"Git: {'init' if git_enabled else 'skip'}")
         print(f"GitHub: {'create' if github_enabled else 'skip'}")
         if git_enabled:
             print("README: create if missing")
+            if not getattr(args, "keep_artifacts", False):
+                print("Artifacts: extend .gitignore for heavy/generated paths")
             print("Git commit: create initial commit")
         if github_enabled:
             print("Git push: push to origin")
@@ -270,48 +406,58 @@ def handle_promote(args: object) -> int:
     if git_enabled and not shutil.which("git"):
         print("git not found on PATH; cannot initialize git.", file=sys.stderr)
         return 1
-    if github_enabled and not shutil.which("gh"):
+    github = github_client(load_config()) if github_enabled else None
+    if github_enabled and github is None and not shutil.which("gh"):
         print(
-            "GitHub CLI (gh) not found; re-run with --no-github or install gh.",
+            "No GitHub token or CLI (gh) found; set github_token, export GITHUB_TOKEN, "
+            "install gh, or re-run with --no-github.",
             file=sys.stderr,
         )
         return 1
 
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    project_path.rename(destination)
+    language_stats = language_breakdown(project_path)
+    renamed = new_project_id != project_id
+    if renamed and not reserve_project_id(base_projects_path(), new_project_id):
+        print(
+            f"Project id already in use: {new_project_id}; re-run with --name.",
+            file=sys.stderr,
+        )
+        return 1
 
-    if git_enabled and not (destination / ".git").exists():
-        run_command(["git", "init", "-b", "main"], cwd=destination, dry_run=args.dry_run)
+    try:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        move_project(project_path, destination)
+    except OSError as exc:
+        print(f"Failed to move project to {destination}: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        # Once moved, the folder name itself claims the new id.
+        if renamed:
+            release_project_id(base_projects_path(), new_project_id)
+    remove_index_entry(source_root.path, project_path)
 
-    if github_enabled:
-        repo_name = slugify_repo_name(use_name)
-        run_command(
-            [
-                "gh",
-                "repo",
-                "create",
-                repo_name,
-                "--private",
-                "--source",
-                ".",
-                "--remote",
-                "origin",
-                "--confirm",
-            ],
-            cwd=destination,
-            dry_run=args.dry_run,
+    try:
+        if git_enabled and not (destination / ".git").exists():
+            run_command(["git", "init", "-b", "main"], cwd=destination, dry_run=args.dry_run)
+
+        if github_enabled:
+            repo_name = slugify_repo_name(use_name)
+            repo_url = None
+            if github is not None:
+                repo_url = _create_repo_via_api(github, destination, repo_name, use_description)
+            if repo_url is None:
+                if not shutil.which("gh"):
+                    print("GitHub repo creation failed.", file=sys.stderr)
+                    return 1
+                repo_url = _create_repo_via_gh(destination, repo_name, args.dry_run)
+    except subprocess.CalledProcessError as exc:
+        # git and gh already printed their own error; say which step and where the project is.
+        print(
+            f"{' '.join(exc.cmd[:3])} failed (exit {exc.returncode}); "
+            f"the project was moved to {destination}.",
+            file=sys.stderr,
         )
-        try:
-            result = subprocess.run(
-                ["gh", "repo", "view", "--json", "url", "-q", ".url"],
-                cwd=destination,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            repo_url = result.stdout.strip()
-        except subprocess.CalledProcessError:
-            repo_url = ""
+        return 1
 
     if target_stage == "archive":
         metadata_git_enabled = existing_git_enabled
@@ -334,8 +480,10 @@ def handle_promote(args: object) -> int:
         "git_enabled": metadata_git_enabled,
         "git_repo": metadata_repo_url,
         "obsidian_enabled": metadata_obsidian_enabled,
+        "languages": serialize_language_stats(language_stats),
     }
     write_updated_metadata(destination / "project.yaml", updated)
+    update_index_entry(base_path, destination)
 
     if not target_stage == "archive":
         readme_created = _write_readme(
@@ -351,14 +499,18 @@ def handle_promote(args: object) -> int:
     if args.obsidian:
         create_obsidian_note(destination, new_project_id, args.dry_run)
 
+    if git_enabled and not getattr(args, "keep_artifacts", False):
+        _exclude_artifacts(destination)
+
     if git_enabled and _git_has_changes(destination):
         try:
-            run_command(["git", "add", "-A"], cwd=destination, dry_run=args.dry_run)
-            run_command(
-                ["git", "commit", "-m", "Initial commit"],
-                cwd=destination,
-                dry_run=args.dry_run,
-            )
+            if not _fast_commit(destination, "Initial commit"):
+                run_command(["git", "add", "-A"], cwd=destination, dry_run=args.dry_run)
+                run_command(
+                    ["git", "commit", "-m", "Initial commit"],
+                    cwd=destination,
+                    dry_run=args.dry_run,
+                )
             commit_created = True
         except subprocess.CalledProcessError:
             print(
@@ -367,13 +519,22 @@ def handle_promote(args: object) -> int:
             )
             return 1
 
+    push_queued = False
     if github_enabled and _git_has_commits(destination):
-        try:
-            run_command(["git", "push", "-u", "origin", "HEAD"], cwd=destination, dry_run=args.dry_run)
-            pushed = True
-        except subprocess.CalledProcessError:
-            print("Git push failed. Check your credentials or remote.", file=sys.stderr)
-            return 1
+        if getattr(args, "queue_push", False) or _truthy(load_config().get("push_queue")):
+            enqueue_push(destination, new_project_id)
+            push_queued = True
+            try:
+                spawn_worker()
+            except OSError as exc:
+                print(f"Failed to start queue worker: {exc}", file=sys.stderr)
+        else:
+            try:
+                run_command(["git", "push", "-u", "origin", "HEAD"], cwd=destination, dry_run=args.dry_run)
+                pushed = True
+            except subprocess.CalledProcessError:
+                print("Git push failed. Check your credentials or remote.", file=sys.stderr)
+                return 1
 
     print(f"✓ Project promoted to: {target_stage_label}")
     print(f"✓ Category: {use_category}")
@@ -391,7 +552,18 @@ def handle_promote(args: object) -> int:
         print("✓ Initial commit created")
     if pushed:
         print("✓ Pushed to GitHub")
+    if push_queued:
+        print("✓ Push queued (see: citera queue)")
     if args.obsidian:
         print("✓ Obsidian note created")
+        vault = load_config().get("obsidian_vault")
+        if vault and Path(vault).expanduser().is_dir() and not args.dry_run:
+            indexes = [(root.path, index) for root, index in refresh_indexes()]
+            result = sync_vault(Path(vault).expanduser(), render_vault(indexes))
+            print(f"✓ Obsidian vault synced ({len(result.written)} notes updated)")
+    if target_stage != "archive":
+        similar = _similar_note(base_path, destination)
+        if similar:
+            print(f"✓ Similar projects: {similar}")
 
     return 0
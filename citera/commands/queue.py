@@ -0,0 +1,41 @@
+"""Handler for `citera queue`."""
+
+from __future__ import annotations
+
+import time
+
+from ..core.pushqueue import (
+    FAILED,
+    PENDING,
+    RUNNING,
+    clear_failed,
+    list_jobs,
+    retry_failed,
+    worker_running,
+)
+
+
+def handle_queue(args: object) -> int:
+    """Show pending, running, and failed background jobs."""
+    if getattr(args, "retry", False):
+        print(f"✓ {retry_failed()} failed jobs moved back to pending.")
+        return 0
+    if getattr(args, "clear_failed", False):
+        print(f"✓ {clear_failed()} failed jobs removed.")
+        return 0
+
+    now = time.time()
+    print(f"Worker: {'running' if worker_running() else 'not running'}")
+    for state in (PENDING, RUNNING, FAILED):
+        jobs = list_jobs(state)
+        print(f"\n{state.title()} ({len(jobs)}):")
+        for job in jobs:
+            line = f"  {job['kind']}  {job.get('project_id') or '-'}  {job['path']}"
+            if job.get("attempts"):
+                line += f"  attempts {job['attempts']}/{job['max_attempts']}"
+            if state == PENDING and job.get("next_attempt", 0.0) > now:
+                line += f"  retry in {int(job['next_attempt'] - now)}s"
+            if job.get("last_error"):
+                line += f"  last error: {job['last_error']}"
+            print(line)
+    return 0
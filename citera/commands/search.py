@@ -0,0 +1,66 @@
+"""Handler for `citera search`."""
+
+from __future__ import annotations
+
+import sys
+
+from ..core.constants import stage_label, stage_role_from_label
+from ..core.locks import LockTimeout
+from ..core.metadata import normalize_category
+from ..core.roots import refresh_indexes
+from ..core.search import load_search_index, save_search_index, search, update_search_index
+
+
+def handle_search(args: object) -> int:
+    """Full-text search over project metadata, notes, and READMEs."""
+    query = " ".join(getattr(args, "query", []) or []).strip()
+    if not query:
+        print("Empty search query.", file=sys.stderr)
+        return 2
+    stage = None
+    if getattr(args, "stage", None):
+        role = stage_role_from_label(str(args.stage))
+        if not role:
+            print(f"Unsupported stage: {args.stage}", file=sys.stderr)
+            return 2
+        stage = stage_label(role)
+    category = None
+    if getattr(args, "category", None):
+        category = normalize_category(str(args.category))
+        if not category:
+            print(f"Unsupported category: {args.category}", file=sys.stderr)
+            return 2
+
+    include_source = bool(getattr(args, "source", False))
+    limit = getattr(args, "limit", None)
+    limit = 20 if limit is None else int(limit)
+    if limit < 1:
+        print("--limit must be a positive integer.", file=sys.stderr)
+        return 2
+    try:
+        indexes = refresh_indexes()
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    # Each root keeps its own search index; hits are merged by score.
+    results = []
+    for root, index in indexes:
+        if getattr(args, "reindex", False):
+            save_search_index(
+                root.path,
+                dict(load_search_index(root.path), docs={}, postings={}, source=include_source),
+            )
+        search_index = update_search_index(root.path, index, include_source=include_source)
+        for key, score in search(search_index, query, stage=stage, category=category, limit=limit):
+            results.append((score, root, index, key))
+    if not results:
+        print("No matches.")
+        return 0
+    results.sort(key=lambda item: -item[0])
+    for score, root, index, key in results[:limit]:
+        metadata = index["projects"][key].get("metadata", {})
+        project_id = metadata.get("id") or key.rsplit("/", 1)[-1]
+        name = metadata.get("name") or "-"
+        location = f"{root.name}:{key}" if len(indexes) > 1 else key
+        print(f"{score:6.2f}  {project_id}  ({location})  {name}")
+    return 0
@@ -5,10 +5,37 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+from ..ai.routing import parse_chain
 from ..config import set_config_value
+from ..core.roots import get_root, parse_roots
 
-VALID_KEYS = {"llm", "llm_key", "llm_model", "root"}
-VALID_LLMS = {"openai", "gemini"}
+VALID_KEYS = {
+    "archive_root",
+    "fast_commit",
+    "gemini_key",
+    "github_api",
+    "github_protocol",
+    "github_token",
+    "llm",
+    "llm_chain",
+    "llm_key",
+    "llm_model",
+    "llm_mode",
+    "llm_structured_output",
+    "llm_threshold",
+    "obsidian_vault",
+    "openai_base_url",
+    "openai_key",
+    "pool_node_packages",
+    "pool_size",
+    "pool_venv_packages",
+    "push_queue",
+    "root",
+    "roots",
+}
+VALID_LLMS = {"openai", "gemini", "heuristic"}
+VALID_LLM_MODES = {"direct", "hybrid"}
+VALID_GITHUB_PROTOCOLS = {"https", "ssh"}
 
 
 def handle_set(args: object) -> int:
@@ -22,14 +49,76 @@ def handle_set(args: object) -> int:
     if key == "llm":
         value = value.lower()
         if value not in VALID_LLMS:
-            print("Invalid llm provider. Use: openai or gemini.", file=sys.stderr)
+            print("Invalid llm provider. Use: openai, gemini, or heuristic.", file=sys.stderr)
             return 1
-    if key == "llm_key" and not value:
-        print("llm_key cannot be empty.", file=sys.stderr)
+    if key == "llm_mode":
+        value = value.lower()
+        if value not in VALID_LLM_MODES:
+            print("Invalid llm_mode. Use: direct or hybrid.", file=sys.stderr)
+            return 1
+    if key == "llm_threshold":
+        try:
+            threshold = float(value)
+        except ValueError:
+            threshold = -1.0
+        if not 0.0 <= threshold <= 1.0:
+            print("llm_threshold must be a number between 0 and 1.", file=sys.stderr)
+            return 1
+    if key == "github_protocol":
+        value = value.lower()
+        if value not in VALID_GITHUB_PROTOCOLS:
+            print("Invalid github_protocol. Use: https or ssh.", file=sys.stderr)
+            return 1
+    if key in ("github_api", "openai_base_url") and not value.startswith(("http://", "https://")):
+        print(f"{key} must be an http(s) URL.", file=sys.stderr)
+        return 1
+    if key == "fast_commit":
+        value = value.lower()
+        if value not in ("true", "false", "auto"):
+            print("fast_commit must be true, false, or auto.", file=sys.stderr)
+            return 1
+    if key == "llm_structured_output":
+        value = value.lower()
+        if value not in ("true", "false"):
+            print("llm_structured_output must be true or false.", file=sys.stderr)
+            return 1
+    if key == "push_queue":
+        value = value.lower()
+        if value not in ("true", "false"):
+            print("push_queue must be true or false.", file=sys.stderr)
+            return 1
+    if key == "pool_size" and not value.isdigit():
+        print("pool_size must be a non-negative integer.", file=sys.stderr)
+        return 1
+    if key in ("llm_key", "openai_key", "gemini_key") and not value:
+        print(f"{key} cannot be empty.", file=sys.stderr)
+        return 1
+    if key == "llm_chain" and value:
+        try:
+            tiers = parse_chain(value)
+        except ValueError as exc:
+            print(f"Invalid llm_chain: {exc}", file=sys.stderr)
+            return 1
+        value = ",".join(
+            tier.label + (f"@{tier.timeout:g}" if tier.timeout else "") for tier in tiers
+        )
+    if key == "roots":
+        try:
+            pairs = parse_roots(value)
+        except ValueError as exc:
+            print(f"Invalid roots: {exc}", file=sys.stderr)
+            return 1
+        names = [name for name, _ in pairs]
+        if len(set(names)) != len(names):
+            print("Root names must be unique.", file=sys.stderr)
+            return 1
+        value = ",".join(f"{name}={Path(path).expanduser()}" for name, path in pairs)
+    if key == "archive_root" and value and get_root(value) is None:
+        print(f"Unknown root: {value}. Add it with: citera set roots name=path,...", file=sys.stderr)
         return 1
-    if key == "root":
+    if key in ("root", "obsidian_vault"):
         if not value:
-            print("root cannot be empty.", file=sys.stderr)
+            print(f"{key} cannot be empty.", file=sys.stderr)
             return 1
         value = str(Path(value).expanduser())
     set_config_value(key, value)
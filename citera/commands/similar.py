@@ -0,0 +1,52 @@
+"""Handler for `citera similar`."""
+
+from __future__ import annotations
+
+import sys
+
+from ..core.index import refresh_index
+from ..core.locks import LockTimeout
+from ..core.paths import base_projects_path, ensure_base_structure
+from ..core.roots import find_project, root_for_path
+from ..core.similar import find_index_key, similar_projects
+
+
+def handle_similar(args: object) -> int:
+    """Print the projects most similar to the given id."""
+    project_id = str(getattr(args, "id", "")).strip()
+    top = getattr(args, "top", None)
+    top_k = 5 if top is None else int(top)
+    if top_k < 1:
+        print("--top must be a positive integer.", file=sys.stderr)
+        return 2
+    # Similarity is computed within the root that holds the project.
+    try:
+        found = find_project(project_id)
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    root = root_for_path(found) if found else None
+    base_path = root.path if root else base_projects_path()
+    ensure_base_structure(base_path)
+    try:
+        index = refresh_index(base_path)
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    key = find_index_key(index, project_id)
+    if key is None:
+        print(f"Project id not found: {project_id}", file=sys.stderr)
+        return 1
+    try:
+        results = similar_projects(base_path, index, key, top_k=top_k)
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    if not results:
+        print("No similar projects found.")
+        return 0
+    for match_key, score in results:
+        metadata = index["projects"][match_key].get("metadata", {})
+        name = metadata.get("name") or "-"
+        print(f"{score:.2f}  {metadata.get('id', match_key)}  ({match_key})  {name}")
+    return 0
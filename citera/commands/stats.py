@@ -0,0 +1,61 @@
+"""Handler for `citera stats`."""
+
+from __future__ import annotations
+
+from ..ai.usage import load_usage, model_price, reset_usage, usage_path
+
+
+def handle_stats(args: object) -> int:
+    """Report LLM token usage and estimated cost per provider and model."""
+    if getattr(args, "reset", False):
+        reset_usage()
+        print("✓ LLM usage ledger cleared.")
+        return 0
+
+    data = load_usage()
+    rows: list[tuple[str, str, dict]] = [
+        (provider, model, totals)
+        for provider, models in sorted(data["providers"].items())
+        for model, totals in sorted(models.items())
+    ]
+    if not rows:
+        print(f"No LLM usage recorded yet ({usage_path()}).")
+        return 0
+
+    print(f"LLM usage since {str(data.get('since') or '?')[:19].replace('T', ' ')} UTC")
+    headers = ("provider", "model", "requests", "prompt", "completion", "429s", "avg s", "cost $")
+    table = [headers]
+    total_cost = 0.0
+    unpriced = False
+    for provider, model, totals in rows:
+        requests = int(totals.get("requests", 0))
+        average = float(totals.get("latency", 0.0)) / requests if requests else 0.0
+        if model_price(model) is None:
+            cost = "-"
+            unpriced = True
+        else:
+            total_cost += float(totals.get("cost", 0.0))
+            cost = f"{float(totals.get('cost', 0.0)):.4f}"
+        table.append(
+            (
+                provider,
+                model,
+                str(requests),
+                str(int(totals.get("prompt_tokens", 0))),
+                str(int(totals.get("completion_tokens", 0))),
+                str(int(totals.get("throttled", 0))),
+                f"{average:.2f}",
+                cost,
+            )
+        )
+    widths = [max(len(row[column]) for row in table) for column in range(len(headers))]
+    for row in table:
+        # Names left-aligned, numbers right-aligned.
+        cells = [
+            f"{value:<{width}}" if column < 2 else f"{value:>{width}}"
+            for column, (value, width) in enumerate(zip(row, widths))
+        ]
+        print("  ".join(cells))
+    note = " (models without a known price excluded)" if unpriced else ""
+    print(f"\nEstimated cost: ${total_cost:.4f}{note}")
+    return 0
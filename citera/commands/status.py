@@ -0,0 +1,50 @@
+"""Handler for `citera status`."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from ..core.gitstatus import DEFAULT_GIT_WORKERS, check_repos, git_dir
+from ..core.locks import LockTimeout
+from ..core.roots import refresh_indexes
+from ..project import Inventory
+
+
+def handle_status(args: object) -> int:
+    """Report git health for every git-enabled project, streaming results."""
+    try:
+        indexes = refresh_indexes()
+    except LockTimeout as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    root_paths = {root.name: root.path for root, _ in indexes}
+    targets = []
+    missing = 0
+    for project in Inventory.from_indexes((root.name, index) for root, index in indexes):
+        project_path = root_paths[project.root] / project.key
+        if git_dir(project_path) is None:
+            if project.git_enabled:
+                missing += 1
+                print(f"✗ {project.id}: git enabled but no .git directory")
+            continue
+        targets.append((project.id, project_path, project.git_repo or ""))
+    if not targets:
+        print("No git repositories found.")
+        return 1 if missing else 0
+
+    only_problems = getattr(args, "problems", False)
+    workers = int(getattr(args, "jobs", None) or DEFAULT_GIT_WORKERS)
+    started = time.monotonic()
+    unhealthy = missing
+    for health in check_repos(targets, max_workers=workers):
+        issues = health.problems()
+        if issues:
+            unhealthy += 1
+            print(f"✗ {health.project_id}: {', '.join(issues)}")
+        elif not only_problems:
+            print(f"✓ {health.project_id}: clean ({health.branch})")
+        sys.stdout.flush()
+    elapsed = time.monotonic() - started
+    print(f"\n{len(targets)} repos checked in {elapsed:.1f}s; {unhealthy} need attention.")
+    return 1 if unhealthy else 0
@@ -0,0 +1,52 @@
+"""Handler for `citera worker`."""
+
+from __future__ import annotations
+
+import sys
+
+from ..core.pushqueue import (
+    DEFAULT_QUEUE_WORKERS,
+    PENDING,
+    acquire_worker,
+    drain_queue,
+    list_jobs,
+    release_worker,
+)
+
+
+def handle_worker(args: object) -> int:
+    """Drain the background push queue with retries and backoff."""
+    if not acquire_worker():
+        print("Another citera worker is already running.", file=sys.stderr)
+        return 1
+
+    def _report(job: dict, error: str | None) -> None:
+        name = job.get("project_id") or job["path"]
+        if error is None:
+            print(f"✓ Pushed {name}")
+        elif job["attempts"] >= job["max_attempts"]:
+            print(f"✗ {name}: {error} (giving up after {job['attempts']} attempts)")
+        else:
+            print(f"… {name}: {error} (attempt {job['attempts']}/{job['max_attempts']})")
+
+    succeeded = failed = 0
+    try:
+        while True:
+            drained = drain_queue(
+                max_workers=getattr(args, "jobs", None) or DEFAULT_QUEUE_WORKERS,
+                watch=bool(getattr(args, "watch", False)),
+                report=_report,
+            )
+            succeeded += drained[0]
+            failed += drained[1]
+            release_worker()
+            # A job queued while this worker was exiting saw it still running and
+            # started no other; take it on unless a new worker already has.
+            if not list_jobs(PENDING) or not acquire_worker():
+                break
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        release_worker()
+    print(f"Queue drained: {succeeded} pushed, {failed} failed.")
+    return 1 if failed else 0
@@ -0,0 +1,233 @@
+"""Pre-commit scan for heavy, generated, and binary paths that should not be committed."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .diskusage import HEAVY_DIRS, project_usage
+from .languages import detect_language
+from .snippets import BINARY_SNIFF_BYTES, is_binary
+from .walk import WalkEntry, walk_project
+
+LARGE_FILE_BYTES = 10 * 1024 * 1024
+BINARY_FILE_BYTES = 1024 * 1024
+GITIGNORE_HEADER = "# Added by citera"
+
+# Build output names that double as ordinary source folder names: they only count as
+# generated next to the manifest of a toolchain that writes them.
+BUILD_OUTPUT_MARKERS = {
+    "build": (
+        "setup.py",
+        "pyproject.toml",
+        "package.json",
+        "CMakeLists.txt",
+        "build.gradle",
+        "build.gradle.kts",
+    ),
+    "dist": ("setup.py", "pyproject.toml", "package.json"),
+    "target": ("Cargo.toml", "pom.xml", "build.sbt"),
+    "coverage": ("package.json",),
+}
+
+ARTIFACT_DIRS = (HEAVY_DIRS - set(BUILD_OUTPUT_MARKERS)) | {
+    ".ipynb_checkpoints",
+    ".parcel-cache",
+    ".ruff_cache",
+    ".eggs",
+    "htmlcov",
+}
+
+# Dependency directories imply a language even when no sources sit next to them.
+DIR_LANGUAGE = {"node_modules": "javascript", ".venv": "python", "venv": "python"}
+
+COMMON_GITIGNORE = [".DS_Store", "Thumbs.db", ".env"]
+LANGUAGE_GITIGNORE = {
+    "python": [
+        "__pycache__/",
+        "*.py[cod]",
+        ".venv/",
+        "venv/",
+        "*.egg-info/",
+        ".pytest_cache/",
+        ".mypy_cache/",
+        "/dist/",
+        "/build/",
+    ],
+    "jupyter": [".ipynb_checkpoints/"],
+    "javascript": ["node_modules/", "/dist/", ".next/", "/coverage/", "*.log"],
+    "typescript": ["node_modules/", "/dist/", ".next/", "/coverage/", "*.tsbuildinfo"],
+    "rust": ["/target/"],
+    "java": ["/target/", "/build/", ".gradle/", "*.class"],
+    "kotlin": ["/build/", ".gradle/", "*.class"],
+    "csharp": ["/bin/", "/obj/"],
+    "cpp": ["/build/", "*.o", "*.so"],
+    "c": ["/build/", "*.o", "*.so"],
+}
+
+
+@dataclass
+class Exclusion:
+    pattern: str
+    reason: str
+    size: int
+
+
+@dataclass
+class ArtifactReport:
+    exclusions: list[Exclusion] = field(default_factory=list)
+    languages: set[str] = field(default_factory=set)
+
+    @property
+    def excluded_bytes(self) -> int:
+        return sum(item.size for item in self.exclusions)
+
+
+def scan_artifacts(
+    project_path: Path,
+    large_file_bytes: int = LARGE_FILE_BYTES,
+    binary_file_bytes: int = BINARY_FILE_BYTES,
+) -> ArtifactReport:
+    """Find paths not yet ignored that would bloat a commit.
+
+    Directories named in `ARTIFACT_DIRS`, virtualenvs under any name, and
+    `*.egg-info` are excluded whole, as are `BUILD_OUTPUT_MARKERS` names sitting
+    next to one of their manifests; files are excluded above `large_file_bytes`,
+    or above `binary_file_bytes` when their content is binary. Paths git
+    already tracks are never excluded.
+    """
+    report = ArtifactReport()
+    skipped_dirs: list[WalkEntry] = []
+    tracked_files, tracked_dirs = _tracked_paths(project_path)
+
+    def _on_skip(item: WalkEntry) -> None:
+        if item.entry.name != ".git" and item.relative not in tracked_dirs:
+            skipped_dirs.append(item)
+
+    def _prune(item: WalkEntry) -> bool:
+        name = item.entry.name
+        if item.relative in tracked_dirs:
+            return False
+        if name in ARTIFACT_DIRS:
+            return True
+        parent = os.path.dirname(item.entry.path)
+        markers = BUILD_OUTPUT_MARKERS.get(name, ())
+        return any(os.path.isfile(os.path.join(parent, marker)) for marker in markers)
+
+    excluded_prefixes: list[str] = []
+    for item in walk_project(project_path, on_skip=_on_skip, prune=_prune):
+        relative = item.relative
+        if any(relative.startswith(prefix) for prefix in excluded_prefixes):
+            continue
+        parent = relative.rsplit("/", 1)[0] if "/" in relative else ""
+        if parent not in tracked_dirs and (
+            item.entry.name == "pyvenv.cfg" or parent.endswith(".egg-info")
+        ):
+            reason = "virtualenv" if item.entry.name == "pyvenv.cfg" else "build metadata"
+            if parent:
+                excluded_prefixes.append(parent + "/")
+                size, _, _ = project_usage(project_path / parent, {})
+                report.exclusions.append(Exclusion(f"/{parent}/", reason, size))
+                report.languages.add("python")
+            continue
+        language = detect_language(item.entry.name)
+        if language:
+            report.languages.add(language)
+        if relative in tracked_files:
+            continue
+        try:
+            size = item.entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        if size >= large_file_bytes:
+            report.exclusions.append(Exclusion(f"/{relative}", "large file", size))
+        elif size >= binary_file_bytes and _looks_binary(item.entry.path):
+            report.exclusions.append(Exclusion(f"/{relative}", "binary", size))
+
+    # Unambiguous generated directories are ignored by name at any depth, like the
+    # templates do; build outputs are anchored to the folder that had the manifest.
+    generated: dict[str, int] = {}
+    for item in skipped_dirs:
+        if any(item.relative.startswith(prefix) for prefix in excluded_prefixes):
+            continue
+        size, _, _ = project_usage(Path(item.entry.path), {})
+        name = item.entry.name
+        pattern = f"/{item.relative}/" if name in BUILD_OUTPUT_MARKERS else f"{name}/"
+        generated[pattern] = generated.get(pattern, 0) + size
+        if name in DIR_LANGUAGE:
+            report.languages.add(DIR_LANGUAGE[name])
+    for pattern, size in generated.items():
+        report.exclusions.append(Exclusion(pattern, "generated", size))
+    report.exclusions.sort(key=lambda item: -item.size)
+    return report
+
+
+def gitignore_additions(project_path: Path, report: ArtifactReport) -> list[str]:
+    """Patterns for the detected languages and exclusions missing from `.gitignore`."""
+    existing = set()
+    gitignore = project_path / ".gitignore"
+    if gitignore.exists():
+        existing = {
+            line.strip() for line in gitignore.read_text(encoding="utf-8").splitlines()
+        }
+    excluded = {item.pattern for item in report.exclusions}
+    wanted: list[str] = list(COMMON_GITIGNORE)
+    for language in sorted(report.languages):
+        for pattern in LANGUAGE_GITIGNORE.get(language, []):
+            # A template's top-level build folder that exists but was not found to
+            # be generated (tracked, or no manifest beside it) is real source.
+            anchored_dir = pattern.startswith("/") and pattern.endswith("/")
+            if anchored_dir and pattern not in excluded and (project_path / pattern[1:-1]).is_dir():
+                continue
+            wanted.append(pattern)
+    wanted.extend(item.pattern for item in report.exclusions)
+    additions: list[str] = []
+    for pattern in wanted:
+        if pattern in existing or pattern.lstrip("/") in existing or pattern in additions:
+            continue
+        additions.append(pattern)
+    return additions
+
+
+def extend_gitignore(project_path: Path, additions: list[str]) -> None:
+    if not additions:
+        return
+    gitignore = project_path / ".gitignore"
+    content = gitignore.read_text(encoding="utf-8") if gitignore.exists() else ""
+    if content and not content.endswith("\n"):
+        content += "\n"
+    if content:
+        content += "\n"
+    content += GITIGNORE_HEADER + "\n" + "".join(f"{pattern}\n" for pattern in additions)
+    gitignore.write_text(content, encoding="utf-8")
+
+
+def _tracked_paths(project_path: Path) -> tuple[set[str], set[str]]:
+    """Files git already tracks, and every folder holding one of them."""
+    if not (project_path / ".git").exists():
+        return set(), set()
+    try:
+        output = subprocess.run(
+            ["git", "ls-files", "-z"], cwd=project_path, check=True, capture_output=True
+        ).stdout.decode("utf-8", errors="surrogateescape")
+    except (OSError, subprocess.CalledProcessError):
+        return set(), set()
+    files = {path for path in output.split("\0") if path}
+    folders: set[str] = set()
+    for path in files:
+        while "/" in path:
+            path = path.rsplit("/", 1)[0]
+            if path in folders:
+                break
+            folders.add(path)
+    return files, folders
+
+
+def _looks_binary(path: str) -> bool:
+    try:
+        with open(path, "rb") as handle:
+            return is_binary(handle.read(BINARY_SNIFF_BYTES))
+    except OSError:
+        return False
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
+from pathlib import Path
 
-from .env import get_env_value
+from .env import get_env_value, load_env_file
 
 DEFAULT_STAGE_ROLES = ("playground", "incubator", "product", "tool", "archive")
 
@@ -83,6 +85,39 @@ LANG_STARTERS = {
     "rust": ("main.rs", "fn main() {\n    println!(\"Hello from citera\");\n}\n"),
 }
 
+# Languages whose template includes a ready-to-run environment (see core.envpool).
+LANG_ENVIRONMENTS = {
+    "python": "venv",
+    "js": "node",
+    "javascript": "node",
+}
+
+ENV_TEMPLATE_FILES = {
+    "venv": {
+        ".gitignore": ".venv/\n__pycache__/\n",
+        "requirements.txt": "",
+    },
+    "node": {
+        ".gitignore": "node_modules/\n",
+        "package.json": (
+            "{{\n"
+            "  \"name\": \"{name}\",\n"
+            "  \"version\": \"0.1.0\",\n"
+            "  \"private\": true,\n"
+            "  \"main\": \"main.js\",\n"
+            "  \"scripts\": {{\n"
+            "    \"start\": \"node main.js\"\n"
+            "  }}\n"
+            "}}\n"
+        ),
+    },
+}
+
+DEFAULT_POOL_PACKAGES = {
+    "venv": ["pytest"],
+    "node": [],
+}
+
 
 @lru_cache
 def stage_names() -> dict[str, str]:
@@ -106,6 +141,25 @@ def stage_dirs() -> dict[str, str]:
     return dirs
 
 
+@lru_cache
+def root_stage_dirs(base_path: Path) -> dict[str, str]:
+    """Stage directories for one projects root.
+
+    A `.env` at the root overrides the shared settings for that root only;
+    variables set in the process environment still win.
+    """
+    dirs = dict(stage_dirs())
+    env_file = base_path / ".env"
+    if env_file.is_file():
+        values = load_env_file(env_file)
+        for role in DEFAULT_STAGE_ROLES:
+            key = f"CITERA_STAGE_DIR_{role.upper()}"
+            value = values.get(key)
+            if value and key not in os.environ:
+                dirs[role] = value.strip()
+    return dirs
+
+
 def stage_label(role: str) -> str:
     return stage_names()[role]
 
@@ -2,67 +2,76 @@
 
 from __future__ import annotations
 
+import heapq
 import os
 from pathlib import Path
 
+from .languages import (
+    EXTENSION_LANGUAGE,
+    LanguageTally,
+    is_vendored,
+    language_percentages,
+)
+from .manifests import read_manifests
 from .metadata import parse_project_metadata
+from .snippets import extract_snippet
+from .tree import TreeSummary
+from .walk import walk_project
 
-EXTENSION_LANGUAGE = {
-    ".py": "python",
-    ".js": "javascript",
-    ".ts": "typescript",
-    ".rs": "rust",
-    ".go": "go",
-    ".java": "java",
-    ".rb": "ruby",
-    ".php": "php",
-    ".cs": "csharp",
-    ".cpp": "cpp",
-    ".c": "c",
-    ".h": "c",
-    ".html": "html",
-    ".css": "css",
-    ".json": "json",
-}
-
-SKIP_DIRS = {".git", ".venv", "__pycache__", "node_modules", ".mypy_cache"}
 SKIP_FILES = {"project.yaml"}
+FILE_LIMIT = 100
 SNIPPET_LIMIT = 8
 SNIPPET_CHARS = 2000
 
 
 def collect_project_context(project_path: Path) -> dict:
-    """Build a shallow context summary without reading full code."""
-    files: list[str] = []
-    languages: set[str] = set()
-    snippets: list[dict[str, str]] = []
+    """Build a shallow context summary without reading full code.
+
+    One walk feeds the bounded tree outline, the language breakdown, and the
+    file sample, which keeps the shallowest `FILE_LIMIT` files rather than the
+    first ones walked.
+    """
+    summary = TreeSummary()
+    tally = LanguageTally()
 
-    for root, dirnames, filenames in os.walk(project_path):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-        for filename in filenames:
-            if len(files) >= 300:
-                break
-            if filename in SKIP_FILES:
+    def _walk_files():
+        for item in walk_project(project_path):
+            try:
+                size = item.entry.stat(follow_symlinks=False).st_size
+                is_file = item.entry.is_file(follow_symlinks=False)
+            except OSError:
                 continue
-            path = Path(root) / filename
-            relative = str(path.relative_to(project_path))
-            files.append(relative)
-            ext = path.suffix.lower()
-            language = EXTENSION_LANGUAGE.get(ext)
-            if language:
-                languages.add(language)
-            if len(snippets) < SNIPPET_LIMIT and ext in EXTENSION_LANGUAGE:
-                snippet = _read_snippet(path)
-                if snippet:
-                    snippets.append({"path": relative, "snippet": snippet})
-        if len(files) >= 300:
+            summary.add(item.relative, size)
+            if is_file and not is_vendored(item.relative):
+                tally.add(item.entry.name, size)
+            if item.entry.name not in SKIP_FILES:
+                yield item.depth, item.relative, item.entry.path
+
+    selected = heapq.nsmallest(FILE_LIMIT, _walk_files())
+    files = [relative for _, relative, _ in selected]
+    snippets: list[dict[str, str]] = []
+    for _, relative, path in selected:
+        if len(snippets) >= SNIPPET_LIMIT:
             break
+        if os.path.splitext(relative)[1].lower() not in EXTENSION_LANGUAGE:
+            continue
+        snippet = extract_snippet(Path(path), SNIPPET_CHARS)
+        if snippet:
+            snippets.append({"path": relative, "snippet": snippet})
 
+    language_stats = tally.stats()
+    percentages = language_percentages(language_stats)
     notes = _read_notes(project_path)
     stage = _read_stage(project_path)
     return {
+        "tree": summary.render(),
         "files": files,
-        "languages": sorted(languages) or ["unknown"],
+        "languages": list(language_stats) or ["unknown"],
+        "language_stats": {
+            language: dict(item, percent=percentages[language])
+            for language, item in language_stats.items()
+        },
+        "manifests": read_manifests(project_path),
         "notes": notes,
         "stage": stage,
         "snippets": snippets,
@@ -77,16 +86,6 @@ def _read_notes(project_path: Path) -> str | None:
     return content.strip()[:1000] if content else None
 
 
-def _read_snippet(path: Path) -> str | None:
-    try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return None
-    if not content.strip():
-        return None
-    return content.strip()[:SNIPPET_CHARS]
-
-
 def _read_stage(project_path: Path) -> str:
     project_yaml = project_path / "project.yaml"
     if not project_yaml.exists():
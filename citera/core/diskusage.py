@@ -0,0 +1,132 @@
+"""Disk usage accounting with per-directory cached subtotals."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .index import index_dir
+
+DU_CACHE_FILE = "du.json"
+DU_CACHE_VERSION = 1
+DU_MAX_WORKERS = 16
+
+HEAVY_DIRS = {
+    ".venv",
+    "venv",
+    "node_modules",
+    "target",
+    "build",
+    "dist",
+    ".next",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".gradle",
+    ".tox",
+}
+
+
+def load_du_cache(base_path: Path) -> dict:
+    path = index_dir(base_path) / DU_CACHE_FILE
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != DU_CACHE_VERSION:
+        return {}
+    return data.get("dirs", {})
+
+
+def save_du_cache(base_path: Path, dirs: dict) -> None:
+    path = index_dir(base_path) / DU_CACHE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    payload = {"version": DU_CACHE_VERSION, "dirs": dirs}
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def project_usage(project_path: Path, cache: dict) -> tuple[int, dict[str, int], dict]:
+    """Return (total bytes, heavy dir sizes by relative path, fresh cache entries).
+
+    A directory's own file bytes and subdirectory names are reused from `cache`
+    while its mtime is unchanged, so only directories whose entries changed are
+    listed again. In-place edits that keep the directory mtime are not seen;
+    rescan without the cache to pick those up.
+    """
+    fresh: dict[str, list] = {}
+    heavy: dict[str, int] = {}
+    total = _directory_total(str(project_path), str(project_path), cache, fresh, heavy)
+    return total, heavy, fresh
+
+
+def scan_projects(
+    project_paths: list[Path], cache: dict, max_workers: int = DU_MAX_WORKERS
+) -> tuple[dict[Path, tuple[int, dict[str, int]]], dict]:
+    """Measure projects in parallel; returns per-project results and the merged cache."""
+    results: dict[Path, tuple[int, dict[str, int]]] = {}
+    merged: dict[str, list] = {}
+    if not project_paths:
+        return results, merged
+    workers = max(1, min(max_workers, len(project_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {path: executor.submit(project_usage, path, cache) for path in project_paths}
+        for path, future in futures.items():
+            total, heavy, fresh = future.result()
+            results[path] = (total, heavy)
+            merged.update(fresh)
+    return results, merged
+
+
+def _directory_total(
+    root: str, path: str, cache: dict, fresh: dict, heavy: dict[str, int]
+) -> int:
+    try:
+        mtime = os.stat(path, follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return 0
+    cached = cache.get(path)
+    if cached and cached[0] == mtime:
+        own, subdirs = cached[1], cached[2]
+    else:
+        own, subdirs = _list_directory(path)
+    fresh[path] = [mtime, own, subdirs]
+    total = own
+    for name in subdirs:
+        child = os.path.join(path, name)
+        child_total = _directory_total(root, child, cache, fresh, heavy)
+        if name in HEAVY_DIRS:
+            heavy[os.path.relpath(child, root)] = child_total
+        total += child_total
+    return total
+
+
+def _list_directory(path: str) -> tuple[int, list[str]]:
+    own = 0
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    own += _disk_bytes(entry.stat(follow_symlinks=False))
+                except OSError:
+                    continue
+    except OSError:
+        return 0, []
+    return own, sorted(subdirs)
+
+
+def _disk_bytes(stat_result: os.stat_result) -> int:
+    """Allocated bytes where the platform reports blocks, apparent size otherwise."""
+    blocks = getattr(stat_result, "st_blocks", None)
+    if blocks is None:
+        return stat_result.st_size
+    return blocks * 512
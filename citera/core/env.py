@@ -30,7 +30,7 @@ def _candidate_env_paths() -> list[Path]:
     return paths
 
 
-def _load_env_file(path: Path) -> dict[str, str]:
+def load_env_file(path: Path) -> dict[str, str]:
     data: dict[str, str] = {}
     for line in path.read_text(encoding="utf-8").splitlines():
         stripped = line.strip()
@@ -53,7 +53,7 @@ def load_env() -> dict[str, str]:
     data: dict[str, str] = {}
     for path in _candidate_env_paths():
         if path.exists():
-            data.update(_load_env_file(path))
+            data.update(load_env_file(path))
     return data
 
 
@@ -0,0 +1,237 @@
+"""Pool of pre-built environments (venvs, node_modules) for instant `citera new`."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from .constants import DEFAULT_POOL_PACKAGES, ENV_TEMPLATE_FILES
+from .index import index_dir
+from .locks import pid_alive
+
+POOL_DIR = "pool"
+DEFAULT_POOL_SIZE = 2
+BUILDING_PREFIX = ".building-"
+CLAIMED_PREFIX = ".claimed-"
+# Records the building process inside each `.building-*` directory.
+BUILDER_FILE = ".builder"
+# No build takes this long; older in-progress entries are leftovers of a killed process.
+STALE_BUILD_SECONDS = 3600
+
+# Files each environment kind moves into the project on claim.
+ENV_PAYLOAD = {
+    "venv": (".venv",),
+    "node": ("node_modules", "package.json", "package-lock.json"),
+}
+
+
+def pool_root(base_path: Path, kind: str) -> Path:
+    # Kept under the projects root so claiming is a same-filesystem rename.
+    return index_dir(base_path) / POOL_DIR / kind
+
+
+def pool_packages(kind: str, config: dict) -> list[str]:
+    """Baseline packages for `kind`, overridable via `pool_<kind>_packages` config."""
+    raw = config.get(f"pool_{kind}_packages")
+    if raw is None:
+        return list(DEFAULT_POOL_PACKAGES.get(kind, []))
+    return [item.strip() for item in str(raw).split(",") if item.strip()]
+
+
+def pool_size(config: dict) -> int:
+    try:
+        return max(0, int(config.get("pool_size") or DEFAULT_POOL_SIZE))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def environment_spec(kind: str, packages: list[str]) -> str:
+    """Short hash identifying what an environment contains (stale entries never match)."""
+    runtime = sys.version if kind == "venv" else (shutil.which("node") or "")
+    payload = json.dumps([kind, sorted(packages), sys.executable, runtime])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def ready_entries(base_path: Path, kind: str, spec: str) -> list[Path]:
+    root = pool_root(base_path, kind)
+    if not root.exists():
+        return []
+    return sorted(child for child in root.iterdir() if child.name.startswith(f"{spec}-"))
+
+
+def claim_environment(base_path: Path, kind: str, spec: str, destination: Path) -> bool:
+    """Move a ready environment into `destination`; False when the pool is empty.
+
+    The entry is first renamed to a private name, so two concurrent claims can
+    never take the same environment.
+    """
+    for entry in ready_entries(base_path, kind, spec):
+        claimed = entry.with_name(f"{CLAIMED_PREFIX}{os.getpid()}-{entry.name}")
+        try:
+            os.rename(entry, claimed)
+        except OSError:
+            continue
+        for name in ENV_PAYLOAD[kind]:
+            source = claimed / name
+            if source.exists():
+                os.rename(source, destination / name)
+        if kind == "venv":
+            # Scripts carry the path the venv was created at, not the pool path.
+            relocate_venv(destination / ".venv", _building_path(entry) / ".venv")
+        else:
+            _rename_package(destination / "package.json", destination.name)
+        shutil.rmtree(claimed, ignore_errors=True)
+        return True
+    return False
+
+
+def filling(base_path: Path, kind: str) -> bool:
+    """True while some live process is building an environment of `kind`."""
+    root = pool_root(base_path, kind)
+    if not root.exists():
+        return False
+    return any(
+        child.name.startswith(BUILDING_PREFIX) and not _abandoned(child)
+        for child in root.iterdir()
+    )
+
+
+def build_environment(base_path: Path, kind: str, packages: list[str], spec: str) -> Path:
+    """Build one environment in a private directory, then publish it atomically."""
+    root = pool_root(base_path, kind)
+    root.mkdir(parents=True, exist_ok=True)
+    name = f"{spec}-{uuid.uuid4().hex[:12]}"
+    ready = root / name
+    building = _building_path(ready)
+    building.mkdir()
+    try:
+        (building / BUILDER_FILE).write_text(str(os.getpid()), encoding="utf-8")
+        if kind == "venv":
+            subprocess.run([sys.executable, "-m", "venv", ".venv"], cwd=building, check=True)
+            if packages:
+                pip = building / ".venv" / ("Scripts" if os.name == "nt" else "bin") / "pip"
+                subprocess.run(
+                    [str(pip), "install", "--quiet", "--disable-pip-version-check", *packages],
+                    cwd=building,
+                    check=True,
+                )
+        elif kind == "node":
+            npm = shutil.which("npm")
+            if not npm:
+                raise RuntimeError("npm not found on PATH; cannot build node environments.")
+            template = ENV_TEMPLATE_FILES["node"]["package.json"].format(name="citera-pool")
+            (building / "package.json").write_text(template, encoding="utf-8")
+            if packages:
+                subprocess.run(
+                    [npm, "install", "--silent", "--no-audit", "--no-fund", *packages],
+                    cwd=building,
+                    check=True,
+                )
+            (building / "node_modules").mkdir(exist_ok=True)
+        else:
+            raise RuntimeError(f"Unknown environment kind: {kind}")
+    except Exception:
+        shutil.rmtree(building, ignore_errors=True)
+        raise
+    os.rename(building, ready)
+    return ready
+
+
+def fill_pool(base_path: Path, kind: str, packages: list[str], size: int) -> int:
+    """Top the pool up to `size` ready environments and drop stale ones.
+
+    Leftovers of killed builds and claims are removed too, so an interrupted
+    refill never blocks later ones.
+    """
+    spec = environment_spec(kind, packages)
+    root = pool_root(base_path, kind)
+    if root.exists():
+        for child in root.iterdir():
+            if child.name.startswith((BUILDING_PREFIX, CLAIMED_PREFIX)):
+                if not _abandoned(child):
+                    continue
+            elif child.name.startswith(f"{spec}-"):
+                continue
+            shutil.rmtree(child, ignore_errors=True)
+    built = 0
+    while len(ready_entries(base_path, kind, spec)) < size:
+        build_environment(base_path, kind, packages, spec)
+        built += 1
+    return built
+
+
+def spawn_refill(lang: str) -> None:
+    """Refill the pool for `lang` in a detached background process."""
+    subprocess.Popen(
+        [sys.executable, "-m", "citera", "pool", "fill", "--lang", lang],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def relocate_venv(venv_path: Path, old_path: Path) -> None:
+    """Rewrite absolute paths baked into a moved venv (activate scripts, shebangs)."""
+    old = str(old_path).encode("utf-8")
+    new = str(venv_path).encode("utf-8")
+    candidates = [venv_path / "pyvenv.cfg"]
+    for scripts in ("bin", "Scripts"):
+        folder = venv_path / scripts
+        if folder.is_dir():
+            candidates.extend(child for child in folder.iterdir() if child.is_file())
+    for path in candidates:
+        if path.is_symlink():
+            continue
+        try:
+            content = path.read_bytes()
+        except OSError:
+            continue
+        if old not in content or b"\0" in content[:8192]:
+            continue
+        content = content.replace(old, new)
+        first_line, newline, rest = content.partition(b"\n")
+        interpreter = first_line[2:].strip()
+        if first_line.startswith(b"#!") and b" " in interpreter:
+            # Shebangs cannot hold spaces; use the same sh trampoline pip emits.
+            first_line = b"#!/bin/sh\n'''exec' \"" + interpreter + b"\" \"$0\" \"$@\"\n' '''"
+        path.write_bytes(first_line + newline + rest)
+
+
+def _abandoned(path: Path) -> bool:
+    """Whether an in-progress build or claim belongs to a process that is gone."""
+    if path.name.startswith(CLAIMED_PREFIX):
+        # `.claimed-<pid>-<entry>`
+        pid_text = path.name[len(CLAIMED_PREFIX) :].split("-", 1)[0]
+    else:
+        try:
+            pid_text = (path / BUILDER_FILE).read_text(encoding="utf-8").strip()
+        except OSError:
+            pid_text = ""
+    if pid_text.isdigit() and not pid_alive(int(pid_text)):
+        return True
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return False
+    return age > STALE_BUILD_SECONDS
+
+
+def _building_path(ready: Path) -> Path:
+    return ready.with_name(f"{BUILDING_PREFIX}{ready.name}")
+
+
+def _rename_package(package_path: Path, name: str) -> None:
+    try:
+        package = json.loads(package_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return
+    package["name"] = name
+    package_path.write_text(json.dumps(package, indent=2) + "\n", encoding="utf-8")
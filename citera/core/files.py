@@ -0,0 +1,21 @@
+"""Small file helpers shared by the search and similarity indexes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def read_head(path: Path, limit: int) -> str | None:
+    """First `limit` bytes of a file as text, or None when it cannot be read."""
+    try:
+        with path.open("rb") as handle:
+            return handle.read(limit).decode("utf-8", errors="ignore")
+    except OSError:
+        return None
+
+
+def mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
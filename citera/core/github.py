@@ -0,0 +1,220 @@
+"""GitHub REST backend over a pooled keep-alive HTTP connection."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from .. import __version__
+
+DEFAULT_GITHUB_API = "https://api.github.com"
+GITHUB_TIMEOUT = 30
+# Longest we will sleep for a rate-limit reset before giving up.
+RATE_LIMIT_MAX_WAIT = 60
+# Safe to replay when the server may already have processed the first attempt.
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+
+
+class GitHubError(RuntimeError):
+    """A GitHub API request failed."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class GitHubConnectionError(GitHubError):
+    """The connection failed; `request_sent` means the server may have acted on it."""
+
+    def __init__(self, message: str, request_sent: bool = False) -> None:
+        super().__init__(message)
+        self.request_sent = request_sent
+
+
+@dataclass
+class GitHubClient:
+    """Minimal GitHub REST client; one connection is reused for every request."""
+
+    token: str
+    api_base: str = DEFAULT_GITHUB_API
+    timeout: float = GITHUB_TIMEOUT
+    rate_remaining: int | None = None
+    rate_reset: float | None = None
+    _connection: http.client.HTTPConnection | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def create_repo(self, name: str, private: bool = True, description: str | None = None) -> dict:
+        """Create a repo for the authenticated user; the response carries its URLs."""
+        body: dict[str, object] = {"name": name, "private": private}
+        if description:
+            body["description"] = description
+        try:
+            return self.request("POST", "/user/repos", body)
+        except GitHubConnectionError as exc:
+            if not exc.request_sent:
+                raise
+            # The repo may exist already; creating it again would fail or duplicate it.
+            existing = self.find_own_repo(name)
+            if existing is not None:
+                return existing
+            return self.request("POST", "/user/repos", body)
+
+    def find_own_repo(self, name: str) -> dict | None:
+        """The authenticated user's repo called `name`, or None when it does not exist."""
+        login = self.request("GET", "/user").get("login")
+        try:
+            return self.request("GET", f"/repos/{login}/{name}")
+        except GitHubError as exc:
+            if exc.status == 404:
+                return None
+            raise
+
+    def request(self, method: str, path: str, body: dict | None = None) -> dict:
+        with self._lock:
+            self._wait_for_rate_limit()
+            status, headers, payload = self._send(method, path, body)
+            self._record_rate_limit(headers)
+            if status in (403, 429) and self._rate_limited(headers):
+                self._wait_for_rate_limit(headers.get("retry-after"))
+                status, headers, payload = self._send(method, path, body)
+                self._record_rate_limit(headers)
+        if status >= 400:
+            raise GitHubError(_error_message(status, payload), status)
+        return payload
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _send(self, method: str, path: str, body: dict | None) -> tuple[int, dict, dict]:
+        url = urlsplit(self.api_base)
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": f"citera/{__version__}",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if data is not None:
+            headers["Content-Type"] = "application/json"
+        target = url.path.rstrip("/") + path
+        # A pooled connection may have been closed by the server. Retry once on a
+        # fresh one when nothing reached the server, or when replaying is harmless.
+        for attempt in range(2):
+            reused = self._connection is not None
+            connection = self._connect(url)
+            sent = False
+            try:
+                connection.request(method, target, body=data, headers=headers)
+                sent = True
+                response = connection.getresponse()
+                raw = response.read()
+                break
+            except (OSError, http.client.HTTPException) as exc:
+                self.close()
+                retry = reused and not attempt and (not sent or method in IDEMPOTENT_METHODS)
+                if retry:
+                    continue
+                if sent:
+                    raise GitHubConnectionError(
+                        f"No response from {self.api_base} to {method} {path}: {exc!r}",
+                        request_sent=True,
+                    ) from exc
+                raise GitHubConnectionError(f"Cannot reach {self.api_base}: {exc!r}") from exc
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+        try:
+            payload = json.loads(raw.decode("utf-8")) if raw else {}
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            payload = {"message": raw[:200].decode("utf-8", errors="replace")}
+        return response.status, response_headers, payload
+
+    def _connect(self, url) -> http.client.HTTPConnection:
+        if self._connection is None:
+            if url.scheme == "http":
+                self._connection = http.client.HTTPConnection(url.netloc, timeout=self.timeout)
+            else:
+                self._connection = http.client.HTTPSConnection(url.netloc, timeout=self.timeout)
+        return self._connection
+
+    def _record_rate_limit(self, headers: dict) -> None:
+        if "x-ratelimit-remaining" in headers:
+            self.rate_remaining = _to_int(headers["x-ratelimit-remaining"])
+        if "x-ratelimit-reset" in headers:
+            self.rate_reset = _to_int(headers["x-ratelimit-reset"])
+
+    def _rate_limited(self, headers: dict) -> bool:
+        return "retry-after" in headers or headers.get("x-ratelimit-remaining") == "0"
+
+    def _wait_for_rate_limit(self, retry_after: str | None = None) -> None:
+        if retry_after is not None:
+            delay = float(_to_int(retry_after) or 1)
+        elif self.rate_remaining == 0 and self.rate_reset:
+            delay = self.rate_reset - time.time() + 1
+        else:
+            return
+        if delay > RATE_LIMIT_MAX_WAIT:
+            raise GitHubError(f"GitHub rate limit exhausted; resets in {int(delay)}s.", 403)
+        if delay > 0:
+            time.sleep(delay)
+        self.rate_remaining = None
+
+
+_CLIENTS: dict[tuple[str, str], GitHubClient] = {}
+
+
+def github_token(config: dict) -> str | None:
+    """Token from `github_token` config, then GITHUB_TOKEN / GH_TOKEN."""
+    for value in (
+        config.get("github_token"),
+        os.environ.get("GITHUB_TOKEN"),
+        os.environ.get("GH_TOKEN"),
+    ):
+        if value and str(value).strip():
+            return str(value).strip()
+    return None
+
+
+def github_client(config: dict) -> GitHubClient | None:
+    """Shared client for the configured API, or None when no token is available."""
+    token = github_token(config)
+    if not token:
+        return None
+    api_base = str(config.get("github_api") or DEFAULT_GITHUB_API).rstrip("/")
+    key = (api_base, token)
+    if key not in _CLIENTS:
+        _CLIENTS[key] = GitHubClient(token=token, api_base=api_base)
+    return _CLIENTS[key]
+
+
+def remote_url(repo: dict, protocol: str | None = None) -> str:
+    """Pick the clone URL for `protocol` (https by default, or ssh)."""
+    if (protocol or "").lower() == "ssh" and repo.get("ssh_url"):
+        return str(repo["ssh_url"])
+    return str(repo.get("clone_url") or repo.get("html_url") or "")
+
+
+def _error_message(status: int, payload: dict) -> str:
+    message = str(payload.get("message") or f"HTTP {status}")
+    details = [
+        str(error.get("message") or error.get("code"))
+        for error in payload.get("errors", [])
+        if isinstance(error, dict)
+    ]
+    if details:
+        message += f" ({'; '.join(details)})"
+    return f"GitHub API error {status}: {message}"
+
+
+def _to_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
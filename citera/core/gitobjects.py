@@ -0,0 +1,265 @@
+"""In-process commit builder: hashes and compresses blobs across a process pool."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import stat
+import struct
+import subprocess
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+FAST_COMMIT_MIN_FILES = 2000
+HASH_BATCH_FILES = 64
+VERIFY_SAMPLE_FILES = 256
+# Level 1 trades a slightly larger loose object for much faster compression;
+# `git gc` repacks everything at the configured level later.
+LOOSE_COMPRESSION_LEVEL = 1
+
+MODE_FILE = 0o100644
+MODE_EXECUTABLE = 0o100755
+MODE_SYMLINK = 0o120000
+MODE_TREE = 0o40000
+
+
+class FastCommitUnsupported(RuntimeError):
+    """The repository uses a feature the builder does not replicate (filters, hooks, ...)."""
+
+
+def commit_worktree(
+    project_path: Path,
+    message: str,
+    max_workers: int | None = None,
+    min_files: int = 0,
+) -> str | None:
+    """Commit every non-ignored file like `git add -A && git commit`, in parallel.
+
+    Returns the new commit id, or None when the builder does not apply (fewer
+    than `min_files`, filters or hooks configured, nested repositories) or when
+    the result fails verification against git; in that case the ref and index
+    are rolled back so the caller can fall back to plain git.
+    """
+    git_dir = project_path / ".git"
+    try:
+        _check_supported(project_path)
+        paths = _worktree_paths(project_path)
+    except FastCommitUnsupported:
+        return None
+    if len(paths) < max(1, min_files):
+        return None
+
+    parent = _git(project_path, "rev-parse", "-q", "--verify", "HEAD", check=False) or None
+    author = _git(project_path, "var", "GIT_AUTHOR_IDENT")
+    committer = _git(project_path, "var", "GIT_COMMITTER_IDENT")
+
+    batches = [paths[i : i + HASH_BATCH_FILES] for i in range(0, len(paths), HASH_BATCH_FILES)]
+    entries: list[tuple[str, int, bytes, tuple]] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for batch in executor.map(
+            _hash_batch, [(str(project_path), str(git_dir), batch) for batch in batches]
+        ):
+            entries.extend(batch)
+    entries.sort(key=lambda item: os.fsencode(item[0]))
+
+    tree = _write_tree(git_dir, entries)
+    lines = [f"tree {tree}"]
+    if parent:
+        lines.append(f"parent {parent}")
+    lines += [f"author {author}", f"committer {committer}", "", message]
+    commit = _write_object(git_dir, b"commit", ("\n".join(lines) + "\n").encode("utf-8"))
+
+    old_index = (git_dir / "index").read_bytes() if (git_dir / "index").exists() else None
+    _write_index(git_dir, entries)
+    _git(project_path, "update-ref", "-m", f"commit: {message}", "HEAD", commit)
+    if _verify(project_path, entries):
+        return commit
+    _rollback(project_path, git_dir, parent, old_index)
+    return None
+
+
+def _check_supported(project_path: Path) -> None:
+    hooks = project_path / ".git" / "hooks"
+    for name in ("pre-commit", "commit-msg", "prepare-commit-msg", "post-commit"):
+        if (hooks / name).exists():
+            raise FastCommitUnsupported(f"{name} hook installed")
+    config = _git(
+        project_path,
+        "config",
+        "--get-regexp",
+        r"^(core\.autocrlf|core\.filemode|core\.symlinks|commit\.gpgsign|filter\..*)$",
+        check=False,
+    )
+    for line in config.splitlines():
+        key, _, value = line.partition(" ")
+        value = value.strip().lower()
+        if key.startswith("filter."):
+            raise FastCommitUnsupported("content filters configured")
+        if key == "core.autocrlf" and value in ("true", "input"):
+            raise FastCommitUnsupported("core.autocrlf enabled")
+        if key in ("core.filemode", "core.symlinks") and value == "false":
+            raise FastCommitUnsupported(f"{key} disabled")
+        if key == "commit.gpgsign" and value == "true":
+            raise FastCommitUnsupported("signed commits")
+
+
+def _worktree_paths(project_path: Path) -> list[str]:
+    """Paths `git add -A` would stage, without hashing anything."""
+    output = subprocess.run(
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+        cwd=project_path,
+        check=True,
+        capture_output=True,
+    ).stdout.decode("utf-8", errors="surrogateescape")
+    paths = sorted({path for path in output.split("\0") if path})
+    for path in paths:
+        if path.endswith("/") or path == ".gitattributes" or path.endswith("/.gitattributes"):
+            # Nested repositories and attribute rules (eol, filters) need git itself.
+            raise FastCommitUnsupported(f"unsupported path: {path}")
+    return paths
+
+
+def _hash_batch(job: tuple[str, str, list[str]]) -> list[tuple[str, int, bytes, tuple]]:
+    root, git_dir, paths = job
+    results = []
+    for relative in paths:
+        full_path = os.path.join(root, relative)
+        try:
+            info = os.lstat(full_path)
+        except FileNotFoundError:
+            # Tracked but deleted: `git add -A` would stage the removal.
+            continue
+        if stat.S_ISLNK(info.st_mode):
+            mode = MODE_SYMLINK
+            data = os.fsencode(os.readlink(full_path))
+        elif stat.S_ISREG(info.st_mode):
+            mode = MODE_EXECUTABLE if info.st_mode & stat.S_IXUSR else MODE_FILE
+            with open(full_path, "rb") as handle:
+                data = handle.read()
+        else:
+            continue
+        sha = _write_object(Path(git_dir), b"blob", data)
+        results.append((relative, mode, bytes.fromhex(sha), _stat_fields(info, mode)))
+    return results
+
+
+def _write_object(git_dir: Path, kind: bytes, data: bytes) -> str:
+    raw = kind + b" " + str(len(data)).encode("ascii") + b"\0" + data
+    sha = hashlib.sha1(raw).hexdigest()
+    path = git_dir / "objects" / sha[:2] / sha[2:]
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{sha[2:]}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(zlib.compress(raw, LOOSE_COMPRESSION_LEVEL))
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, path)
+    return sha
+
+
+def _write_tree(git_dir: Path, entries: list[tuple[str, int, bytes, tuple]]) -> str:
+    root: dict = {}
+    for relative, mode, sha, _ in entries:
+        node = root
+        parts = relative.split("/")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = (mode, sha)
+    return _write_tree_node(git_dir, root)
+
+
+def _write_tree_node(git_dir: Path, node: dict) -> str:
+    records = []
+    for name, value in node.items():
+        if isinstance(value, dict):
+            sha = bytes.fromhex(_write_tree_node(git_dir, value))
+            # Git orders tree entries as if directory names ended with "/".
+            records.append((os.fsencode(name) + b"/", MODE_TREE, name, sha))
+        else:
+            mode, sha = value
+            records.append((os.fsencode(name), mode, name, sha))
+    records.sort(key=lambda record: record[0])
+    body = b"".join(
+        f"{mode:o} ".encode("ascii") + os.fsencode(name) + b"\0" + sha
+        for _, mode, name, sha in records
+    )
+    return _write_object(git_dir, b"tree", body)
+
+
+def _stat_fields(info: os.stat_result, mode: int) -> tuple:
+    mask = 0xFFFFFFFF
+    return (
+        int(info.st_ctime) & mask,
+        info.st_ctime_ns % 1_000_000_000,
+        int(info.st_mtime) & mask,
+        info.st_mtime_ns % 1_000_000_000,
+        info.st_dev & mask,
+        info.st_ino & mask,
+        mode,
+        info.st_uid & mask,
+        info.st_gid & mask,
+        info.st_size & mask,
+    )
+
+
+def _write_index(git_dir: Path, entries: list[tuple[str, int, bytes, tuple]]) -> None:
+    """Write a version 2 index with real stat data, so git does not rehash the tree."""
+    chunks = [b"DIRC" + struct.pack(">II", 2, len(entries))]
+    for relative, _, sha, fields in entries:
+        name = os.fsencode(relative)
+        entry = struct.pack(">10I", *fields) + sha + struct.pack(">H", min(len(name), 0xFFF)) + name
+        # Entries are NUL-padded to a multiple of 8 bytes, with at least one NUL.
+        entry += b"\0" * (8 - len(entry) % 8)
+        chunks.append(entry)
+    content = b"".join(chunks)
+    tmp_path = git_dir / f"index.{os.getpid()}.tmp"
+    tmp_path.write_bytes(content + hashlib.sha1(content).digest())
+    os.replace(tmp_path, git_dir / "index")
+
+
+def _verify(project_path: Path, entries: list[tuple[str, int, bytes, tuple]]) -> bool:
+    """Check the commit, index, and worktree agree the way they would after git commit."""
+    checks = [
+        ["git", "diff-index", "--cached", "--quiet", "HEAD", "--"],
+        ["git", "diff-files", "--quiet"],
+    ]
+    for command in checks:
+        if subprocess.run(command, cwd=project_path, capture_output=True).returncode != 0:
+            return False
+    untracked = _git(project_path, "ls-files", "--others", "--exclude-standard", check=False)
+    if untracked:
+        return False
+    # diff-files trusts matching stat data, so re-hash a sample through git itself.
+    regular = [entry for entry in entries if entry[1] != MODE_SYMLINK]
+    sample = random.sample(regular, min(VERIFY_SAMPLE_FILES, len(regular)))
+    if not sample:
+        return True
+    result = subprocess.run(
+        ["git", "hash-object", "--stdin-paths"],
+        cwd=project_path,
+        input="\n".join(entry[0] for entry in sample) + "\n",
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return False
+    return result.stdout.split() == [entry[2].hex() for entry in sample]
+
+
+def _rollback(project_path: Path, git_dir: Path, parent: str | None, old_index: bytes | None) -> None:
+    if parent:
+        _git(project_path, "update-ref", "HEAD", parent)
+    else:
+        _git(project_path, "update-ref", "-d", "HEAD", check=False)
+    if old_index is None:
+        (git_dir / "index").unlink(missing_ok=True)
+    else:
+        (git_dir / "index").write_bytes(old_index)
+
+
+def _git(project_path: Path, *args: str, check: bool = True) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=project_path, capture_output=True, text=True, check=check
+    )
+    return result.stdout.strip()
@@ -0,0 +1,160 @@
+"""Concurrent git health checks for indexed projects."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+GIT_STATUS_TIMEOUT = 30
+DEFAULT_GIT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+@dataclass
+class GitHealth:
+    project_id: str
+    path: Path
+    branch: str | None = None
+    detached: bool = False
+    dirty: int = 0
+    ahead: int = 0
+    behind: int = 0
+    upstream: str | None = None
+    remote_url: str | None = None
+    expected_repo: str | None = None
+    error: str | None = None
+
+    @property
+    def remote_mismatch(self) -> bool:
+        if not self.expected_repo or not self.remote_url:
+            return False
+        return normalize_remote(self.expected_repo) != normalize_remote(self.remote_url)
+
+    def problems(self) -> list[str]:
+        if self.error:
+            return [f"error: {self.error}"]
+        issues: list[str] = []
+        if self.dirty:
+            issues.append(f"dirty ({self.dirty})")
+        if self.detached:
+            issues.append("detached HEAD")
+        if self.ahead:
+            issues.append(f"ahead {self.ahead}")
+        if self.behind:
+            issues.append(f"behind {self.behind}")
+        if not self.remote_url:
+            issues.append("no origin remote")
+        elif not self.upstream and not self.detached:
+            issues.append("no upstream")
+        if self.remote_mismatch:
+            issues.append(f"origin {self.remote_url} != project.yaml {self.expected_repo}")
+        return issues
+
+
+def normalize_remote(url: str) -> str:
+    """Reduce https/ssh remote URLs to `host/owner/repo` for comparison."""
+    value = url.strip().lower()
+    value = re.sub(r"^(?:https?|ssh|git)://", "", value)
+    value = re.sub(r"^[^@/]+@", "", value)
+    if ":" in value.split("/", 1)[0]:
+        value = value.replace(":", "/", 1)
+    return value.rstrip("/").removesuffix(".git")
+
+
+def git_dir(project_path: Path) -> Path | None:
+    """The repository directory: `.git` itself, or where a `.git` file's `gitdir:` points.
+
+    Worktrees and submodules keep a `.git` file instead of a directory.
+    """
+    dot_git = project_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    match = re.match(r"^gitdir:\s*(.+)$", content.strip())
+    if not match:
+        return None
+    path = project_path / match.group(1).strip()
+    return path if path.is_dir() else None
+
+
+def read_origin_url(project_path: Path) -> str | None:
+    """Read `remote.origin.url` from the repository config without spawning git."""
+    repo_dir = git_dir(project_path)
+    if repo_dir is None:
+        return None
+    # A linked worktree shares the main repository's config through `commondir`.
+    try:
+        common = (repo_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        common = ""
+    config = (repo_dir / common if common else repo_dir) / "config"
+    try:
+        content = config.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    in_origin = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("["):
+            in_origin = re.match(r'^\[remote\s+"origin"\]$', stripped) is not None
+            continue
+        if in_origin:
+            match = re.match(r"^url\s*=\s*(.+)$", stripped)
+            if match:
+                return match.group(1).strip()
+    return None
+
+
+def check_repo(project_id: str, project_path: Path, expected_repo: str | None) -> GitHealth:
+    """Run a single `git status --porcelain=v2 --branch` and parse it."""
+    health = GitHealth(project_id=project_id, path=project_path, expected_repo=expected_repo or None)
+    health.remote_url = read_origin_url(project_path)
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=GIT_STATUS_TIMEOUT,
+            # Read-only check: never take index.lock away from the user's own git.
+            env=dict(os.environ, GIT_OPTIONAL_LOCKS="0"),
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        health.error = str(exc)
+        return health
+    if result.returncode != 0:
+        health.error = result.stderr.strip() or f"git exited with {result.returncode}"
+        return health
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            head = line.split(" ", 2)[2]
+            health.detached = head == "(detached)"
+            health.branch = None if health.detached else head
+        elif line.startswith("# branch.upstream "):
+            health.upstream = line.split(" ", 2)[2]
+        elif line.startswith("# branch.ab "):
+            match = re.match(r"# branch\.ab \+(\d+) -(\d+)", line)
+            if match:
+                health.ahead, health.behind = int(match.group(1)), int(match.group(2))
+        elif line and not line.startswith("#"):
+            health.dirty += 1
+    return health
+
+
+def check_repos(
+    targets: list[tuple[str, Path, str | None]], max_workers: int = DEFAULT_GIT_WORKERS
+) -> Iterator[GitHealth]:
+    """Yield health results as they complete, with at most `max_workers` gits in flight."""
+    if not targets:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        futures = [executor.submit(check_repo, *target) for target in targets]
+        for future in as_completed(futures):
+            yield future.result()
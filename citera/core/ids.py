@@ -2,19 +2,109 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 from secrets import choice, randbelow
 
 from .constants import ADJECTIVES, NOUNS
+from .index import index_dir, refresh_index
+from .locks import root_lock
+from .roots import available_roots
 
+RESERVATIONS_DIR = "ids"
+# A reservation only bridges allocation and the first index write; by then the
+# project itself is on disk, so an old reservation holds nothing back.
+RESERVATION_TTL = 24 * 3600
+INVALID_ID_CHARS = ("/", "\\", "\0")
 
-def generate_project_id(stage_dir: Path) -> str:
-    """Create a unique adjective-noun ID for the stage directory."""
-    for _ in range(1000):
-        adjective = choice(ADJECTIVES)
-        noun = choice(NOUNS)
-        number = randbelow(9000) + 1000
-        candidate = f"{adjective}{noun}{number}"
-        if not (stage_dir / candidate).exists():
-            return candidate
+
+def invalid_project_id(project_id: str) -> str | None:
+    """Why `project_id` cannot name a project folder, or None when it can."""
+    if not project_id.strip():
+        return "Project id cannot be empty."
+    if any(char in project_id for char in INVALID_ID_CHARS) or project_id in (".", ".."):
+        return f"Project id cannot contain path separators: {project_id}"
+    return None
+
+
+def known_project_ids(base_path: Path) -> set[str]:
+    """Ids of every project on disk under `base_path` and every other root.
+
+    Indexes are refreshed first, so projects the index has not seen yet (or a
+    missing index) still count. Folder names count as well as metadata ids.
+    """
+    paths = [base_path] + [root.path for root in available_roots() if root.path != base_path]
+    ids: set[str] = set()
+    for path in paths:
+        if not path.is_dir():
+            continue
+        for key, entry in refresh_index(path)["projects"].items():
+            ids.add(key.rsplit("/", 1)[-1])
+            project_id = entry.get("metadata", {}).get("id")
+            if project_id:
+                ids.add(str(project_id))
+    return ids
+
+
+def reserve_project_id(base_path: Path, project_id: str, taken: set[str] | None = None) -> bool:
+    """Atomically claim `project_id`; False if it is indexed or already reserved.
+
+    Each reservation is an empty file created with O_EXCL under
+    `<root>/.citera/ids/`, so concurrent allocators can never both win; the
+    short `ids` root lock makes them take turns instead of racing.
+    """
+    with root_lock(base_path, "ids"):
+        if taken is None:
+            taken = known_project_ids(base_path)
+            prune_reservations(base_path)
+        if project_id in taken:
+            return False
+        reservations = index_dir(base_path) / RESERVATIONS_DIR
+        reservations.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(reservations / project_id, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+
+def release_project_id(base_path: Path, project_id: str) -> None:
+    """Drop a reservation once the project folder exists or its creation failed."""
+    try:
+        (index_dir(base_path) / RESERVATIONS_DIR / project_id).unlink()
+    except OSError:
+        pass
+
+
+def prune_reservations(base_path: Path, ttl: float = RESERVATION_TTL) -> int:
+    """Remove reservations older than `ttl` seconds; call with the `ids` lock held."""
+    reservations = index_dir(base_path) / RESERVATIONS_DIR
+    if not reservations.is_dir():
+        return 0
+    cutoff = time.time() - ttl
+    removed = 0
+    for path in reservations.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def allocate_project_id(base_path: Path) -> str:
+    """Create and reserve an adjective-noun ID unique across the whole projects root."""
+    with root_lock(base_path, "ids"):
+        taken = known_project_ids(base_path)
+        prune_reservations(base_path)
+        for _ in range(1000):
+            adjective = choice(ADJECTIVES)
+            noun = choice(NOUNS)
+            number = randbelow(9000) + 1000
+            candidate = f"{adjective}{noun}{number}"
+            if reserve_project_id(base_path, candidate, taken):
+                return candidate
     raise RuntimeError("Unable to generate unique project id.")
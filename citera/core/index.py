@@ -0,0 +1,155 @@
+"""Persistent project index stored under the projects root."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from .constants import root_stage_dirs
+from .metadata import parse_project_metadata
+
+INDEX_DIR = ".citera"
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+
+def index_dir(base_path: Path) -> Path:
+    return base_path / INDEX_DIR
+
+
+def index_path(base_path: Path) -> Path:
+    return index_dir(base_path) / INDEX_FILE
+
+
+def load_index(base_path: Path) -> dict:
+    """Load the index from disk, returning an empty index when missing or stale."""
+    path = index_path(base_path)
+    empty = {"version": INDEX_VERSION, "projects": {}}
+    if not path.exists():
+        return empty
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return empty
+    data.setdefault("projects", {})
+    return data
+
+
+def save_index(base_path: Path, index: dict) -> None:
+    """Atomically write the index."""
+    path = index_path(base_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def iter_project_dirs(base_path: Path):
+    """Yield project folders (stage/<id> or stage/<category>/<id>)."""
+    for folder in root_stage_dirs(base_path).values():
+        stage_dir = base_path / folder
+        if not stage_dir.is_dir():
+            continue
+        for child in sorted(stage_dir.iterdir()):
+            if not child.is_dir():
+                continue
+            if (child / "project.yaml").is_file():
+                yield child
+                continue
+            for grandchild in sorted(child.iterdir()):
+                if grandchild.is_dir() and (grandchild / "project.yaml").is_file():
+                    yield grandchild
+
+
+def refresh_index(base_path: Path) -> dict:
+    """Rescan the projects root, reparsing only project.yaml files that changed.
+
+    The scan runs unlocked; only a changed result takes the lock, reloads the
+    index, and merges into it, so entries another process wrote meanwhile
+    are never overwritten with an older view.
+    """
+    index = load_index(base_path)
+    previous = index["projects"]
+    projects: dict[str, dict] = {}
+    changed = False
+    for project_path in iter_project_dirs(base_path):
+        key = project_path.relative_to(base_path).as_posix()
+        try:
+            mtime = (project_path / "project.yaml").stat().st_mtime_ns
+        except OSError:
+            continue
+        entry = previous.get(key)
+        if entry and entry.get("mtime") == mtime:
+            projects[key] = entry
+            continue
+        projects[key] = _build_entry(project_path, mtime)
+        changed = True
+    if not changed and set(projects) == set(previous):
+        return index
+    with _index_lock(base_path):
+        index = load_index(base_path)
+        index["projects"] = _merge_scan(base_path, index["projects"], projects)
+        save_index(base_path, index)
+    return index
+
+
+def update_index_entry(base_path: Path, project_path: Path) -> None:
+    """Refresh a single project's entry after a command wrote its metadata."""
+    key = _index_key(base_path, project_path)
+    if key is None:
+        return
+    project_yaml = project_path / "project.yaml"
+    if not project_yaml.exists():
+        return
+    entry = _build_entry(project_path, project_yaml.stat().st_mtime_ns)
+    with _index_lock(base_path):
+        index = load_index(base_path)
+        index["projects"][key] = entry
+        save_index(base_path, index)
+
+
+def remove_index_entry(base_path: Path, project_path: Path) -> None:
+    """Drop a project's entry (e.g. after it moved)."""
+    key = _index_key(base_path, project_path)
+    if key is None:
+        return
+    with _index_lock(base_path):
+        index = load_index(base_path)
+        if index["projects"].pop(key, None) is not None:
+            save_index(base_path, index)
+
+
+def _index_lock(base_path: Path):
+    """Serialize read-modify-write cycles on the index across processes."""
+    from .locks import root_lock
+
+    return root_lock(base_path, "index")
+
+
+def _merge_scan(base_path: Path, current: dict, scanned: dict) -> dict:
+    """Merge a scan into the index as it is now, keeping the newer entry per key."""
+    merged: dict[str, dict] = {}
+    for key in current.keys() | scanned.keys():
+        ours, theirs = scanned.get(key), current.get(key)
+        if ours is None or theirs is None:
+            # Added or removed since one side looked; the folder decides.
+            if not (base_path / key / "project.yaml").is_file():
+                continue
+        candidates = [entry for entry in (ours, theirs) if entry is not None]
+        merged[key] = max(candidates, key=lambda entry: entry.get("mtime") or 0)
+    return merged
+
+
+def _index_key(base_path: Path, project_path: Path) -> str | None:
+    try:
+        return project_path.resolve().relative_to(base_path.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def _build_entry(project_path: Path, mtime: int) -> dict:
+    metadata = parse_project_metadata(project_path / "project.yaml")
+    return {"mtime": mtime, "metadata": metadata}
@@ -0,0 +1,176 @@
+"""Language composition from file stats (no file contents are read)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from .walk import walk_project
+
+EXTENSION_LANGUAGE = {
+    ".py": "python",
+    ".pyi": "python",
+    ".ipynb": "jupyter",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".rs": "rust",
+    ".go": "go",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".hpp": "cpp",
+    ".c": "c",
+    ".h": "c",
+    ".swift": "swift",
+    ".lua": "lua",
+    ".gd": "gdscript",
+    ".sh": "shell",
+    ".html": "html",
+    ".css": "css",
+    ".scss": "css",
+    ".vue": "vue",
+    ".svelte": "svelte",
+    ".sql": "sql",
+    ".json": "json",
+}
+
+FILENAME_LANGUAGE = {
+    "Makefile": "makefile",
+    "GNUmakefile": "makefile",
+    "Dockerfile": "dockerfile",
+    "Containerfile": "dockerfile",
+    "CMakeLists.txt": "cmake",
+    "Rakefile": "ruby",
+    "Gemfile": "ruby",
+    "Vagrantfile": "ruby",
+    "Jenkinsfile": "groovy",
+    "Justfile": "just",
+}
+
+VENDORED_DIRS = {
+    ".git",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    "node_modules",
+    "bower_components",
+    "vendor",
+    "third_party",
+    "site-packages",
+    "dist",
+    "build",
+    "target",
+    ".next",
+}
+
+GENERATED_SUFFIXES = (
+    ".min.js",
+    ".min.css",
+    ".bundle.js",
+    ".map",
+    "_pb2.py",
+    ".pb.go",
+    ".generated.ts",
+    ".g.dart",
+)
+
+GENERATED_FILES = {"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "Cargo.lock", "poetry.lock"}
+
+
+def detect_language(filename: str) -> str | None:
+    """Map a file name to a language using filename rules, then the extension."""
+    language = FILENAME_LANGUAGE.get(filename)
+    if language:
+        return language
+    if filename.startswith("Dockerfile."):
+        return "dockerfile"
+    _, ext = os.path.splitext(filename)
+    return EXTENSION_LANGUAGE.get(ext.lower())
+
+
+def is_generated(filename: str) -> bool:
+    return filename in GENERATED_FILES or filename.endswith(GENERATED_SUFFIXES)
+
+
+def is_vendored(relative: str) -> bool:
+    """True when a file (relative path with forward slashes) sits under a vendored dir."""
+    return any(part in VENDORED_DIRS for part in relative.split("/")[:-1])
+
+
+class LanguageTally:
+    """Accumulate bytes and file counts per language from files seen during a walk."""
+
+    def __init__(self) -> None:
+        self.totals: dict[str, list[int]] = {}
+
+    def add(self, filename: str, size: int) -> None:
+        language = detect_language(filename)
+        if not language or is_generated(filename):
+            return
+        bucket = self.totals.setdefault(language, [0, 0])
+        bucket[0] += size
+        bucket[1] += 1
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-language totals, largest first."""
+        ranked = sorted(self.totals.items(), key=lambda item: (-item[1][0], item[0]))
+        return {language: {"bytes": size, "files": count} for language, (size, count) in ranked}
+
+
+def language_breakdown(project_path: Path) -> dict[str, dict[str, int]]:
+    """Aggregate bytes and file counts per language, largest first."""
+    tally = LanguageTally()
+    for item in walk_project(project_path, skip_dirs=VENDORED_DIRS):
+        entry = item.entry
+        try:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            tally.add(entry.name, entry.stat(follow_symlinks=False).st_size)
+        except OSError:
+            continue
+    return tally.stats()
+
+
+def language_percentages(stats: dict[str, dict[str, int]]) -> dict[str, float]:
+    """Share of bytes per language, rounded to one decimal."""
+    total = sum(item["bytes"] for item in stats.values())
+    if not total:
+        return {language: 0.0 for language in stats}
+    return {language: round(item["bytes"] * 100 / total, 1) for language, item in stats.items()}
+
+
+def format_language_stats(stats: dict[str, dict[str, int]], limit: int = 3) -> str:
+    """Render a short `python 82.1%, shell 9.4%` summary."""
+    percentages = language_percentages(stats)
+    parts = [f"{language} {percentages[language]}%" for language in list(stats)[:limit]]
+    return ", ".join(parts)
+
+
+def serialize_language_stats(stats: dict[str, dict[str, int]]) -> dict[str, list[int]]:
+    """Shape stats for the project.yaml `languages` section."""
+    return {language: [item["bytes"], item["files"]] for language, item in stats.items()}
+
+
+def parse_language_stats(section: object) -> dict[str, dict[str, int]]:
+    """Read the project.yaml `languages` section back into stats."""
+    if not isinstance(section, dict):
+        return {}
+    stats: dict[str, dict[str, int]] = {}
+    for language, value in section.items():
+        if not isinstance(value, list) or len(value) != 2:
+            continue
+        try:
+            stats[language] = {"bytes": int(value[0]), "files": int(value[1])}
+        except (TypeError, ValueError):
+            continue
+    return dict(sorted(stats.items(), key=lambda item: (-item[1]["bytes"], item[0])))
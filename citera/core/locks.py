@@ -0,0 +1,170 @@
+"""Advisory file locks that let several citera processes share a projects root."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl; locking is skipped
+    fcntl = None
+
+from .index import index_dir
+from .paths import base_projects_path
+
+LOCKS_DIR = "locks"
+# Root locks guard a read-modify-write of a small file, so waiting is cheap.
+ROOT_LOCK_TIMEOUT = 30.0
+# A busy project usually means duplicate work (the same promote twice); fail fast.
+PROJECT_LOCK_TIMEOUT = 5.0
+POLL_INTERVAL = 0.02
+MAX_POLL_INTERVAL = 0.25
+
+_HELD = threading.local()
+
+
+class LockTimeout(RuntimeError):
+    """Raised when a lock is still held by a live process after the timeout."""
+
+
+@dataclass(frozen=True)
+class LockHolder:
+    pid: int
+    host: str
+    since: float
+
+    @property
+    def stale(self) -> bool:
+        """True when the holder ran on this host and is no longer alive."""
+        return self.host == socket.gethostname() and not pid_alive(self.pid)
+
+
+def lock_path(base_path: Path, name: str) -> Path:
+    return index_dir(base_path) / LOCKS_DIR / f"{name}.lock"
+
+
+def root_lock(base_path: Path, name: str, timeout: float = ROOT_LOCK_TIMEOUT):
+    """Short-lived lock on one shared file of a root, e.g. `index` or `ids`."""
+    return file_lock(lock_path(base_path, name), timeout)
+
+
+def project_lock(project_id: str, timeout: float = PROJECT_LOCK_TIMEOUT):
+    """Lock one project by id while it is created, moved, or rewritten.
+
+    Locks live on the primary root so a project keeps the same lock when it
+    moves between roots.
+    """
+    return file_lock(lock_path(base_projects_path(), f"project-{project_id}"), timeout)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = ROOT_LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an exclusive `flock` on `path`, waiting up to `timeout` seconds.
+
+    The kernel drops the lock when its process exits, so a crash never leaves
+    it held. The holder's pid and host are written into the file; when a lock
+    times out and its holder is a dead process on this host (a filesystem that
+    ignores flock, or a leaked descriptor), the file is removed and acquired
+    once more. Re-entering a lock this thread already holds is a no-op.
+    """
+    held: set[str] = _HELD.__dict__.setdefault("paths", set())
+    key = str(path)
+    if fcntl is None or key in held:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = _acquire(path, timeout)
+    held.add(key)
+    try:
+        yield
+    finally:
+        held.discard(key)
+        # Unlink while still holding the lock; waiters notice the file changed.
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        os.close(fd)
+
+
+def read_holder(path: Path) -> LockHolder | None:
+    try:
+        pid, host, since = path.read_text(encoding="utf-8").split()
+        return LockHolder(int(pid), host, float(since))
+    except (OSError, ValueError):
+        return None
+
+
+def pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _acquire(path: Path, timeout: float) -> int:
+    deadline = time.monotonic() + max(0.0, timeout)
+    interval = POLL_INTERVAL
+    broken = False
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+        else:
+            if _same_file(fd, path):
+                _write_holder(fd)
+                return fd
+            # The previous holder unlinked the file after we opened it; retry.
+            os.close(fd)
+            continue
+        if time.monotonic() >= deadline:
+            holder = read_holder(path)
+            if holder is not None and holder.stale and not broken:
+                broken = True
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+                continue
+            raise LockTimeout(_describe_timeout(path, holder, timeout))
+        time.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+def _same_file(fd: int, path: Path) -> bool:
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _write_holder(fd: int) -> None:
+    os.ftruncate(fd, 0)
+    os.pwrite(fd, f"{os.getpid()} {socket.gethostname()} {time.time():.0f}\n".encode(), 0)
+
+
+def _describe_timeout(path: Path, holder: LockHolder | None, timeout: float) -> str:
+    name = path.name.removesuffix(".lock")
+    if holder is None:
+        return f"Timed out after {timeout:g}s waiting for the {name} lock ({path})."
+    age = max(0.0, time.time() - holder.since)
+    return (
+        f"Timed out after {timeout:g}s waiting for the {name} lock, held by pid "
+        f"{holder.pid} on {holder.host} for {age:.0f}s ({path})."
+    )
@@ -0,0 +1,246 @@
+"""Lightweight manifest parsing for project context."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+MANIFEST_READ_BYTES = 64 * 1024
+
+PYTHON_MANIFESTS = ("pyproject.toml", "requirements.txt", "setup.py", "setup.cfg")
+MANIFEST_FILES = PYTHON_MANIFESTS + ("package.json", "Cargo.toml", "go.mod", "Dockerfile")
+
+
+def read_manifests(project_path: Path) -> dict:
+    """Summarize known manifests at the project root (name, deps, entry points)."""
+    manifests: dict[str, dict] = {}
+    for filename in MANIFEST_FILES:
+        path = project_path / filename
+        if not path.is_file():
+            continue
+        content = _read_head(path)
+        if content is None:
+            continue
+        parser = _PARSERS.get(filename)
+        summary = parser(content) if parser else {}
+        manifests[filename] = {key: value for key, value in summary.items() if value}
+    return manifests
+
+
+def _read_head(path: Path) -> str | None:
+    try:
+        with path.open("rb") as handle:
+            raw = handle.read(MANIFEST_READ_BYTES)
+    except OSError:
+        return None
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _dependency_name(spec: str) -> str:
+    """Strip version pins, extras, and markers from a requirement spec."""
+    name = re.split(r"[\s<>=!~;\[@(]", spec.strip(), maxsplit=1)[0]
+    return name.strip().lower()
+
+
+def _parse_toml(content: str) -> dict:
+    try:
+        import tomllib
+    except ImportError:  # pragma: no cover - Python < 3.11
+        return _parse_toml_fallback(content)
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return _parse_toml_fallback(content)
+
+
+def _parse_toml_fallback(content: str) -> dict:
+    """Parse the subset of TOML that manifests use (tables, strings, string arrays)."""
+    data: dict = {}
+    table = data
+    pending_key: str | None = None
+    pending_items: list[str] = []
+    for line in content.splitlines():
+        stripped = _strip_toml_comment(line).strip()
+        if pending_key is not None:
+            pending_items.extend(re.findall(r"[\"']([^\"']*)[\"']", stripped))
+            if "]" in stripped:
+                table[pending_key] = pending_items
+                pending_key, pending_items = None, []
+            continue
+        if not stripped:
+            continue
+        header = re.match(r"^\[\[?([^\]]+)\]\]?$", stripped)
+        if header:
+            table = data
+            for part in header.group(1).strip().split("."):
+                part = part.strip().strip("\"'")
+                table = table.setdefault(part, {})
+            continue
+        if "=" not in stripped:
+            continue
+        key, value = [part.strip() for part in stripped.split("=", 1)]
+        key = key.strip("\"'")
+        if value.startswith("[") and "]" not in value:
+            pending_key = key
+            pending_items = re.findall(r"[\"']([^\"']*)[\"']", value)
+            continue
+        if value.startswith("["):
+            table[key] = re.findall(r"[\"']([^\"']*)[\"']", value)
+        elif value.startswith("{"):
+            table[key] = {}
+        else:
+            table[key] = value.strip("\"'")
+    return data
+
+
+def _strip_toml_comment(line: str) -> str:
+    """Drop a trailing `#` comment that is not inside a quoted string."""
+    quote: str | None = None
+    escaped = False
+    for position, char in enumerate(line):
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\" and quote == '"':
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "#":
+            return line[:position]
+    return line
+
+
+def _parse_pyproject(content: str) -> dict:
+    data = _parse_toml(content)
+    project = data.get("project", {}) if isinstance(data.get("project"), dict) else {}
+    poetry = data.get("tool", {}).get("poetry", {}) if isinstance(data.get("tool"), dict) else {}
+    dependencies = [_dependency_name(spec) for spec in project.get("dependencies", []) or []]
+    if isinstance(poetry.get("dependencies"), dict):
+        dependencies.extend(key.lower() for key in poetry["dependencies"] if key != "python")
+    scripts = list((project.get("scripts") or poetry.get("scripts") or {}).keys())
+    return {
+        "name": project.get("name") or poetry.get("name"),
+        "description": project.get("description") or poetry.get("description"),
+        "dependencies": sorted(set(filter(None, dependencies))),
+        "entry_points": scripts,
+    }
+
+
+def _parse_requirements(content: str) -> dict:
+    dependencies = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(("#", "-")):
+            continue
+        dependencies.append(_dependency_name(stripped))
+    return {"dependencies": sorted(set(filter(None, dependencies)))}
+
+
+def _parse_setup_py(content: str) -> dict:
+    name = re.search(r"name\s*=\s*[\"']([^\"']+)[\"']", content)
+    requires = re.search(r"install_requires\s*=\s*\[([^\]]*)\]", content, re.S)
+    dependencies = []
+    if requires:
+        dependencies = [
+            _dependency_name(spec) for spec in re.findall(r"[\"']([^\"']+)[\"']", requires.group(1))
+        ]
+    return {
+        "name": name.group(1) if name else None,
+        "dependencies": sorted(set(filter(None, dependencies))),
+        "entry_points": re.findall(r"[\"'](\w[\w-]*)\s*=\s*[\w.]+:\w+[\"']", content),
+    }
+
+
+def _parse_setup_cfg(content: str) -> dict:
+    name = re.search(r"^name\s*=\s*(\S+)", content, re.M)
+    description = re.search(r"^description\s*=\s*(.+)$", content, re.M)
+    requires = re.search(r"^install_requires\s*=\s*\n((?:[ \t]+.+\n?)+)", content, re.M)
+    dependencies = []
+    if requires:
+        dependencies = [_dependency_name(line) for line in requires.group(1).splitlines()]
+    return {
+        "name": name.group(1) if name else None,
+        "description": description.group(1).strip() if description else None,
+        "dependencies": sorted(set(filter(None, dependencies))),
+    }
+
+
+def _parse_package_json(content: str) -> dict:
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    dependencies: set[str] = set()
+    for section in ("dependencies", "devDependencies", "peerDependencies"):
+        if isinstance(data.get(section), dict):
+            dependencies.update(key.lower() for key in data[section])
+    binaries = data.get("bin")
+    if isinstance(binaries, str):
+        entry_points = [str(data.get("name", "")).split("/")[-1]]
+    elif isinstance(binaries, dict):
+        entry_points = list(binaries)
+    else:
+        entry_points = []
+    return {
+        "name": data.get("name"),
+        "description": data.get("description"),
+        "dependencies": sorted(dependencies),
+        "entry_points": entry_points,
+        "main": data.get("main"),
+    }
+
+
+def _parse_cargo(content: str) -> dict:
+    data = _parse_toml(content)
+    package = data.get("package", {}) if isinstance(data.get("package"), dict) else {}
+    dependencies: set[str] = set()
+    for section in ("dependencies", "dev-dependencies"):
+        if isinstance(data.get(section), dict):
+            dependencies.update(key.lower() for key in data[section])
+    bins = data.get("bin", [])
+    entry_points = [item.get("name") for item in bins if isinstance(item, dict)] if isinstance(
+        bins, list
+    ) else []
+    return {
+        "name": package.get("name"),
+        "description": package.get("description"),
+        "dependencies": sorted(dependencies),
+        "entry_points": [name for name in entry_points if name],
+        "lib": "lib" in data,
+    }
+
+
+def _parse_go_mod(content: str) -> dict:
+    module = re.search(r"^module\s+(\S+)", content, re.M)
+    dependencies = re.findall(r"^\s*(?:require\s+)?([\w.-]+\.[a-z]+/[\w./-]+)\s+v", content, re.M)
+    return {
+        "name": module.group(1).rsplit("/", 1)[-1] if module else None,
+        "module": module.group(1) if module else None,
+        "dependencies": sorted(set(dep.lower() for dep in dependencies)),
+    }
+
+
+def _parse_dockerfile(content: str) -> dict:
+    images = re.findall(r"^\s*FROM\s+(?:--\S+\s+)*(\S+)", content, re.M | re.I)
+    exposed = re.findall(r"^\s*EXPOSE\s+(\d+)", content, re.M | re.I)
+    return {
+        "base_images": [image.split(":", 1)[0].lower() for image in images],
+        "ports": exposed,
+    }
+
+
+_PARSERS = {
+    "pyproject.toml": _parse_pyproject,
+    "requirements.txt": _parse_requirements,
+    "setup.py": _parse_setup_py,
+    "setup.cfg": _parse_setup_cfg,
+    "package.json": _parse_package_json,
+    "Cargo.toml": _parse_cargo,
+    "go.mod": _parse_go_mod,
+    "Dockerfile": _parse_dockerfile,
+}
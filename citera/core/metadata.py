@@ -120,4 +120,10 @@ def write_updated_metadata(project_yaml: Path, metadata: dict) -> None:
         "obsidian:\n"
         f"  enabled: {'true' if metadata.get('obsidian_enabled') else 'false'}\n"
     )
+    languages = metadata.get("languages") or {}
+    if languages:
+        content += "languages:\n" + "".join(
+            f"  {language}: {_serialize_list([str(value) for value in values])}\n"
+            for language, values in languages.items()
+        )
     project_yaml.write_text(content, encoding="utf-8")
@@ -0,0 +1,239 @@
+"""Incremental export of the project index into an Obsidian vault."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .constants import stage_label, stage_role_from_label
+from .languages import format_language_stats, parse_language_stats
+
+VAULT_FOLDER = "Citera"
+SYNC_STATE_FILE = ".citera-sync.json"
+SYNC_STATE_VERSION = 1
+UNCATEGORIZED = "Uncategorized"
+
+
+@dataclass
+class SyncResult:
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def note_name(value: str) -> str:
+    """Strip characters Obsidian does not allow in note names or links."""
+    cleaned = re.sub(r'[\\/:*?"<>|#^\[\]]+', "-", value).strip(" .-")
+    return cleaned or "untitled"
+
+
+def render_vault(indexes: list[tuple[Path, dict]]) -> dict[str, str]:
+    """Render every note, for one or more (root, index) pairs, as {vault-relative path: markdown}."""
+    notes: dict[str, str] = {}
+    by_category: dict[str, list[tuple[str, str, dict]]] = {}
+    by_tag: dict[str, list[tuple[str, str, dict]]] = {}
+    by_stage: dict[str, list[tuple[str, str, dict]]] = {}
+    projects = sorted(
+        (
+            (key, base_path, entry)
+            for base_path, index in indexes
+            for key, entry in index["projects"].items()
+        ),
+        key=lambda item: (item[0], str(item[1])),
+    )
+    names = _project_note_names(projects)
+    for (key, base_path, entry), name in zip(projects, names):
+        metadata = entry.get("metadata", {})
+        project_id = _project_id(key, metadata)
+        notes[f"{VAULT_FOLDER}/Projects/{name}.md"] = render_project_note(
+            base_path / key, project_id, metadata
+        )
+        member = (name, project_id, metadata)
+        by_category.setdefault(str(metadata.get("category") or UNCATEGORIZED), []).append(member)
+        by_stage.setdefault(_stage_name(metadata), []).append(member)
+        for tag in metadata.get("tags") or []:
+            by_tag.setdefault(str(tag).lower(), []).append(member)
+
+    for category, members in by_category.items():
+        notes[f"{VAULT_FOLDER}/Categories/{note_name(category)}.md"] = _render_index_page(
+            category, "category", members
+        )
+    for tag, members in by_tag.items():
+        notes[f"{VAULT_FOLDER}/Tags/{note_name(tag)}.md"] = _render_index_page(
+            tag, "tag", members
+        )
+    notes[f"{VAULT_FOLDER}/{VAULT_FOLDER}.md"] = _render_home(by_stage, by_category)
+    return notes
+
+
+def render_project_note(project_path: Path, project_id: str, metadata: dict) -> str:
+    tags = [str(tag) for tag in metadata.get("tags") or []]
+    tech = [str(item) for item in metadata.get("tech") or []]
+    category = str(metadata.get("category") or UNCATEGORIZED)
+    git = metadata.get("git") if isinstance(metadata.get("git"), dict) else {}
+    repo = str(git.get("repo") or "")
+    lines = [
+        "---",
+        f"id: {project_id}",
+        f"stage: {_stage_name(metadata)}",
+        f"category: {category}",
+        f"tags: [{', '.join(_tag_slug(tag) for tag in tags)}]",
+        f"tech: [{', '.join(tech)}]",
+        f"repo: {repo}",
+        f"path: {project_path}",
+        f"created: {metadata.get('created_at') or ''}",
+        "---",
+        "",
+        f"# {metadata.get('name') or project_id}",
+        "",
+    ]
+    if metadata.get("description"):
+        lines += [str(metadata["description"]), ""]
+    lines.append(f"- Stage: {_stage_name(metadata)}")
+    lines.append(f"- Category: {_link('Categories', category)}")
+    if tags:
+        lines.append("- Tags: " + " ".join(_link("Tags", tag.lower(), f"#{tag}") for tag in tags))
+    if tech:
+        lines.append(f"- Tech: {', '.join(tech)}")
+    languages = format_language_stats(parse_language_stats(metadata.get("languages")))
+    if languages:
+        lines.append(f"- Languages: {languages}")
+    if repo:
+        lines.append(f"- Repo: {repo}")
+    lines.append(f"- Folder: [{project_path.name}]({project_path.as_uri()})")
+    return "\n".join(lines) + "\n"
+
+
+def sync_vault(vault_path: Path, notes: dict[str, str], dry_run: bool = False) -> SyncResult:
+    """Write notes whose content hash changed and remove notes no longer rendered.
+
+    Only files recorded in the sync state are ever removed, so notes the user
+    keeps alongside the export are left alone.
+    """
+    state_path = vault_path / VAULT_FOLDER / SYNC_STATE_FILE
+    previous = _load_state(state_path)
+    current: dict[str, str] = {}
+    result = SyncResult()
+    for relative, content in sorted(notes.items()):
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        current[relative] = digest
+        target = vault_path / relative
+        if previous.get(relative) == digest and target.exists():
+            result.unchanged += 1
+            continue
+        result.written.append(relative)
+        if not dry_run:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+    for relative in sorted(set(previous) - set(current)):
+        result.removed.append(relative)
+        if not dry_run:
+            try:
+                (vault_path / relative).unlink()
+            except FileNotFoundError:
+                pass
+    if not dry_run and (result.written or result.removed or previous.keys() != current.keys()):
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_suffix(f".{os.getpid()}.tmp")
+        payload = {"version": SYNC_STATE_VERSION, "notes": current}
+        tmp_path.write_text(json.dumps(payload, indent=0, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, state_path)
+    return result
+
+
+def _load_state(state_path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != SYNC_STATE_VERSION:
+        return {}
+    return data.get("notes", {})
+
+
+def _project_id(key: str, metadata: dict) -> str:
+    return str(metadata.get("id") or key.rsplit("/", 1)[-1])
+
+
+def _project_note_names(projects: list[tuple[str, Path, dict]]) -> list[str]:
+    """Note names per project; ids that clash get a stage, root, or path-hash suffix.
+
+    Ids differing only in punctuation or case, or the same id on two roots or
+    stages, would otherwise write the same note and silently drop one project.
+    """
+    bases = [note_name(_project_id(key, entry.get("metadata", {}))) for key, _, entry in projects]
+    groups: dict[str, list[int]] = {}
+    for position, base in enumerate(bases):
+        groups.setdefault(base.lower(), []).append(position)
+    names = list(bases)
+    taken = {base.lower() for base in bases}
+    for positions in groups.values():
+        if len(positions) < 2:
+            continue
+        for suffix in (_stage_suffix, _root_suffix, _path_hash_suffix):
+            candidates = [
+                note_name(f"{bases[position]} ({suffix(projects[position])})")
+                for position in positions
+            ]
+            lowered = {candidate.lower() for candidate in candidates}
+            if len(lowered) == len(candidates) and not lowered & taken:
+                break
+        for position, candidate in zip(positions, candidates):
+            names[position] = candidate
+        taken |= {candidate.lower() for candidate in candidates}
+    return names
+
+
+def _stage_suffix(project: tuple[str, Path, dict]) -> str:
+    return _stage_name(project[2].get("metadata", {}))
+
+
+def _root_suffix(project: tuple[str, Path, dict]) -> str:
+    return f"{_stage_suffix(project)}, {project[1].name}"
+
+
+def _path_hash_suffix(project: tuple[str, Path, dict]) -> str:
+    digest = hashlib.sha1(str(project[1] / project[0]).encode("utf-8")).hexdigest()[:8]
+    return f"{_root_suffix(project)}, {digest}"
+
+
+def _render_index_page(title: str, kind: str, members: list[tuple[str, str, dict]]) -> str:
+    lines = ["---", f"type: citera-{kind}", "---", "", f"# {title}", ""]
+    for name, project_id, metadata in sorted(members, key=lambda item: item[0].lower()):
+        line = f"- {_link('Projects', name, project_id)} ({_stage_name(metadata)})"
+        if metadata.get("description"):
+            line += f" — {metadata['description']}"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def _render_home(
+    by_stage: dict[str, list[tuple[str, str, dict]]], by_category: dict[str, list]
+) -> str:
+    lines = ["# Citera projects", "", "## Categories", ""]
+    for category in sorted(by_category):
+        lines.append(f"- {_link('Categories', category)} ({len(by_category[category])})")
+    for stage in sorted(by_stage):
+        lines += ["", f"## {stage}", ""]
+        for name, project_id, _ in sorted(by_stage[stage], key=lambda item: item[0].lower()):
+            lines.append(f"- {_link('Projects', name, project_id)}")
+    return "\n".join(lines) + "\n"
+
+
+def _link(folder: str, name: str, label: str | None = None) -> str:
+    # Folder-qualified, so a tag and a project with the same name never collide.
+    return f"[[{VAULT_FOLDER}/{folder}/{note_name(name)}|{label or name}]]"
+
+
+def _stage_name(metadata: dict) -> str:
+    raw = str(metadata.get("stage") or "")
+    role = stage_role_from_label(raw)
+    return stage_label(role) if role else raw or "?"
+
+
+def _tag_slug(tag: str) -> str:
+    return re.sub(r"[^\w/-]+", "-", tag.strip()).strip("-")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from .constants import stage_dirs
+from .constants import root_stage_dirs
 from ..config import load_config
 
 
@@ -24,14 +24,14 @@ def base_projects_path() -> Path:
 def ensure_base_structure(base_path: Path) -> None:
     """Create the base folder structure if missing."""
     base_path.mkdir(parents=True, exist_ok=True)
-    for folder in stage_dirs().values():
+    for folder in root_stage_dirs(base_path).values():
         (base_path / folder).mkdir(parents=True, exist_ok=True)
 
 
 def find_project_by_id(base_path: Path, project_id: str) -> Path | None:
     """Locate a project by ID across stages and categories."""
     candidates: list[Path] = []
-    for folder in stage_dirs().values():
+    for folder in root_stage_dirs(base_path).values():
         stage_dir = base_path / folder
         direct = stage_dir / project_id
         if direct.exists():
@@ -54,9 +54,11 @@ def resolve_project_path(path: str | None, project_id: str | None) -> Path:
     if path:
         return Path(path).expanduser().resolve()
     if project_id:
+        from .roots import find_project
+
         base_path = base_projects_path()
         ensure_base_structure(base_path)
-        found = find_project_by_id(base_path, project_id)
+        found = find_project(project_id)
         if not found:
             raise RuntimeError(f"Project id not found: {project_id}")
         return found.resolve()
@@ -0,0 +1,276 @@
+"""Persistent file-backed queue for background `git push` jobs."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from ..config import default_config_path
+from .locks import pid_alive
+
+PENDING = "pending"
+RUNNING = "running"
+FAILED = "failed"
+WORKER_PID_FILE = "worker.pid"
+
+PUSH_TIMEOUT = 600
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_QUEUE_WORKERS = 4
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 600.0
+
+
+def queue_dir() -> Path:
+    return default_config_path().parent / "queue"
+
+
+def enqueue_push(project_path: Path, project_id: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> dict:
+    """Record a push job; the file only appears in pending/ once fully written."""
+    job = {
+        "id": f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}",
+        "kind": "push",
+        "path": str(project_path),
+        "project_id": project_id,
+        "attempts": 0,
+        "max_attempts": max_attempts,
+        "next_attempt": 0.0,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "last_error": None,
+    }
+    _write_job(PENDING, job)
+    return job
+
+
+def list_jobs(state: str) -> list[dict]:
+    folder = queue_dir() / state
+    if not folder.exists():
+        return []
+    jobs = []
+    for path in sorted(folder.glob("*.json")):
+        job = _read_job(path)
+        if job is not None:
+            jobs.append(job)
+    return jobs
+
+
+def retry_failed() -> int:
+    """Move every failed job back to pending with a fresh attempt budget."""
+    moved = 0
+    for job in list_jobs(FAILED):
+        job["attempts"] = 0
+        job["next_attempt"] = 0.0
+        _write_job(PENDING, job)
+        (queue_dir() / FAILED / f"{job['id']}.json").unlink(missing_ok=True)
+        moved += 1
+    return moved
+
+
+def clear_failed() -> int:
+    jobs = list_jobs(FAILED)
+    for job in jobs:
+        (queue_dir() / FAILED / f"{job['id']}.json").unlink(missing_ok=True)
+    return len(jobs)
+
+
+def acquire_worker() -> bool:
+    """Become the single queue worker; stale pid files from dead workers are replaced."""
+    path = queue_dir() / WORKER_PID_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            if worker_running():
+                return False
+            path.unlink(missing_ok=True)
+            continue
+        with os.fdopen(fd, "w") as handle:
+            handle.write(str(os.getpid()))
+        return True
+    return False
+
+
+def release_worker() -> None:
+    path = queue_dir() / WORKER_PID_FILE
+    try:
+        if int(path.read_text().strip()) == os.getpid():
+            path.unlink()
+    except (OSError, ValueError):
+        pass
+
+
+def worker_running() -> bool:
+    try:
+        pid = int((queue_dir() / WORKER_PID_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return False
+    return pid_alive(pid)
+
+
+def spawn_worker() -> None:
+    """Start `citera worker` detached, unless one is already draining the queue."""
+    if worker_running():
+        return
+    subprocess.Popen(
+        [sys.executable, "-m", "citera", "worker"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def recover_running() -> int:
+    """Return jobs left in running/ by a worker that died back to pending."""
+    recovered = 0
+    for job in list_jobs(RUNNING):
+        if pid_alive(int(job.get("worker_pid") or 0)):
+            continue
+        _write_job(PENDING, job)
+        (queue_dir() / RUNNING / f"{job['id']}.json").unlink(missing_ok=True)
+        recovered += 1
+    return recovered
+
+
+def drain_queue(
+    max_workers: int = DEFAULT_QUEUE_WORKERS,
+    watch: bool = False,
+    poll_interval: float = 5.0,
+    report: Callable[[dict, str | None], None] | None = None,
+) -> tuple[int, int]:
+    """Run due jobs with at most `max_workers` pushes in flight.
+
+    Returns (succeeded, failed permanently). Without `watch`, returns once no
+    pending jobs remain, sleeping until backed-off jobs become due.
+    """
+    succeeded = failed = 0
+    recover_running()
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: set[Future] = set()
+        while True:
+            # Claim only as many jobs as there are free slots, so a slow push
+            # never holds back jobs that could start on the other slots.
+            if len(in_flight) < workers:
+                for job in _claim_due_jobs(workers - len(in_flight)):
+                    in_flight.add(executor.submit(_run_job, job))
+            if in_flight:
+                done, in_flight = wait(
+                    in_flight, timeout=poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    job, error = future.result()
+                    if error is None:
+                        succeeded += 1
+                    elif job["attempts"] >= job["max_attempts"]:
+                        failed += 1
+                    if report:
+                        report(job, error)
+                continue
+            pending = list_jobs(PENDING)
+            if not pending and not watch:
+                return succeeded, failed
+            due = min((job.get("next_attempt", 0.0) for job in pending), default=None)
+            delay = poll_interval if due is None else max(0.0, min(due - time.time(), poll_interval))
+            time.sleep(delay or 0.1)
+
+
+def backoff_delay(attempts: int) -> float:
+    """Exponential backoff with full jitter, capped at BACKOFF_MAX."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1)))
+
+
+def _claim_due_jobs(limit: int) -> list[dict]:
+    now = time.time()
+    claimed: list[dict] = []
+    for job in list_jobs(PENDING):
+        if len(claimed) >= limit:
+            break
+        if job.get("next_attempt", 0.0) > now:
+            continue
+        source = queue_dir() / PENDING / f"{job['id']}.json"
+        target = queue_dir() / RUNNING / f"{job['id']}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Rename is the claim: only one worker can move a given file.
+            os.rename(source, target)
+        except FileNotFoundError:
+            continue
+        job["worker_pid"] = os.getpid()
+        _write_job(RUNNING, job)
+        claimed.append(job)
+    return claimed
+
+
+def _run_job(job: dict) -> tuple[dict, str | None]:
+    running = queue_dir() / RUNNING / f"{job['id']}.json"
+    error = _push(job)
+    job["attempts"] = int(job.get("attempts", 0)) + 1
+    job.pop("worker_pid", None)
+    if error is None:
+        running.unlink(missing_ok=True)
+        return job, None
+    job["last_error"] = error
+    if job["attempts"] >= job["max_attempts"]:
+        _write_job(FAILED, job)
+    else:
+        job["next_attempt"] = time.time() + backoff_delay(job["attempts"])
+        _write_job(PENDING, job)
+    running.unlink(missing_ok=True)
+    return job, error
+
+
+def _push(job: dict) -> str | None:
+    project_path = Path(job["path"])
+    if not project_path.exists():
+        # The project may have been promoted again since the job was queued.
+        from .roots import find_project
+
+        try:
+            found = find_project(str(job.get("project_id")))
+        except RuntimeError as exc:
+            return str(exc)
+        if not found:
+            return f"Project not found: {job['path']}"
+        project_path = found
+        job["path"] = str(found)
+    try:
+        result = subprocess.run(
+            ["git", "push", "-u", "origin", "HEAD"],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=PUSH_TIMEOUT,
+            env=dict(os.environ, GIT_TERMINAL_PROMPT="0"),
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        return str(exc)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return lines[-1] if lines else f"git push exited with {result.returncode}"
+    return None
+
+
+def _write_job(state: str, job: dict) -> None:
+    folder = queue_dir() / state
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{job['id']}.json"
+    tmp_path = folder / f".{job['id']}.{os.getpid()}.tmp"
+    tmp_path.write_text(json.dumps(job, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _read_job(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
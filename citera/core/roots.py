@@ -0,0 +1,152 @@
+"""Named projects roots, federated across volumes."""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..config import load_config
+from .constants import root_stage_dirs
+from .index import refresh_index
+from .paths import base_projects_path, ensure_base_structure, find_project_by_id
+
+PRIMARY_ROOT = "main"
+
+
+@dataclass(frozen=True)
+class ProjectRoot:
+    name: str
+    path: Path
+
+    def stage_path(self, role: str) -> Path:
+        return self.path / root_stage_dirs(self.path)[role]
+
+
+def parse_roots(value: str) -> list[tuple[str, str]]:
+    """Parse `name=path,name=path`; raises ValueError on malformed items."""
+    pairs: list[tuple[str, str]] = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, sep, path = item.partition("=")
+        name, path = name.strip(), path.strip()
+        if not sep or not name or not path:
+            raise ValueError(f"Expected name=path, got: {item}")
+        pairs.append((name, path))
+    return pairs
+
+
+def project_roots() -> list[ProjectRoot]:
+    """The primary root first, then every extra root from the `roots` config.
+
+    The primary root is the one `base_projects_path()` resolves; an extra root
+    pointing at the same folder just renames it.
+    """
+    primary = ProjectRoot(PRIMARY_ROOT, base_projects_path())
+    roots = [primary]
+    try:
+        pairs = parse_roots(str(load_config().get("roots") or ""))
+    except ValueError:
+        pairs = []
+    for name, raw_path in pairs:
+        path = Path(raw_path).expanduser()
+        if path == primary.path:
+            roots[0] = primary = ProjectRoot(name, path)
+            continue
+        if any(root.name == name or root.path == path for root in roots):
+            continue
+        roots.append(ProjectRoot(name, path))
+    return roots
+
+
+def get_root(name: str) -> ProjectRoot | None:
+    for root in project_roots():
+        if root.name == name:
+            return root
+    return None
+
+
+def archive_root() -> ProjectRoot | None:
+    """Root named by the `archive_root` config, where promote places archives."""
+    name = str(load_config().get("archive_root") or "").strip()
+    return get_root(name) if name else None
+
+
+def root_for_path(path: Path) -> ProjectRoot | None:
+    """The root containing `path` (the deepest one, if roots are nested)."""
+    resolved = path.resolve()
+    best: ProjectRoot | None = None
+    for root in project_roots():
+        try:
+            resolved.relative_to(root.path.resolve())
+        except ValueError:
+            continue
+        if best is None or len(root.path.resolve().parts) > len(best.path.resolve().parts):
+            best = root
+    return best
+
+
+def root_mounted(root: ProjectRoot) -> bool:
+    """The primary root is always usable; an extra root only when its folder exists."""
+    return root.path == base_projects_path() or root.path.is_dir()
+
+
+def available_roots(roots: list[ProjectRoot] | None = None) -> list[ProjectRoot]:
+    """Roots whose folder exists; extra roots on unmounted volumes are skipped."""
+    roots = project_roots() if roots is None else roots
+    return [root for root in roots if root_mounted(root)]
+
+
+def refresh_indexes(roots: list[ProjectRoot] | None = None) -> list[tuple[ProjectRoot, dict]]:
+    """Refresh every root's index concurrently, preserving root order."""
+    roots = available_roots(roots)
+
+    def _refresh(root: ProjectRoot) -> dict:
+        ensure_base_structure(root.path)
+        return refresh_index(root.path)
+
+    if len(roots) == 1:
+        return [(roots[0], _refresh(roots[0]))]
+    with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+        return list(zip(roots, executor.map(_refresh, roots)))
+
+
+def find_project(project_id: str) -> Path | None:
+    """Locate a project by id across every root, scanning them concurrently."""
+    roots = available_roots()
+    with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+        found = [
+            path
+            for path in executor.map(lambda root: find_project_by_id(root.path, project_id), roots)
+            if path is not None
+        ]
+    if not found:
+        return None
+    if len(found) > 1:
+        raise RuntimeError(f"Multiple projects found for id {project_id}.")
+    return found[0]
+
+
+def move_project(source: Path, destination: Path) -> None:
+    """Rename within a volume; copy then delete when the roots sit on different ones.
+
+    A copy that fails part way is removed so the source stays the only copy.
+    """
+    try:
+        os.rename(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        try:
+            shutil.copytree(source, destination, symlinks=True)
+        except FileExistsError:
+            raise
+        except OSError:
+            shutil.rmtree(destination, ignore_errors=True)
+            raise
+        shutil.rmtree(source)
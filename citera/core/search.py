@@ -0,0 +1,265 @@
+"""Persistent inverted index for full-text project search."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from pathlib import Path
+
+from .files import mtime_ns, read_head
+from .index import index_dir
+from .snippets import extract_snippet
+from .walk import WalkEntry, walk_project
+
+SEARCH_FILE = "search.json"
+SEARCH_VERSION = 2
+TEXT_READ_BYTES = 64 * 1024
+SOURCE_FILE_LIMIT = 200
+SOURCE_SNIPPET_CHARS = 4000
+SOURCE_EXTENSIONS = {
+    ".py",
+    ".js",
+    ".ts",
+    ".tsx",
+    ".rs",
+    ".go",
+    ".java",
+    ".rb",
+    ".php",
+    ".cs",
+    ".c",
+    ".cpp",
+}
+
+METADATA_FIELDS = ("id", "name", "description", "tags", "tech", "category")
+TEXT_FILES = ("playground.md", "README.md")
+
+# BM25 parameters.
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def search_index_path(base_path: Path) -> Path:
+    return index_dir(base_path) / SEARCH_FILE
+
+
+def tokenize(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def load_search_index(base_path: Path) -> dict:
+    path = search_index_path(base_path)
+    empty = {"version": SEARCH_VERSION, "source": False, "docs": {}, "postings": {}}
+    if not path.exists():
+        return empty
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if data.get("version") != SEARCH_VERSION:
+        return empty
+    return data
+
+
+def save_search_index(base_path: Path, search_index: dict) -> None:
+    path = search_index_path(base_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(search_index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def update_search_index(base_path: Path, index: dict, include_source: bool = False) -> dict:
+    """Re-index only projects whose metadata, notes, or README mtimes changed."""
+    search_index = load_search_index(base_path)
+    if search_index.get("source") != include_source:
+        search_index = {
+            "version": SEARCH_VERSION,
+            "source": include_source,
+            "docs": {},
+            "postings": {},
+        }
+    docs: dict[str, dict] = search_index["docs"]
+    postings: dict[str, dict[str, list[int]]] = search_index["postings"]
+    changed = False
+
+    for key in list(docs):
+        if key not in index["projects"]:
+            _remove_doc(postings, docs, key)
+            changed = True
+
+    for key, entry in index["projects"].items():
+        project_path = base_path / key
+        signature = [entry.get("mtime")] + [mtime_ns(project_path / name) for name in TEXT_FILES]
+        source_files = _source_files(project_path) if include_source else None
+        if source_files is not None:
+            signature.append(_files_signature(source_files))
+        existing = docs.get(key)
+        if existing and existing.get("signature") == signature:
+            continue
+        if existing:
+            _remove_doc(postings, docs, key)
+        tokens = _document_tokens(project_path, entry.get("metadata", {}), source_files)
+        terms: set[str] = set()
+        for position, token in enumerate(tokens):
+            if token:
+                postings.setdefault(token, {}).setdefault(key, []).append(position)
+                terms.add(token)
+        metadata = entry.get("metadata", {})
+        docs[key] = {
+            "signature": signature,
+            "terms": sorted(terms),
+            "length": sum(1 for token in tokens if token),
+            "stage": str(metadata.get("stage") or ""),
+            "category": str(metadata.get("category") or ""),
+        }
+        changed = True
+
+    if changed:
+        save_search_index(base_path, search_index)
+    return search_index
+
+
+def search(
+    search_index: dict,
+    query: str,
+    stage: str | None = None,
+    category: str | None = None,
+    limit: int = 20,
+) -> list[tuple[str, float]]:
+    """Rank documents with BM25; quoted phrases must match consecutively."""
+    docs = search_index["docs"]
+    postings = search_index["postings"]
+    phrases = [tokenize(phrase) for phrase in re.findall(r'"([^"]+)"', query)]
+    phrases = [phrase for phrase in phrases if phrase]
+    terms = tokenize(re.sub(r'"[^"]*"', " ", query))
+    terms.extend(token for phrase in phrases for token in phrase)
+    if not terms:
+        return []
+
+    candidates = {
+        key
+        for key, info in docs.items()
+        if (not stage or info["stage"].lower() == stage.lower())
+        and (not category or info["category"].lower() == category.lower())
+    }
+    for phrase in phrases:
+        candidates &= _phrase_matches(postings, phrase)
+
+    total = len(docs) or 1
+    average_length = sum(info["length"] for info in docs.values()) / total or 1.0
+    scores: dict[str, float] = {}
+    for term in set(terms):
+        matches = postings.get(term, {})
+        if not matches:
+            continue
+        idf = math.log(1 + (total - len(matches) + 0.5) / (len(matches) + 0.5))
+        for key, positions in matches.items():
+            if key not in candidates:
+                continue
+            frequency = len(positions)
+            norm = 1 - BM25_B + BM25_B * docs[key]["length"] / average_length
+            scores[key] = scores.get(key, 0.0) + idf * frequency * (BM25_K1 + 1) / (
+                frequency + BM25_K1 * norm
+            )
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return ranked[:limit]
+
+
+def _phrase_matches(postings: dict, phrase: list[str]) -> set[str]:
+    lists = [postings.get(token, {}) for token in phrase]
+    if not all(lists):
+        return set()
+    matches: set[str] = set()
+    for key in set.intersection(*(set(item) for item in lists)):
+        starts = set(lists[0][key])
+        for offset, token_postings in enumerate(lists[1:], start=1):
+            starts &= {position - offset for position in token_postings[key]}
+            if not starts:
+                break
+        if starts:
+            matches.add(key)
+    return matches
+
+
+def _remove_doc(postings: dict, docs: dict, key: str) -> None:
+    info = docs.pop(key, None) or {}
+    for term in info.get("terms", []):
+        matches = postings.get(term)
+        if matches is None:
+            continue
+        matches.pop(key, None)
+        if not matches:
+            del postings[term]
+
+
+def _document_tokens(
+    project_path: Path, metadata: dict, source_files: list[WalkEntry] | None
+) -> list[str]:
+    parts: list[str] = []
+    for field in METADATA_FIELDS:
+        value = metadata.get(field)
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        if value:
+            parts.append(str(value))
+    for filename in TEXT_FILES:
+        text = read_head(project_path / filename, TEXT_READ_BYTES)
+        if text:
+            parts.append(text)
+    tokens: list[str] = []
+    for part in parts:
+        tokens.extend(tokenize(part))
+        # Empty sentinels take a position but are never indexed, so phrases
+        # cannot match across field boundaries.
+        tokens.append("")
+    if source_files:
+        tokens.extend(_source_identifiers(source_files))
+    return tokens
+
+
+def _source_files(project_path: Path) -> list[WalkEntry]:
+    """The source files whose outlines are indexed, in walk order."""
+    files: list[WalkEntry] = []
+    for item in walk_project(project_path):
+        if len(files) >= SOURCE_FILE_LIMIT:
+            break
+        if os.path.splitext(item.entry.name)[1].lower() in SOURCE_EXTENSIONS:
+            files.append(item)
+    return files
+
+
+def _files_signature(files: list[WalkEntry]) -> str:
+    """Digest of each file's path and mtime; any edit, addition, or removal changes it."""
+    digest = hashlib.sha1()
+    for item in files:
+        try:
+            mtime = item.entry.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        digest.update(f"{item.relative}\0{mtime}\n".encode("utf-8", errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def _source_identifiers(files: list[WalkEntry]) -> list[str]:
+    """Identifiers from source outlines (declarations, not bodies)."""
+    identifiers: list[str] = []
+    for item in files:
+        outline = extract_snippet(Path(item.entry.path), SOURCE_SNIPPET_CHARS)
+        if not outline:
+            continue
+        for identifier in re.findall(r"[A-Za-z_][A-Za-z0-9_]{2,}", outline):
+            # Queries split on "_" like every other token, so snake_case names are
+            # only findable by their parts; camelCase names also match whole.
+            if "_" not in identifier:
+                identifiers.append(identifier.lower())
+            identifiers.extend(
+                part.lower()
+                for part in re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", identifier)
+                if part.lower() != identifier.lower()
+            )
+        identifiers.append("")
+    return identifiers
@@ -0,0 +1,176 @@
+"""TF-IDF similarity search across indexed projects."""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import re
+import zipfile
+import zlib
+from pathlib import Path
+
+from .files import mtime_ns, read_head
+from .index import index_dir
+
+SIMILAR_DIM = 4096
+SIMILAR_MATRIX_FILE = "similar.npz"
+SIMILAR_META_FILE = "similar.json"
+TEXT_READ_BYTES = 16 * 1024
+
+# Field weights: identity fields count more than free-form notes.
+FIELD_WEIGHTS = {"name": 3.0, "tags": 3.0, "tech": 2.0, "description": 2.0, "category": 1.0}
+TEXT_FILES = {"playground.md": 1.0, "README.md": 1.0}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "with", "project", "md",
+}
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise RuntimeError("Missing numpy package. Install with: pip install numpy") from exc
+    return numpy
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in re.findall(r"[a-z0-9]+", text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def update_similarity(base_path: Path, index: dict) -> tuple[list[str], object]:
+    """Return (index keys, raw term-count matrix), rebuilding only changed rows."""
+    np = _require_numpy()
+    matrix_path = index_dir(base_path) / SIMILAR_MATRIX_FILE
+    meta_path = index_dir(base_path) / SIMILAR_META_FILE
+    stored_keys: list[str] = []
+    stored_signatures: dict[str, list] = {}
+    stored_counts = np.zeros((0, SIMILAR_DIM), dtype=np.float32)
+    if matrix_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            with np.load(matrix_path) as data:
+                stored_counts = data["counts"]
+            stored_keys = list(meta["keys"])
+            stored_signatures = dict(meta["signatures"])
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            EOFError,
+            zlib.error,
+            zipfile.BadZipFile,
+            pickle.UnpicklingError,
+        ):
+            # An unreadable cache (torn write, disk error) is rebuilt from scratch.
+            stored_keys, stored_signatures = [], {}
+            stored_counts = np.zeros((0, SIMILAR_DIM), dtype=np.float32)
+    if stored_counts.shape != (len(stored_keys), SIMILAR_DIM):
+        stored_keys, stored_signatures = [], {}
+        stored_counts = np.zeros((0, SIMILAR_DIM), dtype=np.float32)
+    positions = {key: row for row, key in enumerate(stored_keys)}
+
+    keys = sorted(index["projects"])
+    signatures: dict[str, list] = {}
+    reuse_rows: list[int] = []
+    reuse_targets: list[int] = []
+    fresh_rows: list[int] = []
+    fresh_vectors = []
+    for target, key in enumerate(keys):
+        entry = index["projects"][key]
+        project_path = base_path / key
+        signature = [entry.get("mtime")] + [mtime_ns(project_path / name) for name in TEXT_FILES]
+        signatures[key] = signature
+        if key in positions and stored_signatures.get(key) == signature:
+            reuse_rows.append(positions[key])
+            reuse_targets.append(target)
+            continue
+        fresh_rows.append(target)
+        fresh_vectors.append(_project_vector(np, project_path, entry.get("metadata", {})))
+
+    counts = np.zeros((len(keys), SIMILAR_DIM), dtype=np.float32)
+    if reuse_rows:
+        counts[reuse_targets] = stored_counts[reuse_rows]
+    if fresh_rows:
+        counts[fresh_rows] = np.vstack(fresh_vectors)
+    if fresh_rows or keys != stored_keys:
+        matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_matrix = matrix_path.with_name(f"similar.{os.getpid()}.tmp.npz")
+        np.savez(tmp_matrix, counts=counts)
+        os.replace(tmp_matrix, matrix_path)
+        tmp_meta = meta_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_meta.write_text(json.dumps({"keys": keys, "signatures": signatures}), encoding="utf-8")
+        os.replace(tmp_meta, meta_path)
+    return keys, counts
+
+
+def tfidf_matrix(counts):
+    """Weight raw counts by sublinear TF and smoothed IDF, then L2-normalize rows."""
+    np = _require_numpy()
+    rows = counts.shape[0]
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1.0 + rows) / (1.0 + document_frequency)) + 1.0
+    weighted = np.log1p(counts) * idf.astype(np.float32)
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return weighted / norms
+
+
+def similar_projects(
+    base_path: Path, index: dict, key: str, top_k: int = 5
+) -> list[tuple[str, float]]:
+    """Return the top-k (index key, cosine score) neighbours of `key`."""
+    np = _require_numpy()
+    keys, counts = update_similarity(base_path, index)
+    if top_k < 1 or key not in keys or len(keys) < 2:
+        return []
+    vectors = tfidf_matrix(counts)
+    row = keys.index(key)
+    scores = vectors @ vectors[row]
+    scores[row] = -1.0
+    k = min(top_k, len(keys) - 1)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    ranked = candidates[np.argsort(-scores[candidates])]
+    return [(keys[i], float(scores[i])) for i in ranked if scores[i] > 0]
+
+
+def find_index_key(index: dict, project_id: str) -> str | None:
+    """Find the index key whose metadata id matches `project_id`."""
+    for key, entry in index["projects"].items():
+        if str(entry.get("metadata", {}).get("id")) == project_id:
+            return key
+    return None
+
+
+def _project_vector(np, project_path: Path, metadata: dict):
+    vector = np.zeros(SIMILAR_DIM, dtype=np.float32)
+    for field, weight in FIELD_WEIGHTS.items():
+        value = metadata.get(field)
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        if value:
+            _add_tokens(np, vector, tokenize(str(value)), weight)
+    for filename, weight in TEXT_FILES.items():
+        text = read_head(project_path / filename, TEXT_READ_BYTES)
+        if text:
+            _add_tokens(np, vector, tokenize(text), weight)
+    return vector
+
+
+def _add_tokens(np, vector, tokens: list[str], weight: float) -> None:
+    """Hash tokens into feature buckets (the hashing trick keeps the width fixed)."""
+    if not tokens:
+        return
+    buckets = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) % SIMILAR_DIM for token in tokens),
+        dtype=np.int64,
+        count=len(tokens),
+    )
+    np.add.at(vector, buckets, weight)
@@ -0,0 +1,201 @@
+"""Bounded, structure-aware snippet extraction for AI context."""
+
+from __future__ import annotations
+
+import ast
+import re
+from pathlib import Path
+
+SNIPPET_READ_BYTES = 32 * 1024
+BINARY_SNIFF_BYTES = 8 * 1024
+MINIFIED_LINE_CHARS = 500
+DOCSTRING_CHARS = 400
+
+LICENSE_MARKERS = ("copyright", "license", "spdx-license-identifier", "all rights reserved")
+
+# Regex outlines per extension: each pattern matches a declaration at line start.
+# Patterns use `[ \t]` rather than `\s` so a match never spans blank lines, and no
+# quantified group overlaps the next one; either mistake backtracks exponentially.
+OUTLINE_PATTERNS = {
+    ".js": (
+        r"^(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function[ \t]*\*?[ \t]*\w*[ \t]*"
+        r"\([^)]*\)",
+        r"^(?:export[ \t]+)?(?:default[ \t]+)?class[ \t]+\w+(?:[ \t]+extends[ \t]+[\w.]+)?",
+        r"^(?:export[ \t]+)?const[ \t]+\w+[ \t]*=[ \t]*(?:async[ \t]*)?(?:\([^)]*\)|\w+)[ \t]*=>",
+        r"^module\.exports[ \t]*=.*",
+    ),
+    ".ts": (
+        r"^(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function[ \t]*\*?[ \t]*\w*[ \t]*"
+        r"(?:<[^>]*>)?\([^)]*\)[^{\n]*",
+        r"^(?:export[ \t]+)?(?:default[ \t]+)?(?:abstract[ \t]+)?class[ \t]+\w+[^{\n]*",
+        r"^(?:export[ \t]+)?(?:interface|type|enum)[ \t]+\w+[^{=\n]*",
+        r"^(?:export[ \t]+)?const[ \t]+\w+[ \t]*(?::[^=\n]+)?=[ \t]*(?:async[ \t]*)?\([^)]*\)"
+        r"[^=\n]*=>",
+    ),
+    ".rs": (
+        r"^[ \t]*(?:pub(?:\([\w:]+\))?[ \t]+)?(?:async[ \t]+)?(?:unsafe[ \t]+)?fn[ \t]+\w+[^{;]*",
+        r"^(?:pub(?:\([\w:]+\))?[ \t]+)?(?:struct|enum|trait|type|mod)[ \t]+\w+[^{;]*",
+        r"^impl\b[^{]*",
+    ),
+    ".go": (
+        r"^func[ \t][^{]*",
+        r"^type[ \t]+\w+[ \t]+[^{\n]*",
+        r"^package[ \t]+\w+",
+    ),
+    ".java": (
+        r"^[ \t]*(?:(?:public|protected|private|internal|abstract|final|static|sealed|open|data)"
+        r"[ \t]+)*(?:class|interface|enum|record)[ \t]+\w+[^{\n]*",
+        r"^[ \t]{2,4}(?:public|protected|private)[ \t]+(?:[\w<>\[\],.?]+[ \t]+)*\w+[ \t]*"
+        r"\([^)]*\)",
+    ),
+    ".c": (
+        r"^(?:[A-Za-z_]\w*[ \t*]+)+\w+[ \t]*\([^;{)]*\)[ \t]*(?:\{|$)",
+        r"^(?:typedef[ \t]+)?struct[ \t]+\w+",
+    ),
+    ".rb": (r"^[ \t]*(?:class|module)[ \t]+[\w:]+.*", r"^[ \t]*def[ \t]+[\w.?!]+.*"),
+    ".php": (
+        r"^[ \t]*(?:abstract[ \t]+|final[ \t]+)?class[ \t]+\w+[^{\n]*",
+        r"^[ \t]*(?:public[ \t]+|private[ \t]+|protected[ \t]+)?(?:static[ \t]+)?function[ \t]+\w+"
+        r"[ \t]*\([^)]*\)",
+    ),
+}
+OUTLINE_PATTERNS[".mjs"] = OUTLINE_PATTERNS[".cjs"] = OUTLINE_PATTERNS[".jsx"] = OUTLINE_PATTERNS[".js"]
+OUTLINE_PATTERNS[".tsx"] = OUTLINE_PATTERNS[".ts"]
+OUTLINE_PATTERNS[".kt"] = OUTLINE_PATTERNS[".cs"] = OUTLINE_PATTERNS[".java"]
+OUTLINE_PATTERNS[".h"] = OUTLINE_PATTERNS[".cpp"] = OUTLINE_PATTERNS[".cc"] = OUTLINE_PATTERNS[".c"]
+
+_COMMENT_BLOCK = re.compile(r"\s*((?://[^\n]*\n|#(?:[ !][^\n]*)?\n)+|/\*.*?\*/)", re.S)
+
+_COMPILED_OUTLINES = {
+    ext: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.M)
+    for ext, patterns in OUTLINE_PATTERNS.items()
+}
+
+
+def extract_snippet(path: Path, limit: int) -> str | None:
+    """Return a compact, high-signal excerpt of a source file.
+
+    Reads at most `SNIPPET_READ_BYTES`, skips binary and minified content, and
+    prefers a structural outline (docstring plus declarations) over raw text.
+    """
+    try:
+        with path.open("rb") as handle:
+            raw = handle.read(SNIPPET_READ_BYTES + 1)
+    except OSError:
+        return None
+    truncated = len(raw) > SNIPPET_READ_BYTES
+    raw = raw[:SNIPPET_READ_BYTES]
+    if is_binary(raw):
+        return None
+    text = raw.decode("utf-8", errors="ignore")
+    if truncated:
+        # Drop the partial last line so outlines never see half a declaration.
+        text = text.rsplit("\n", 1)[0]
+    if not text.strip() or is_minified(text):
+        return None
+
+    ext = path.suffix.lower()
+    if ext in (".py", ".pyi"):
+        outline = _python_outline(text)
+    elif ext in _COMPILED_OUTLINES:
+        outline = _regex_outline(text, _COMPILED_OUTLINES[ext])
+    else:
+        outline = None
+    if outline:
+        return outline[:limit]
+    return _strip_license_header(text).strip()[:limit] or None
+
+
+def is_binary(raw: bytes) -> bool:
+    """Treat content with NUL bytes in the first block as binary."""
+    return b"\0" in raw[:BINARY_SNIFF_BYTES]
+
+
+def is_minified(text: str) -> bool:
+    """Detect bundles and minified assets by their very long lines."""
+    lines = text.splitlines()
+    if not lines:
+        return False
+    longest = max(len(line) for line in lines[:50])
+    average = len(text) / len(lines)
+    return longest > MINIFIED_LINE_CHARS * 4 or average > MINIFIED_LINE_CHARS
+
+
+def _python_outline(text: str) -> str | None:
+    tree = _parse_python(text)
+    if tree is None:
+        return _regex_outline(text, re.compile(r"^(?:async\s+def|def|class)\s+\w+[^:]*", re.M))
+    lines: list[str] = []
+    docstring = ast.get_docstring(tree)
+    if docstring:
+        lines.append(f'"""{docstring.strip()[:DOCSTRING_CHARS]}"""')
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+            returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+            lines.append(f"{prefix} {node.name}({ast.unparse(node.args)}){returns}")
+            summary = _first_doc_line(node)
+            if summary:
+                lines.append(f"    {summary}")
+        elif isinstance(node, ast.ClassDef):
+            bases = ", ".join(ast.unparse(base) for base in node.bases)
+            lines.append(f"class {node.name}({bases})" if bases else f"class {node.name}")
+            summary = _first_doc_line(node)
+            if summary:
+                lines.append(f"    {summary}")
+            methods = [
+                item.name
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and not item.name.startswith("__")
+            ]
+            if methods:
+                lines.append(f"    methods: {', '.join(methods)}")
+    return "\n".join(lines) or None
+
+
+def _parse_python(text: str) -> ast.Module | None:
+    try:
+        return ast.parse(text)
+    except (SyntaxError, ValueError, RecursionError):
+        pass
+    # A truncated window usually breaks mid-block; retry up to the last top-level line.
+    cut = max(text.rfind("\ndef "), text.rfind("\nclass "), text.rfind("\nasync def "))
+    if cut <= 0:
+        return None
+    try:
+        return ast.parse(text[:cut])
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+
+def _first_doc_line(node: ast.AST) -> str | None:
+    docstring = ast.get_docstring(node)
+    if not docstring:
+        return None
+    return docstring.strip().splitlines()[0][:120]
+
+
+def _regex_outline(text: str, pattern: re.Pattern) -> str | None:
+    header = _leading_comment(text)
+    lines = [header] if header else []
+    lines.extend(" ".join(match.group(0).rstrip("{").split()) for match in pattern.finditer(text))
+    return "\n".join(lines) or None
+
+
+def _leading_comment(text: str) -> str | None:
+    """Return the first doc comment block, skipping license headers."""
+    match = _COMMENT_BLOCK.match(text)
+    if not match:
+        return None
+    block = match.group(1).strip()
+    if any(marker in block.lower() for marker in LICENSE_MARKERS):
+        return None
+    return block[:DOCSTRING_CHARS]
+
+
+def _strip_license_header(text: str) -> str:
+    match = _COMMENT_BLOCK.match(text)
+    if match and any(marker in match.group(1).lower() for marker in LICENSE_MARKERS):
+        return text[match.end():]
+    return text
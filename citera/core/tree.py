@@ -0,0 +1,168 @@
+"""Bounded hierarchical summary of a project tree."""
+
+from __future__ import annotations
+
+import heapq
+import os
+from collections import Counter
+
+TREE_MAX_DEPTH = 4
+TREE_MAX_NODES = 4096
+TREE_MAX_LINES = 40
+TREE_EXT_LIMIT = 12
+COLLAPSE_MIN_SIBLINGS = 6
+COLLAPSE_KEEP_LARGEST = 2
+
+
+class _Node:
+    __slots__ = ("files", "bytes", "extensions")
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.bytes = 0
+        self.extensions: Counter[str] = Counter()
+
+
+class TreeSummary:
+    """Aggregate per-directory counts in one pass with bounded memory.
+
+    Directories deeper than `max_depth`, or discovered after `max_nodes`
+    directories are tracked, roll up into their nearest tracked ancestor, so
+    memory and output size stay fixed regardless of the number of files.
+    """
+
+    def __init__(self, max_depth: int = TREE_MAX_DEPTH, max_nodes: int = TREE_MAX_NODES) -> None:
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.nodes: dict[str, _Node] = {"": _Node()}
+
+    def add(self, relative: str, size: int) -> None:
+        """Count one file (relative path with forward slashes) in every tracked ancestor."""
+        parts = relative.split("/")[:-1][: self.max_depth]
+        ext = os.path.splitext(relative)[1].lower() or "(none)"
+        key = ""
+        self._count(self.nodes[""], size, ext)
+        for part in parts:
+            key = f"{key}/{part}" if key else part
+            node = self.nodes.get(key)
+            if node is None:
+                if len(self.nodes) >= self.max_nodes:
+                    break
+                node = self.nodes[key] = _Node()
+            self._count(node, size, ext)
+
+    def render(self, max_lines: int = TREE_MAX_LINES) -> list[str]:
+        """Render the largest directories as an indented outline of at most `max_lines`."""
+        children: dict[str, list[str]] = {}
+        for key in self.nodes:
+            if key:
+                parent = key.rsplit("/", 1)[0] if "/" in key else ""
+                children.setdefault(parent, []).append(key)
+
+        root = self.nodes[""]
+        lines: list[tuple[str, str]] = [("", f"./ {_describe(root)}")]
+        # Max-heap of (files, path, label, members) candidates; expanding a
+        # directory pushes its children, so the biggest subtrees surface first.
+        heap: list[tuple[int, str, str, list[str]]] = []
+        self._push_children("", children, heap)
+        hidden = 0
+        while heap:
+            if len(lines) >= max_lines:
+                # Every candidate left over hides its whole subtree, not just itself.
+                hidden = sum(
+                    _subtree_size(key, children) for *_, members in heap for key in members
+                )
+                break
+            _, path, label, members = heapq.heappop(heap)
+            depth = path.count("/") + 1
+            lines.append((path, f"{'  ' * depth}{label}"))
+            if len(members) == 1:
+                self._push_children(members[0], children, heap)
+        lines.sort(key=lambda item: item[0].split("/") if item[0] else [])
+        rendered = [text for _, text in lines]
+        if hidden:
+            rendered.append(f"… {hidden} more directories")
+        return rendered
+
+    def _push_children(
+        self,
+        parent: str,
+        children: dict[str, list[str]],
+        heap: list[tuple[int, str, str, list[str]]],
+    ) -> None:
+        groups: dict[str, list[str]] = {}
+        for key in children.get(parent, []):
+            groups.setdefault(_dominant_extension(self.nodes[key]), []).append(key)
+        for members in groups.values():
+            members.sort(key=lambda key: -self.nodes[key].files)
+            if len(members) >= COLLAPSE_MIN_SIBLINGS:
+                # Siblings sharing a dominant extension collapse into one line,
+                # except the largest few which usually carry the most signal.
+                keep, members = members[:COLLAPSE_KEEP_LARGEST], members[COLLAPSE_KEEP_LARGEST:]
+                for key in keep:
+                    self._push_node(key, heap)
+                merged = _Node()
+                for key in members:
+                    node = self.nodes[key]
+                    merged.files += node.files
+                    merged.bytes += node.bytes
+                    merged.extensions.update(node.extensions)
+                prefix = f"{parent}/" if parent else ""
+                names = ", ".join(sorted(key.rsplit("/", 1)[-1] for key in members)[:3])
+                label = f"*/ ({len(members)} similar dirs: {names}, …) {_describe(merged)}"
+                heapq.heappush(heap, (-merged.files, f"{prefix}*", label, members))
+                continue
+            for key in members:
+                self._push_node(key, heap)
+
+    def _push_node(self, key: str, heap: list[tuple[int, str, str, list[str]]]) -> None:
+        name = key.rsplit("/", 1)[-1]
+        label = f"{name}/ {_describe(self.nodes[key])}"
+        heapq.heappush(heap, (-self.nodes[key].files, key, label, [key]))
+
+    @staticmethod
+    def _count(node: _Node, size: int, ext: str) -> None:
+        node.files += 1
+        node.bytes += size
+        extensions = node.extensions
+        if ext in extensions or len(extensions) < TREE_EXT_LIMIT:
+            extensions[ext] += 1
+            return
+        # Space-saving heavy hitters: evict the rarest extension and inherit its count.
+        rarest = min(extensions, key=extensions.__getitem__)
+        extensions[ext] = extensions.pop(rarest) + 1
+
+
+def format_bytes(size: int) -> str:
+    """Render a byte count as a short human-readable size."""
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KB", "MB", "GB", "TB"):
+        value /= 1024
+        if value < 1024 or unit == "TB":
+            break
+    return f"{value:.1f} {unit}"
+
+
+def _subtree_size(key: str, children: dict[str, list[str]]) -> int:
+    """Number of tracked directories at and below `key`."""
+    count = 0
+    stack = [key]
+    while stack:
+        count += 1
+        stack.extend(children.get(stack.pop(), []))
+    return count
+
+
+def _dominant_extension(node: _Node) -> str:
+    if not node.extensions:
+        return ""
+    return node.extensions.most_common(1)[0][0]
+
+
+def _describe(node: _Node) -> str:
+    top = ", ".join(
+        f"{ext} {count * 100 // node.files}%" for ext, count in node.extensions.most_common(3)
+    )
+    return f"[{node.files} files, {format_bytes(node.bytes)}; {top}]"
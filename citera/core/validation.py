@@ -6,13 +6,38 @@ from .constants import CATEGORY_CHOICES
 from .metadata import normalize_category
 
 SUPPORTED_CATEGORIES = set(CATEGORY_CHOICES.values())
+REQUIRED_FIELDS = {
+    "name": str,
+    "description": str,
+    "tags": list,
+    "tech": list,
+    "category": str,
+}
+
+
+def metadata_schema(closed: bool = True) -> dict:
+    """JSON schema for the metadata `validate_ai_payload` accepts.
+
+    `closed` forbids extra keys, which OpenAI's strict mode requires; Gemini's
+    response schema does not support `additionalProperties`.
+    """
+    properties: dict[str, dict] = {}
+    for key, kind in REQUIRED_FIELDS.items():
+        if kind is list:
+            properties[key] = {"type": "array", "items": {"type": "string"}}
+        else:
+            properties[key] = {"type": "string"}
+    properties["category"]["enum"] = sorted(SUPPORTED_CATEGORIES)
+    schema: dict = {"type": "object", "properties": properties, "required": list(REQUIRED_FIELDS)}
+    if closed:
+        schema["additionalProperties"] = False
+    return schema
 
 
 def validate_ai_payload(payload: dict) -> dict | None:
     """Validate the metadata schema and normalize fields."""
     payload = _normalize_keys(payload)
-    required = {"name", "description", "tags", "tech", "category"}
-    if not required.issubset(payload):
+    if not set(REQUIRED_FIELDS).issubset(payload):
         return None
     if not isinstance(payload["name"], str) or not payload["name"].strip():
         return None
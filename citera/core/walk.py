@@ -0,0 +1,225 @@
+"""Ignore-aware project tree walker shared by context scanning and sizing."""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+CITERA_IGNORE_FILE = ".citeraignore"
+
+# Directories never worth descending into, even without a .gitignore.
+DEFAULT_SKIP_DIRS = {".git", ".venv", "__pycache__", "node_modules", ".mypy_cache"}
+
+
+class WalkEntry(NamedTuple):
+    """A file yielded by `walk_project` (relative path uses forward slashes)."""
+
+    relative: str
+    entry: os.DirEntry
+    depth: int
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+@dataclass
+class IgnoreMatcher:
+    """Compiled rules from one ignore file, scoped to the directory holding it."""
+
+    base: str
+    rules: list[IgnoreRule] = field(default_factory=list)
+    literal_names: set[str] = field(default_factory=set)
+
+    def match(self, relative: str, name: str, is_dir: bool) -> bool | None:
+        """Return True/False when a rule decides, or None when no rule matches."""
+        if self.base:
+            if not relative.startswith(self.base + "/"):
+                return None
+            relative = relative[len(self.base) + 1 :]
+        if name in self.literal_names:
+            return True
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            target = relative if rule.anchored else name
+            if rule.regex.fullmatch(target):
+                return not rule.negate
+        return None
+
+
+def compile_ignore_lines(lines: Iterable[str], base: str = "") -> IgnoreMatcher:
+    """Compile gitignore-syntax lines into a matcher."""
+    rules: list[IgnoreRule] = []
+    for raw in lines:
+        line = raw.rstrip("\n")
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(IgnoreRule(re.compile(_translate(line)), negate, dir_only, anchored))
+    matcher = IgnoreMatcher(base=base)
+    if any(rule.negate for rule in rules):
+        matcher.rules = rules
+        return matcher
+    # Without negations, order does not matter: plain names become set lookups.
+    for rule in rules:
+        pattern = rule.regex.pattern
+        if not rule.anchored and not rule.dir_only and re.fullmatch(r"[\w.\-]+", _unescape(pattern)):
+            matcher.literal_names.add(_unescape(pattern))
+        else:
+            matcher.rules.append(rule)
+    return matcher
+
+
+def load_ignore_file(path: Path, base: str = "") -> IgnoreMatcher | None:
+    try:
+        content = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    matcher = compile_ignore_lines(content.splitlines(), base)
+    if not matcher.rules and not matcher.literal_names:
+        return None
+    return matcher
+
+
+def project_matchers(project_path: Path) -> tuple[list[IgnoreMatcher], list[IgnoreMatcher]]:
+    """Return (git matchers, citera matchers) for the project root.
+
+    Git matchers are `.git/info/exclude` then `.gitignore`; `.citeraignore` always
+    takes precedence over any git rule, including nested `.gitignore` files.
+    """
+    git_matchers = [
+        matcher
+        for matcher in (
+            load_ignore_file(project_path / ".git" / "info" / "exclude"),
+            load_ignore_file(project_path / ".gitignore"),
+        )
+        if matcher
+    ]
+    citera_matcher = load_ignore_file(project_path / CITERA_IGNORE_FILE)
+    return git_matchers, [citera_matcher] if citera_matcher else []
+
+
+def is_ignored(matchers: list[IgnoreMatcher], relative: str, name: str, is_dir: bool) -> bool:
+    ignored = False
+    for matcher in matchers:
+        decision = matcher.match(relative, name, is_dir)
+        if decision is not None:
+            ignored = decision
+    return ignored
+
+
+def walk_project(
+    project_path: Path,
+    skip_dirs: Iterable[str] = (),
+    use_gitignore: bool = True,
+    on_skip: Callable[[WalkEntry], None] | None = None,
+    prune: Callable[[WalkEntry], bool] | None = None,
+) -> Iterator[WalkEntry]:
+    """Yield files under `project_path`, pruning ignored directories before descending.
+
+    Honors `.git/info/exclude`, `.gitignore` files at any depth, and `.citeraignore`,
+    on top of `DEFAULT_SKIP_DIRS`, any extra `skip_dirs` names, and directories
+    `prune` returns True for. Directories pruned by name or by `prune` (not by
+    an ignore rule) are reported to `on_skip`.
+    """
+    skip = DEFAULT_SKIP_DIRS | set(skip_dirs)
+    git_matchers, citera_matchers = project_matchers(project_path) if use_gitignore else ([], [])
+    # Each stack item carries the git matchers in effect for that directory.
+    stack: list[tuple[str, str, int, list[IgnoreMatcher]]] = [
+        (str(project_path), "", 0, git_matchers)
+    ]
+    while stack:
+        current, relative_dir, depth, inherited = stack.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = sorted(iterator, key=lambda item: item.name)
+        except OSError:
+            continue
+        if use_gitignore and relative_dir:
+            nested = load_ignore_file(Path(current) / ".gitignore", relative_dir)
+            if nested:
+                inherited = inherited + [nested]
+        matchers = inherited + citera_matchers
+        subdirs: list[tuple[str, str, int, list[IgnoreMatcher]]] = []
+        for entry in entries:
+            relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if is_ignored(matchers, relative, entry.name, True):
+                    continue
+                item = WalkEntry(relative, entry, depth)
+                if entry.name in skip or (prune is not None and prune(item)):
+                    if on_skip is not None:
+                        on_skip(item)
+                    continue
+                subdirs.append((entry.path, relative, depth + 1, inherited))
+                continue
+            if is_ignored(matchers, relative, entry.name, False):
+                continue
+            yield WalkEntry(relative, entry, depth)
+        stack.extend(reversed(subdirs))
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regex matched against a relative path."""
+    parts: list[str] = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "*":
+            if pattern.startswith("**", index):
+                index += 2
+                if pattern.startswith("/", index):
+                    index += 1
+                    parts.append("(?:.*/)?")
+                else:
+                    parts.append(".*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                index = end
+        elif char == "\\" and index + 1 < length:
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def _unescape(pattern: str) -> str:
+    return re.sub(r"\\(.)", r"\1", pattern)
@@ -1,12 +1,349 @@
-"""Project lifecycle stubs for Citera."""
+"""Project records and a columnar inventory of the projects tree."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from .core.constants import stage_label, stage_role_from_label
+from .core.languages import parse_language_stats
+from .core.roots import PRIMARY_ROOT
 
 
-@dataclass(frozen=True)
 class Project:
-    name: str
-    stage: str
-    path: str
+    """One indexed project, typed and without a per-instance `__dict__`."""
+
+    __slots__ = (
+        "id",
+        "key",
+        "root",
+        "name",
+        "description",
+        "stage",
+        "stage_name",
+        "category",
+        "tags",
+        "tech",
+        "languages",
+        "git_enabled",
+        "git_repo",
+        "obsidian_enabled",
+        "created_at",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        key: str,
+        root: str = PRIMARY_ROOT,
+        name: str | None = None,
+        description: str | None = None,
+        stage: str | None = None,
+        stage_name: str = "",
+        category: str | None = None,
+        tags: tuple[str, ...] = (),
+        tech: tuple[str, ...] = (),
+        languages: tuple[tuple[str, int, int], ...] = (),
+        git_enabled: bool = False,
+        git_repo: str | None = None,
+        obsidian_enabled: bool = False,
+        created_at: float | None = None,
+    ) -> None:
+        self.id = id
+        self.key = key
+        self.root = root
+        self.name = name
+        self.description = description
+        self.stage = stage
+        self.stage_name = stage_name
+        self.category = category
+        self.tags = tags
+        self.tech = tech
+        self.languages = languages
+        self.git_enabled = git_enabled
+        self.git_repo = git_repo
+        self.obsidian_enabled = obsidian_enabled
+        self.created_at = created_at
+
+    @classmethod
+    def from_metadata(cls, key: str, metadata: dict, root: str = PRIMARY_ROOT) -> Project:
+        """Build a record from `parse_project_metadata` output (or an index entry's)."""
+        git = metadata.get("git") if isinstance(metadata.get("git"), dict) else {}
+        obsidian = metadata.get("obsidian") if isinstance(metadata.get("obsidian"), dict) else {}
+        stage_name = str(metadata.get("stage") or "")
+        stats = parse_language_stats(metadata.get("languages"))
+        return cls(
+            id=str(metadata.get("id") or key.rsplit("/", 1)[-1]),
+            key=key,
+            root=root,
+            name=_optional_str(metadata.get("name")),
+            description=_optional_str(metadata.get("description")),
+            stage=stage_role_from_label(stage_name),
+            stage_name=stage_name,
+            category=_optional_str(metadata.get("category")),
+            tags=_str_tuple(metadata.get("tags")),
+            tech=_str_tuple(metadata.get("tech")),
+            languages=tuple(
+                (language, item["bytes"], item["files"]) for language, item in stats.items()
+            ),
+            git_enabled=git.get("enabled") is True,
+            git_repo=_optional_str(git.get("repo")),
+            obsidian_enabled=obsidian.get("enabled") is True,
+            created_at=_timestamp(metadata.get("created_at")),
+        )
+
+    @property
+    def stage_display(self) -> str:
+        """Configured label for the stage role, or the raw value when unknown."""
+        return stage_label(self.stage) if self.stage else (self.stage_name or "?")
+
+    @property
+    def language_stats(self) -> dict[str, dict[str, int]]:
+        return {
+            language: {"bytes": size, "files": files} for language, size, files in self.languages
+        }
+
+    def __repr__(self) -> str:
+        return f"Project(id={self.id!r}, root={self.root!r}, key={self.key!r})"
+
+
+class _StringTable:
+    """Interns repeated strings (stages, categories, tags) as small integer codes."""
+
+    __slots__ = ("strings", "_codes")
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def find(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+
+class Inventory:
+    """Column-per-field store for many projects.
+
+    Low-cardinality text (root, stage, category, tags, tech, languages) is
+    stored once in a string table and referenced by integer codes held in
+    `array` columns; list-valued fields use a flat code array plus offsets.
+    Rows are materialized as `Project` records only on access; descriptions
+    stay in the index and tags are stored lowercased.
+    """
+
+    __slots__ = (
+        "ids",
+        "keys",
+        "names",
+        "_repos",
+        "_strings",
+        "_root",
+        "_stage",
+        "_stage_name",
+        "_category",
+        "_git",
+        "_created",
+        "_tag_codes",
+        "_tag_offsets",
+        "_tech_codes",
+        "_tech_offsets",
+        "_language_codes",
+        "_language_bytes",
+        "_language_files",
+        "_language_offsets",
+    )
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.keys: list[str] = []
+        self.names: list[str | None] = []
+        # Repos are unique per project, so they stay out of the string table.
+        self._repos: list[str | None] = []
+        self._strings = _StringTable()
+        # Code 0 is reserved for "missing" in every coded column.
+        self._strings.code("")
+        self._root = array("I")
+        self._stage = array("I")
+        self._stage_name = array("I")
+        self._category = array("I")
+        # Bit 0: git enabled, bit 1: obsidian enabled.
+        self._git = array("B")
+        self._created = array("d")
+        self._tag_codes = array("I")
+        self._tag_offsets = array("I", [0])
+        self._tech_codes = array("I")
+        self._tech_offsets = array("I", [0])
+        self._language_codes = array("I")
+        self._language_bytes = array("q")
+        self._language_files = array("I")
+        self._language_offsets = array("I", [0])
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[tuple[str, dict]]) -> Inventory:
+        """Load every project from (root name, index) pairs, in key order per root."""
+        inventory = cls()
+        for root, index in indexes:
+            for key, entry in sorted(index["projects"].items()):
+                inventory.append(Project.from_metadata(key, entry.get("metadata", {}), root))
+        return inventory
+
+    def append(self, project: Project) -> None:
+        code = self._strings.code
+        self.ids.append(project.id)
+        self.keys.append(project.key)
+        self.names.append(project.name)
+        self._repos.append(project.git_repo)
+        self._root.append(code(project.root))
+        self._stage.append(code(project.stage or ""))
+        self._stage_name.append(code(project.stage_name))
+        self._category.append(code(project.category or ""))
+        self._git.append(int(project.git_enabled) | int(project.obsidian_enabled) << 1)
+        self._created.append(math.nan if project.created_at is None else project.created_at)
+        self._tag_codes.extend(code(tag.lower()) for tag in project.tags)
+        self._tag_offsets.append(len(self._tag_codes))
+        self._tech_codes.extend(code(item) for item in project.tech)
+        self._tech_offsets.append(len(self._tech_codes))
+        for language, size, files in project.languages:
+            self._language_codes.append(code(language))
+            self._language_bytes.append(size)
+            self._language_files.append(files)
+        self._language_offsets.append(len(self._language_codes))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Project]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> Project:
+        strings = self._strings.strings
+        created = self._created[row]
+        flags = self._git[row]
+        return Project(
+            id=self.ids[row],
+            key=self.keys[row],
+            root=strings[self._root[row]],
+            name=self.names[row],
+            stage=strings[self._stage[row]] or None,
+            stage_name=strings[self._stage_name[row]],
+            category=strings[self._category[row]] or None,
+            tags=self.tags(row),
+            tech=tuple(
+                strings[code] for code in self._span(self._tech_codes, self._tech_offsets, row)
+            ),
+            languages=self.languages(row),
+            git_enabled=bool(flags & 1),
+            git_repo=self._repos[row],
+            obsidian_enabled=bool(flags & 2),
+            created_at=None if math.isnan(created) else created,
+        )
+
+    def root(self, row: int) -> str:
+        return self._strings.strings[self._root[row]]
+
+    def stage(self, row: int) -> str | None:
+        return self._strings.strings[self._stage[row]] or None
+
+    def stage_display(self, row: int) -> str:
+        role = self.stage(row)
+        return stage_label(role) if role else (self._strings.strings[self._stage_name[row]] or "?")
+
+    def category(self, row: int) -> str | None:
+        return self._strings.strings[self._category[row]] or None
+
+    def git_enabled(self, row: int) -> bool:
+        return bool(self._git[row] & 1)
+
+    def tags(self, row: int) -> tuple[str, ...]:
+        strings = self._strings.strings
+        return tuple(strings[code] for code in self._span(self._tag_codes, self._tag_offsets, row))
+
+    def languages(self, row: int) -> tuple[tuple[str, int, int], ...]:
+        start, end = self._language_offsets[row], self._language_offsets[row + 1]
+        strings = self._strings.strings
+        return tuple(
+            (strings[self._language_codes[i]], self._language_bytes[i], self._language_files[i])
+            for i in range(start, end)
+        )
+
+    def language_stats(self, row: int) -> dict[str, dict[str, int]]:
+        return {
+            language: {"bytes": size, "files": files}
+            for language, size, files in self.languages(row)
+        }
+
+    def select(
+        self,
+        stage: str | None = None,
+        tag: str | None = None,
+        category: str | None = None,
+        root: str | None = None,
+    ) -> list[int]:
+        """Row numbers matching every given filter; filters compare integer codes only."""
+        rows: Iterable[int] = range(len(self))
+        for column, value in ((self._stage, stage), (self._category, category), (self._root, root)):
+            if value is None:
+                continue
+            code = self._strings.find(value)
+            if code is None:
+                return []
+            rows = [row for row in rows if column[row] == code]
+        if tag is not None:
+            code = self._strings.find(tag.lower())
+            if code is None:
+                return []
+            offsets = self._tag_offsets
+            codes = self._tag_codes
+            rows = [row for row in rows if code in codes[offsets[row] : offsets[row + 1]]]
+        return list(rows)
+
+    def count_by(self, field: str, rows: Iterable[int] | None = None) -> dict[str, int]:
+        """Project counts per root, stage, category, or tag."""
+        rows = range(len(self)) if rows is None else rows
+        strings = self._strings.strings
+        counts: dict[int, int] = {}
+        if field == "tag":
+            for row in rows:
+                for code in self._span(self._tag_codes, self._tag_offsets, row):
+                    counts[code] = counts.get(code, 0) + 1
+        else:
+            column = {"root": self._root, "stage": self._stage, "category": self._category}[field]
+            for row in rows:
+                counts[column[row]] = counts.get(column[row], 0) + 1
+        return {strings[code]: count for code, count in counts.items()}
+
+    @staticmethod
+    def _span(codes: array, offsets: array, row: int) -> array:
+        return codes[offsets[row] : offsets[row + 1]]
+
+
+def _optional_str(value: object) -> str | None:
+    # An empty `key:` line parses as an empty section, not an empty string.
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _str_tuple(value: object) -> tuple[str, ...]:
+    if not isinstance(value, list):
+        return ()
+    return tuple(str(item) for item in value if str(item).strip())
+
+
+def _timestamp(value: object) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None